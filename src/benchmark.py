@@ -0,0 +1,288 @@
+"""
+Benchmark em lote, sem interface gráfica, de todos os algoritmos de busca.
+
+Gera N labirintos com semente fixa para cada tamanho e gerador, executa cada
+Algorithm com aquecimento e repetições e grava os tempos (mediana, p95 e mínimo,
+separando busca e histórico nos solvers que o medem), a quantidade de células
+visitadas, os contadores da fronteira, o pico de memória (opcional) e o tamanho do
+caminho em JSON e CSV.
+
+Com --save-corpus, os labirintos gerados são gravados em arquivos (utils.maze_file); com
+--load, o benchmark usa os labirintos de um diretório gravado assim em vez de gerá-los.
+
+Com --cache, os resultados de cada labirinto (identificado pelo conteúdo) e algoritmo
+ficam gravados no cache em disco e execuções repetidas sobre o mesmo conjunto de
+labirintos apenas os releem, enquanto o código do solver não mudar.
+
+Uso (a partir da pasta src):
+    python -m benchmark --sizes 10 50 100 --seeds 5 --repeat 5 --output resultados
+    python -m benchmark --sizes 1000 --seeds 5 --save-corpus corpus --repeat 1
+    python -m benchmark --load corpus --repeat 5 --output resultados
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import statistics
+import sys
+from enums.algorithms import Algorithm
+from enums.generators import Generator
+from maze.maze import Maze
+from maze.solvers.solver_registry import get_solver, get_solver_version
+from utils.config import DIRETORIO_CACHE, TAMANHO_MAXIMO_CACHE
+from utils.maze_file import load_maze, save_maze
+from utils.solution_cache import SolutionCache
+
+CSV_FIELDS = [
+    "generator", "size", "seed", "algorithm", "repeat",
+    "median_ms", "p95_ms", "min_ms", "search_median_ms", "history_median_ms",
+    "visited_count", "expanded", "pushes", "pops", "max_frontier", "peak_memory_kb",
+    "path_length",
+]
+
+# Versão do formato dos resumos gravados no cache (campos retornados por benchmark_maze);
+# faz parte da chave, junto com a versão do solver
+SUMMARY_VERSION = 2
+
+
+def percentile(values, percent):
+    """
+    Calcula o percentil pelo método do posto mais próximo.
+
+    Args:
+        values (list): Valores medidos.
+        percent (float): Percentil desejado (0 a 100).
+
+    Returns:
+        float: Valor do percentil.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def benchmark_maze(maze, algorithm, warmup, repeat, trace_memory=False, cache=None):
+    """
+    Executa um algoritmo várias vezes sobre o mesmo labirinto.
+
+    Args:
+        maze (Maze): Labirinto a ser resolvido.
+        algorithm (Algorithm): Algoritmo executado.
+        warmup (int): Execuções descartadas antes da medição.
+        repeat (int): Execuções medidas.
+        trace_memory (bool): Se True, faz uma execução extra com tracemalloc para medir
+            o pico de memória (fora das execuções cronometradas).
+        cache (SolutionCache, opcional): Cache em disco de onde o resultado é lido, se já
+            tiver sido medido com a mesma versão do solver e os mesmos parâmetros, e onde é
+            gravado caso contrário.
+
+    Returns:
+        dict: Tempos agregados, contadores da busca, células visitadas e tamanho do caminho.
+    """
+    if cache is not None:
+        key = (f"{algorithm.name}-{get_solver_version(algorithm)}-v{SUMMARY_VERSION}"
+               f"-w{warmup}-r{repeat}{'-mem' if trace_memory else ''}")
+        summary = cache.load_summary(maze, key)
+        if summary is None:
+            summary = benchmark_maze(maze, algorithm, warmup, repeat, trace_memory)
+            cache.store_summary(maze, key, summary)
+        return summary
+
+    solver = get_solver(algorithm)
+    for _ in range(warmup):
+        solver(maze)
+
+    times, search_times, history_times = [], [], []
+    for _ in range(repeat):
+        path, visited, _, metrics = solver(maze)
+        times.append(metrics.elapsed_ms)
+        search_times.append(metrics.search_ms)
+        history_times.append(metrics.history_ms)
+
+    peak_memory_kb = None
+    if trace_memory:
+        peak_memory_kb = solver(maze, trace_memory=True)[-1].peak_memory_kb
+
+    return {
+        "median_ms": statistics.median(times),
+        "p95_ms": percentile(times, 95),
+        "min_ms": min(times),
+        "search_median_ms": statistics.median(search_times),
+        "history_median_ms": (statistics.median(history_times)
+                              if None not in history_times else None),
+        "visited_count": len(visited),
+        "expanded": metrics.expanded,
+        "pushes": metrics.pushes,
+        "pops": metrics.pops,
+        "max_frontier": metrics.max_frontier,
+        "peak_memory_kb": peak_memory_kb,
+        "path_length": len(path) - 1,
+    }
+
+
+def generate_corpus(sizes, seeds, generators, save_dir=None):
+    """
+    Gera os labirintos do benchmark, um de cada vez.
+
+    Args:
+        sizes (list): Lados dos labirintos (quadrados) gerados.
+        seeds (list): Sementes usadas para gerar os labirintos.
+        generators (list): Geradores de labirinto (Generator).
+        save_dir (str, opcional): Diretório onde cada labirinto gerado é gravado
+            (<gerador>_<tamanho>_<semente>.maze), para ser relido com load_corpus.
+
+    Yields:
+        tuple: (nome do gerador, tamanho, semente, Maze).
+    """
+    if save_dir is not None:
+        os.makedirs(save_dir, exist_ok=True)
+    for generator in generators:
+        for size in sizes:
+            for seed in seeds:
+                maze = Maze(size, size, generator.get_function(), seed=seed)
+                if save_dir is not None:
+                    save_maze(maze, os.path.join(save_dir, f"{generator.name}_{size}_{seed}.maze"))
+                yield generator.name, size, seed, maze
+
+
+def load_corpus(directory):
+    """
+    Carrega os labirintos (.maze) gravados em um diretório, em ordem de nome de arquivo.
+
+    Args:
+        directory (str): Diretório com os arquivos gravados por utils.maze_file.save_maze.
+
+    Yields:
+        tuple: (nome do gerador, tamanho, semente, Maze), com gerador e semente lidos do
+        cabeçalho de cada arquivo ("-" e None quando desconhecidos).
+    """
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".maze"):
+            maze = load_maze(os.path.join(directory, name))
+            generator = Generator.from_function(maze.generator) if maze.generator is not None else None
+            yield generator.name if generator is not None else "-", maze.width, maze.seed, maze
+
+
+def run_benchmark(mazes, algorithms, warmup, repeat, trace_memory=False, cache=None):
+    """
+    Executa o benchmark completo sobre todos os labirintos e algoritmos pedidos.
+
+    Args:
+        mazes (iterable): Labirintos como tuplas (nome do gerador, tamanho, semente, Maze),
+            de generate_corpus ou load_corpus.
+        algorithms (list): Algoritmos executados (Algorithm).
+        warmup (int): Execuções de aquecimento por algoritmo e labirinto.
+        repeat (int): Execuções medidas por algoritmo e labirinto.
+        trace_memory (bool): Se True, mede também o pico de memória de cada algoritmo.
+        cache (SolutionCache, opcional): Cache em disco dos resultados por labirinto.
+
+    Returns:
+        list: Uma linha (dict) por gerador, tamanho, semente e algoritmo.
+    """
+    rows = []
+    for generator_name, size, seed, maze in mazes:
+        for algorithm in algorithms:
+            result = benchmark_maze(maze, algorithm, warmup, repeat, trace_memory, cache)
+            rows.append({
+                "generator": generator_name,
+                "size": size,
+                "seed": seed,
+                "algorithm": algorithm.name,
+                "repeat": repeat,
+                **result,
+            })
+            print(f"{generator_name} {size}x{size} seed={seed} {algorithm.name}: "
+                  f"{result['median_ms']:.2f} ms", file=sys.stderr)
+    return rows
+
+
+def write_results(rows, config, output):
+    """
+    Grava os resultados em <output>.json e <output>.csv.
+
+    Args:
+        rows (list): Linhas retornadas por run_benchmark.
+        config (dict): Parâmetros usados na execução.
+        output (str): Caminho base dos arquivos de saída (sem extensão).
+    """
+    with open(f"{output}.json", "w", encoding="utf-8") as file:
+        json.dump({"config": config, "results": rows}, file, indent=2)
+
+    with open(f"{output}.csv", "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_args(argv=None):
+    """
+    Lê os argumentos de linha de comando.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de busca em labirintos.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100],
+                        help="Lados dos labirintos gerados (padrão: 10 50 100).")
+    parser.add_argument("--seeds", type=int, default=5,
+                        help="Quantidade de labirintos (sementes 0..N-1) por tamanho e gerador.")
+    parser.add_argument("--generators", nargs="+", choices=[g.name for g in Generator],
+                        default=[Generator.PRIM_MULTIPATH.name], help="Geradores de labirinto usados.")
+    parser.add_argument("--algorithms", nargs="+", choices=[a.name for a in Algorithm],
+                        default=[a.name for a in Algorithm], help="Algoritmos executados.")
+    parser.add_argument("--warmup", type=int, default=1, help="Execuções de aquecimento.")
+    parser.add_argument("--repeat", type=int, default=5, help="Execuções medidas.")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Mede o pico de memória com tracemalloc (execução extra, não cronometrada).")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reaproveita (e grava) os resultados no cache em disco.")
+    parser.add_argument("--cache-dir", default=DIRETORIO_CACHE,
+                        help="Diretório do cache em disco (padrão: .cache do projeto).")
+    corpus = parser.add_mutually_exclusive_group()
+    corpus.add_argument("--save-corpus", metavar="DIR",
+                        help="Grava os labirintos gerados em DIR (um arquivo .maze por labirinto).")
+    corpus.add_argument("--load", metavar="DIR",
+                        help="Usa os labirintos .maze de DIR em vez de gerá-los "
+                             "(ignora --sizes, --seeds e --generators).")
+    parser.add_argument("--output", default="benchmark_results",
+                        help="Caminho base dos arquivos .json e .csv gerados.")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat deve ser ao menos 1.")
+    if args.warmup < 0:
+        parser.error("--warmup não pode ser negativo.")
+    return args
+
+
+def main(argv=None):
+    """
+    Ponto de entrada do benchmark em linha de comando.
+    """
+    args = parse_args(argv)
+    generators = [Generator[name] for name in args.generators]
+    algorithms = [Algorithm[name] for name in args.algorithms]
+    seeds = list(range(args.seeds))
+    cache = SolutionCache(args.cache_dir, TAMANHO_MAXIMO_CACHE) if args.cache else None
+
+    if args.load is not None:
+        mazes = load_corpus(args.load)
+    else:
+        mazes = generate_corpus(args.sizes, seeds, generators, args.save_corpus)
+
+    rows = run_benchmark(mazes, algorithms, args.warmup, args.repeat, args.trace_memory, cache)
+
+    config = {
+        "corpus": args.load,
+        "sizes": args.sizes if args.load is None else None,
+        "seeds": seeds if args.load is None else None,
+        "generators": args.generators if args.load is None else None,
+        "algorithms": args.algorithms,
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "trace_memory": args.trace_memory,
+    }
+    write_results(rows, config, args.output)
+    print(f"Resultados gravados em {args.output}.json e {args.output}.csv", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,22 @@ class Algorithm(Enum):
     """
     Enumeração que representa os algoritmos disponíveis para execução.
     Cada algoritmo é associado a um valor inteiro único, que pode ser usado para identificá-lo.
-    Adicionar novos algoritmos aqui automaticamente os disponibiliza para uso no sistema.
+    Adicionar novos algoritmos aqui automaticamente os disponibiliza para uso no sistema,
+    desde que o solver correspondente esteja registrado em maze/solvers/solver_registry.py.
     """
 
     BFS = 0
     #DFS = 1
-    #DIJKSTRA = 2
-    #GREEDY_BFS = 3
-    #JOHNSON = 3
+    DIJKSTRA = 2
+    GREEDY_BFS = 3
+    #JOHNSON = 11
     #FLOYD_WARSHALL = 4
     ASTAR_MANHATTAN = 5  
     #ASTAR_EUCLIDIANA = 6
     #ACO = 7
     BIDIRECTIONAL_SEARCH = 8
     BIDIRECTIONAL_ASTAR = 9
+    WAVEFRONT_BFS = 10
     
 
     def __str__(self):
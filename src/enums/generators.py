@@ -0,0 +1,51 @@
+from enum import Enum
+from importlib import import_module
+
+class Generator(Enum):
+    """
+    Enumeração que representa os geradores de labirinto disponíveis.
+    Cada gerador é associado a um módulo em maze/generators, importado apenas quando usado.
+    """
+
+    PRIM_MULTIPATH = 0
+    DFS = 1
+    BFS = 2
+    ELLER = 3
+    KRUSKAL = 4
+    WILSON = 5
+
+    def __str__(self):
+        """
+        Retorna uma representação legível do gerador.
+        """
+        return f"{self.name} ({self.value})"
+
+    def get_function(self):
+        """
+        Retorna a função geradora (generate_maze) associada ao gerador.
+        """
+        modules = {
+            Generator.PRIM_MULTIPATH: "maze.generators.prim_multipath_generator",
+            Generator.DFS: "maze.generators.dfs_generator",
+            Generator.BFS: "maze.generators.bfs_generator",
+            Generator.ELLER: "maze.generators.eller_generator",
+            Generator.KRUSKAL: "maze.generators.kruskal_generator",
+            Generator.WILSON: "maze.generators.wilson_generator",
+        }
+        return import_module(modules[self]).generate_maze
+
+    @classmethod
+    def from_function(cls, function):
+        """
+        Retorna o gerador associado a uma função geradora.
+
+        Args:
+            function (function): Função geradora (generate_maze de um dos módulos).
+
+        Returns:
+            Generator | None: Gerador correspondente, ou None se a função não for de nenhum.
+        """
+        for generator in cls:
+            if generator.get_function() is function:
+                return generator
+        return None
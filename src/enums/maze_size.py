@@ -1,4 +1,8 @@
 from enum import Enum
+from utils.config import TAMANHOS_PERSONALIZADOS
+
+# Dimensões atuais do labirinto personalizado (ver MazeSize.set_custom_dimensions)
+_custom_dimensions = TAMANHOS_PERSONALIZADOS[0]
 
 class MazeSize(Enum):
     """
@@ -9,7 +13,8 @@ class MazeSize(Enum):
     SMALL = 0  # Labirinto pequeno: 10x10
     MEDIUM = 1  # Labirinto médio: 50x50
     LARGE = 2  # Labirinto grande: 100x100
-    REPORT = 3  # Modo de relatório (não possui dimensões específicas)
+    CUSTOM = 3  # Labirinto personalizado: uma das opções de TAMANHOS_PERSONALIZADOS (config)
+    REPORT = 4  # Modo de relatório (não possui dimensões específicas)
 
     def get_dimensions(self):
         """
@@ -20,10 +25,22 @@ class MazeSize(Enum):
             MazeSize.SMALL: (10, 10),
             MazeSize.MEDIUM: (50, 50),
             MazeSize.LARGE: (100, 100),
+            MazeSize.CUSTOM: _custom_dimensions,
             MazeSize.REPORT: None
         }
         return dimensions[self]
 
+    @classmethod
+    def set_custom_dimensions(cls, dimensions):
+        """
+        Define as dimensões do labirinto personalizado (CUSTOM).
+
+        Args:
+            dimensions (tuple): Largura e altura, em células.
+        """
+        global _custom_dimensions
+        _custom_dimensions = tuple(dimensions)
+
     @classmethod
     def size(cls):
         """
@@ -48,5 +65,7 @@ class MazeSize(Enum):
             name = self.name.replace("MEDIUM", "50x50")
         if(self.name == "LARGE"):
             name = self.name.replace("LARGE", "100x100")
+        if(self.name == "CUSTOM"):
+            name = "{}x{}".format(*self.get_dimensions())
         
         return name
\ No newline at end of file
@@ -1,18 +1,18 @@
 import os
+import time
 import pygame
 from utils.config import *
 from enums.colour import *
 from enums.maze_size import MazeSize
 from enums.algorithms import Algorithm
 from utils.maze_utils import generate_mazes
+from utils.maze_prefetcher import MazePrefetcher
+from utils.report import ReportRunner
+from utils.solution_cache import SolutionCache
 from ui.ui import UI
-from maze.solvers.bfs_solver import solveBfs
-from maze.solvers.AStartManhattan_solver import solveAstarManhattan
-from maze.solvers.greedy_bfs_solver import solveGreedyBFS
-from maze.solvers.bidirectional_search_solver import solveBidirectionalSearch
-from maze.solvers.bidirectional_astar_solver import solveBidirectionalAstar
-from maze.solvers.dijkstra_solver import solveDijkstra
+from maze.solvers.solver_registry import SolverRegistry
 from ui.slider import Slider
+from ui.playback import Playback
 
 class Main:
 
@@ -48,10 +48,32 @@ class Main:
         self.step_slider = None
         self.start_x = LARGURA_TELA - 400
         self.ui.show_slider = False  # Estado inicial do slider (desabilitado)
+        self.playback = Playback(VELOCIDADES_REPRODUCAO, VELOCIDADE_INICIAL)  # Reprodução animada do slider
+        self.report = None  # Execução do relatório (iniciada ao abrir a aba REPORT)
+        # Solvers carregados sob demanda; resultados memoizados em memória e em disco
+        self.solver_registry = SolverRegistry(SolutionCache(DIRETORIO_CACHE, TAMANHO_MAXIMO_CACHE))
+        # Execução em segundo plano (uma por vez), a aba a que pertence e a última
+        # atualização do progresso exibido
+        self.solve_job = None
+        self.solve_tab = None
+        self.last_progress = 0.0
+
+        # Redesenho por regiões: só o que mudou é redesenhado e enviado à tela, e o loop
+        # espera por eventos quando nada mudou
+        self.maze_area = pygame.Rect(0, 45, self.start_x + 2, ALTURA_TELA - 45)
+        self.sidebar_area = pygame.Rect(self.start_x, 45, LARGURA_TELA - self.start_x, ALTURA_TELA - 45)
+        self.tabs_area = pygame.Rect(0, 0, LARGURA_TELA, 45)
+        self.steps_area = pygame.Rect(self.start_x, ALTURA_TELA - 110, LARGURA_TELA - self.start_x, 110)
+        self.dirty_rects = [self.screen.get_rect()]
+        self.hovered_button = None
+        self.maze_pending = False  # Labirinto da aba atual ainda sendo gerado
 
         self.running = True
 
-        self.mazes, self.solutions, self.visited_cells, self.statistics, self.visited_history, self.sliders = generate_mazes()
+        # Labirintos gerados no primeiro acesso de cada aba; os próximos de cada tamanho já
+        # visto ficam prontos em segundo plano para o botão de gerar
+        self.maze_prefetcher = MazePrefetcher()
+        self.mazes, self.solutions, self.visited_cells, self.statistics, self.visited_history, self.sliders = generate_mazes(self.maze_prefetcher)
 
     def _load_sprites(self):
         """
@@ -65,26 +87,80 @@ class Main:
             'sprite_normal_tab': pygame.image.load(self.sprites_path['normal_tab']).convert_alpha()
         }
 
-    def handle_events(self):
+    def handle_events(self, block=False):
         """
         Processa os eventos do jogo, como cliques do mouse e fechamento da janela.
+
+        Args:
+            block (bool): Se True e não houver eventos na fila, espera pelo próximo evento
+                em vez de retornar (usado quando não há nada a redesenhar).
         """
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if block and not events:
+            events = [pygame.event.wait()]
+
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False  # Fecha o jogo
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._handle_mouse_button_down(event)
+                # A roda do mouse só altera o zoom; os demais botões podem mudar qualquer parte
+                self._mark_dirty(self.maze_area if event.button in (4, 5) else None)
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:  # Soltar o botão esquerdo
                     self.dragging = False
             elif event.type == pygame.MOUSEMOTION:
                 self._handle_mouse_motion(event)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                self._toggle_playback()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED):
+                self._mark_dirty()
             if (hasattr(self, 'sliders') and 
                 self.current_tab in self.sliders and 
                 self.current_algorithm in self.sliders[self.current_tab]):
                 
                 slider = self.sliders[self.current_tab][self.current_algorithm]
+                value = slider.value
                 slider.handle_event(event)
+                if slider.dragging and self.playback.slider is slider:
+                    self.playback.pause()  # Arrastar o slider assume o controle do passo
+                    self._mark_dirty(self.steps_area)
+                if slider.value != value:
+                    self._mark_dirty()
+
+    def _mark_dirty(self, rect=None):
+        """
+        Marca uma região da tela para ser redesenhada no próximo quadro.
+
+        Args:
+            rect (pygame.Rect, opcional): Região alterada (padrão: a tela inteira).
+        """
+        self.dirty_rects.append(rect if rect is not None else self.screen.get_rect())
+
+    def _is_idle(self):
+        """
+        Indica se o loop pode esperar por eventos: nada a redesenhar, nenhum arrasto ou
+        reprodução em andamento, nenhum solver ou relatório executando e nenhum labirinto
+        da aba atual sendo gerado.
+        """
+        return (not self.dirty_rects and not self.dragging and not self.playback.playing and
+                self.solve_job is None and (self.report is None or self.report.done) and
+                not self.maze_pending)
+
+    def _current_slider(self):
+        """
+        Retorna o slider de passos do algoritmo exibido, ou None se não houver.
+        """
+        return self.sliders.get(self.current_tab, {}).get(self.current_algorithm)
+
+    def _toggle_playback(self):
+        """
+        Reproduz ou pausa a exploração do algoritmo exibido (com o slider visível).
+        """
+        slider = self._current_slider()
+        if slider is not None and self.ui.show_slider:
+            self.playback.toggle(slider)
+            self._mark_dirty()
 
     def _handle_mouse_button_down(self, event):
         """Processa cliques do mouse."""
@@ -92,6 +168,29 @@ class Main:
             # Verifica se o clique foi no botão toggle
             if hasattr(self.ui, 'toggle_button_rect') and self.ui.toggle_button_rect.collidepoint(event.pos):
                 self.ui.show_slider = not self.ui.show_slider
+                self.playback.pause()
+                return
+
+            # Botão de cancelar a execução em segundo plano
+            if (self.solve_job is not None and self.solve_tab == self.current_tab and
+                    hasattr(self.ui, 'cancel_button_rect') and
+                    self.ui.cancel_button_rect.collidepoint(event.pos)):
+                self._cancel_solve()
+                return
+
+            # Botões da reprodução animada (visíveis junto com o slider)
+            if self.ui.show_slider and self._current_slider() is not None:
+                if hasattr(self.ui, 'play_button_rect') and self.ui.play_button_rect.collidepoint(event.pos):
+                    self._toggle_playback()
+                    return
+                if hasattr(self.ui, 'speed_button_rect') and self.ui.speed_button_rect.collidepoint(event.pos):
+                    self.playback.next_speed()
+                    return
+
+            # Botão de tamanho do labirinto personalizado
+            if (self.current_tab == MazeSize.CUSTOM and hasattr(self.ui, 'custom_size_button_rect') and
+                    self.ui.custom_size_button_rect.collidepoint(event.pos)):
+                self._next_custom_size()
                 return
 
             # Verifica se o clique foi em uma aba
@@ -100,119 +199,212 @@ class Main:
                     if(self.current_tab != size):
                         self.current_tab = size
                         self.current_algorithm = None
+                        self.playback.pause()
+                        self.zoom_level = min(self.zoom_level, self._max_zoom())
+                    if size == MazeSize.REPORT and self.report is None:
+                        self._start_report()
                     break
             # Verifica se o clique foi em um algoritmo
             for algorithm, rect in self.ui.algorithm_buttons.items():
-                if rect.collidepoint(event.pos):
-                    path = []
-                    visited = []
-                    history = []
-                    time_taken = 0
-                    if algorithm == Algorithm.BFS:
-                        self.current_algorithm = Algorithm.BFS
-                        if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                            path, visited, history, time_taken = solveBfs(self.mazes[self.current_tab])
-                        else:
-                            path = self.solutions[self.current_tab][self.current_algorithm]
-                            visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                            history = self.visited_history[self.current_tab][self.current_algorithm]
-                            time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    # if algorithm == Algorithm.DFS:
-                    #     # Implementar DFS
-                    #     path = []
-                    #     visited = []
-                    #     time_taken = []
-                    #     print("DFS")
-                    # if algorithm == Algorithm.DIJKSTRA:
-                    #     self.current_algorithm = Algorithm.DIJKSTRA
-                    #     if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                    #         path, visited, history, time_taken = solveDijkstra(self.mazes[self.current_tab])
-                    #     else:
-                    #         path = self.solutions[self.current_tab][self.current_algorithm]
-                    #         visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                    #         history = self.visited_history[self.current_tab][self.current_algorithm]
-                    #         time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    # if algorithm == Algorithm.JOHNSON:
-                    #     self.current_algorithm = Algorithm.JOHNSON
-                    #     path, visited, history, time_taken = solveJohnson(self.mazes[self.current_tab])
-                    # if algorithm == Algorithm.FLOYD_WARSHALL:
-                    #     self.current_algorithm = Algorithm.FLOYD_WARSHALL
-                    #     path, visited, history, time_taken = solveFloydWarshall(self.mazes[self.current_tab])
-                    if algorithm == Algorithm.ASTAR_MANHATTAN:
-                        self.current_algorithm = Algorithm.ASTAR_MANHATTAN
-                        if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                            path, visited, history, time_taken = solveAstarManhattan(self.mazes[self.current_tab])
-                        else:
-                            path = self.solutions[self.current_tab][self.current_algorithm]
-                            visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                            history = self.visited_history[self.current_tab][self.current_algorithm]
-                            time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    # if algorithm == Algorithm.GREEDY_BFS:
-                    #     self.current_algorithm = Algorithm.GREEDY_BFS
-                    #     if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                    #         path, visited, history, time_taken = solveGreedyBFS(self.mazes[self.current_tab])
-                    #     else:
-                    #         path = self.solutions[self.current_tab][self.current_algorithm]
-                    #         visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                    #         history = self.visited_history[self.current_tab][self.current_algorithm]
-                    #         time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    if algorithm == Algorithm.BIDIRECTIONAL_SEARCH:
-                        self.current_algorithm = Algorithm.BIDIRECTIONAL_SEARCH
-                        if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                            path, visited, history, time_taken = solveBidirectionalSearch(self.mazes[self.current_tab])
-                        else:
-                            path = self.solutions[self.current_tab][self.current_algorithm]
-                            visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                            history = self.visited_history[self.current_tab][self.current_algorithm]
-                            time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    
-                    if algorithm == Algorithm.BIDIRECTIONAL_ASTAR:
-                        self.current_algorithm = Algorithm.BIDIRECTIONAL_ASTAR
-                        if(self.solutions.get(self.current_tab) == {} or self.solutions[self.current_tab].get(self.current_algorithm) is None):
-                            path, visited, history, time_taken = solveBidirectionalAstar(self.mazes[self.current_tab])
-                        else:
-                            path = self.solutions[self.current_tab][self.current_algorithm]
-                            visited = self.visited_cells[self.current_tab][self.current_algorithm]
-                            history = self.visited_history[self.current_tab][self.current_algorithm]
-                            time_taken = self.statistics[self.current_tab][self.current_algorithm]["time_taken"]
-                    
-                    self.solutions[self.current_tab][self.current_algorithm] = path
-                    self.visited_cells[self.current_tab][self.current_algorithm] = visited
-                    self.statistics[self.current_tab][self.current_algorithm] = {
-                        "visited_count": len(visited),
-                        "time_taken": time_taken,
-                        "path_length": len(path) - 1
-                    }
-                    self.visited_history[self.current_tab][self.current_algorithm] = history
-                    if history and self.show_visited:
-                        if not hasattr(self, 'sliders'):
-                            self.sliders = {
-                                MazeSize.SMALL: {},
-                                MazeSize.MEDIUM: {},
-                                MazeSize.LARGE: {}
-                            }
-                        self.sliders[self.current_tab][self.current_algorithm] = Slider(
-                            self.start_x + 25, ALTURA_TELA - 30, 400 - 40, 10, 
-                            0, len(history) - 1, 0
-                        )
-                    print("Quantidade visitada: " + str(len(visited)))
-                    print("Tempo levado: " + str(time_taken) + " ms" )
-                    print("Tamanho do caminho: " + str(len(path)))
-
-                    self.statistics[self.current_tab][self.current_algorithm]
+                if rect.collidepoint(event.pos) and self.current_tab != MazeSize.REPORT:
+                    self.playback.pause()
+                    self._start_solve(algorithm)
 
                 if hasattr(self.ui, 'generate_button_rect') and self.ui.generate_button_rect.collidepoint(event.pos):
-                    self.mazes, self.solutions, self.visited_cells, self.statistics, self.visited_history, self.sliders = generate_mazes()
+                    self._cancel_solve()
+                    self.mazes, self.solutions, self.visited_cells, self.statistics, self.visited_history, self.sliders = generate_mazes(self.maze_prefetcher)
                     self.current_algorithm = None  # limpa seleção anterior
+                    self.playback.pause()
 
             if event.pos[0] < 800:
                 self.dragging = True
                 self.drag_start_x, self.drag_start_y = event.pos
 
         elif event.button == 4:  # Roda do mouse para cima (zoom in)
-            self.zoom_level = min(5.0, self.zoom_level + 0.1)
+            # Passos de 0.1 até 5x; acima disso (labirintos grandes), passos de 20%
+            step = 0.1 if self.zoom_level < 5.0 else self.zoom_level * 0.2
+            self.zoom_level = min(self._max_zoom(), self.zoom_level + step)
         elif event.button == 5:  # Roda do mouse para baixo (zoom out)
-            self.zoom_level = max(0.1, self.zoom_level - 0.1)
+            step = 0.1 if self.zoom_level <= 5.0 else self.zoom_level - self.zoom_level / 1.2
+            self.zoom_level = max(0.1, self.zoom_level - step)
+
+    def _start_solve(self, algorithm):
+        """
+        Resolve o labirinto da aba atual com o algoritmo. Um resultado já memoizado é
+        exibido na hora; os demais são calculados em segundo plano (ver _poll_solve_job),
+        cancelando a execução anterior, se houver.
+
+        Args:
+            algorithm (Algorithm): Algoritmo selecionado.
+        """
+        maze = self._current_maze()
+        if maze is None:
+            return  # Labirinto ainda sendo gerado
+        job = self.solve_job
+        if job is not None and job.algorithm == algorithm and job.maze is maze:
+            self.current_algorithm = algorithm  # Já está executando
+            return
+        self._cancel_solve()
+        self.current_algorithm = algorithm
+
+        result = self.solver_registry.cached(algorithm, maze)
+        if result is not None:
+            self._apply_result(self.current_tab, algorithm, result)
+            return
+
+        self.solve_job = self.solver_registry.submit(algorithm, maze)
+        self.solve_tab = self.current_tab
+        self.last_progress = 0.0
+
+    def _cancel_solve(self):
+        """
+        Cancela a execução em segundo plano, se houver, descartando o histórico parcial.
+        """
+        job = self.solve_job
+        if job is None:
+            return
+        job.cancel()
+        self.solve_job = None
+
+        self.visited_history[self.solve_tab].pop(job.algorithm, None)
+        slider = self.sliders[self.solve_tab].pop(job.algorithm, None)
+        if slider is not None and self.playback.slider is slider:
+            self.playback.pause()
+        if self.current_tab == self.solve_tab and self.current_algorithm == job.algorithm:
+            self.current_algorithm = None
+        self._mark_dirty()
+
+    def _poll_solve_job(self):
+        """
+        Acompanha a execução em segundo plano: ao terminar, guarda o resultado; enquanto
+        executa, publica o histórico parcial (com o slider seguindo o último passo) e o
+        progresso, no máximo a cada INTERVALO_PROGRESSO segundos.
+        """
+        job = self.solve_job
+        if job is None:
+            return
+
+        tab, algorithm = self.solve_tab, job.algorithm
+        if job.done:
+            self.solve_job = None
+            result = job.result()
+            if result is not None:
+                self._apply_result(tab, algorithm, result)
+            self._mark_dirty()
+            return
+
+        now = time.perf_counter()
+        if now - self.last_progress < INTERVALO_PROGRESSO:
+            return
+        self.last_progress = now
+
+        history = job.history
+        if history is not None and self.show_visited:
+            self.visited_history[tab][algorithm] = history
+            self._sync_slider(tab, algorithm, history, len(history) - 1)
+        if self.current_tab == tab:
+            self._mark_dirty(self.maze_area)
+            self._mark_dirty(self.sidebar_area)
+
+    def _apply_result(self, tab, algorithm, result):
+        """
+        Guarda o resultado de um algoritmo nas estruturas exibidas pela interface.
+
+        Args:
+            tab (MazeSize): Aba do labirinto resolvido.
+            algorithm (Algorithm): Algoritmo executado.
+            result (tuple): (path, visited, history, metrics).
+        """
+        path, visited, history, metrics = result
+
+        self.solutions[tab][algorithm] = path
+        self.visited_cells[tab][algorithm] = visited
+        self.statistics[tab][algorithm] = {
+            "visited_count": len(visited),
+            "time_taken": metrics.elapsed_ms,
+            "path_length": len(path) - 1,
+            **metrics.as_dict()
+        }
+        self.visited_history[tab][algorithm] = history
+        if history and self.show_visited:
+            self._sync_slider(tab, algorithm, history, 0)
+        print("Quantidade visitada: " + str(len(visited)))
+        print("Tempo levado: " + str(metrics.elapsed_ms) + " ms" )
+        print("Tamanho do caminho: " + str(len(path)))
+
+    def _sync_slider(self, tab, algorithm, history, initial):
+        """
+        Cria o slider de passos do histórico ou, se já existir (histórico parcial de uma
+        execução em andamento), ajusta seu limite; um slider no último passo continua nele.
+
+        Args:
+            tab (MazeSize): Aba do labirinto.
+            algorithm (Algorithm): Algoritmo executado.
+            history (VisitHistory): Histórico de visitas.
+            initial (int): Passo inicial de um slider novo.
+        """
+        last = len(history) - 1
+        slider = self.sliders[tab].get(algorithm)
+        if slider is None:
+            self.sliders[tab][algorithm] = Slider(
+                self.start_x + 25, ALTURA_TELA - 30, 400 - 40, 10,
+                0, last, initial
+            )
+        elif slider.max_val != last:
+            if slider.value == slider.max_val:
+                slider.value = last
+            slider.max_val = last
+            slider.update_knob_position()
+
+    def _current_maze(self):
+        """
+        Retorna o labirinto da aba atual, ou None enquanto ele é gerado em segundo plano.
+        """
+        return self.mazes.get(self.current_tab, ESPERA_LABIRINTO)
+
+    def _max_zoom(self):
+        """
+        Retorna o zoom máximo da aba atual (maior para labirintos que não cabem na tela).
+        """
+        maze = self._current_maze()
+        if self.current_tab == MazeSize.REPORT or maze is None:
+            return 5.0
+        return self.ui.max_zoom(maze)
+
+    def _next_custom_size(self):
+        """
+        Passa para as próximas dimensões de TAMANHOS_PERSONALIZADOS na aba CUSTOM,
+        descartando o labirinto atual dela e os resultados obtidos nele; o novo labirinto
+        é gerado em segundo plano.
+        """
+        if self.solve_job is not None and self.solve_tab == MazeSize.CUSTOM:
+            self._cancel_solve()
+
+        options = TAMANHOS_PERSONALIZADOS
+        current = MazeSize.CUSTOM.get_dimensions()
+        index = options.index(current) if current in options else -1
+        MazeSize.set_custom_dimensions(options[(index + 1) % len(options)])
+
+        self.mazes.discard(MazeSize.CUSTOM)
+        for results in (self.solutions, self.visited_cells, self.statistics,
+                        self.visited_history, self.sliders):
+            results[MazeSize.CUSTOM].clear()
+        self.current_algorithm = None
+        self.playback.pause()
+        self.offset_x, self.offset_y = 0, 0
+        self._mark_dirty()
+
+    def _start_report(self):
+        """
+        Inicia a execução do relatório: todos os algoritmos em todos os tamanhos,
+        com SEMENTES_RELATORIO labirintos por tamanho, em processos paralelos.
+        """
+        # O labirinto personalizado pode ser grande demais para várias execuções por algoritmo
+        sizes = [size for size in MazeSize
+                 if size.get_dimensions() is not None and size != MazeSize.CUSTOM]
+        self.report = ReportRunner(
+            sizes, list(Algorithm), list(range(SEMENTES_RELATORIO)), PROCESSOS_RELATORIO
+        )
 
     def _handle_mouse_motion(self, event):
         """
@@ -222,46 +414,108 @@ class Main:
             self.offset_x += event.pos[0] - self.drag_start_x
             self.offset_y += event.pos[1] - self.drag_start_y
             self.drag_start_x, self.drag_start_y = event.pos
+            self._mark_dirty(self.maze_area)
+
+        # Botões com destaque de hover: redesenha apenas os que entraram ou saíram do hover
+        buttons = list(self.ui.algorithm_buttons.values())
+        if hasattr(self.ui, 'generate_button_rect'):
+            buttons.append(self.ui.generate_button_rect)
+        hovered = next((button for button in buttons if button.collidepoint(event.pos)), None)
+        if hovered != self.hovered_button:
+            for button in (self.hovered_button, hovered):
+                if button is not None:
+                    self._mark_dirty(button)
+            self.hovered_button = hovered
 
     def update(self):
         """
-        Atualiza a tela do jogo.
+        Atualiza a tela do jogo, redesenhando apenas as regiões marcadas como alteradas.
         """
+        # Reprodução animada: o passo segue o relógio, pulando passos se o quadro atrasar
+        if self.playback.advance():
+            self._mark_dirty(self.maze_area)
+            self._mark_dirty(self.steps_area)
+
+        # Recolhe o resultado (ou o progresso) do solver e do relatório sem bloquear o loop
+        self._poll_solve_job()
+        if self.report is not None and self.report.poll() and self.current_tab == MazeSize.REPORT:
+            self._mark_dirty()
+
+        # Labirinto da aba atual gerado em segundo plano: redesenha quando ficar pronto
+        if self.maze_pending and self._current_maze() is not None:
+            self._mark_dirty()
+
+        if not self.dirty_rects:
+            return
+
+        # Os desenhos ficam restritos às regiões alteradas
+        dirty = self.dirty_rects[0].unionall(self.dirty_rects[1:])
+        self.screen.set_clip(dirty)
+        show_solution = self.ui.show_solution
+
         self.screen.fill(WHITE)  # Limpa a tela com fundo branco
 
-        # Desenha o labirinto e as abas
+        # Desenha o labirinto (ou o aviso de que está sendo gerado) e as abas
+        maze = self._current_maze()
+        self.maze_pending = maze is None
         self.ui.draw_maze(
-            self.mazes[self.current_tab], self.current_tab, self.current_algorithm,
+            maze, self.current_tab, self.current_algorithm,
             self.zoom_level, self.offset_x, self.offset_y, self.show_visited, 
             self.solutions, self.visited_cells, self.statistics,
-            self.visited_history, self.sliders
+            self.visited_history, self.sliders, self.report
         )
-        self.ui.draw_tabs(self.current_tab, self.sprites)
-        self.ui.draw_algorithm_buttons(self.current_algorithm, self.sprites)
-        button_width = 50  # Tamanho do botão circular
-        x = self.start_x + (650 - button_width) // 2
-        self.ui.draw_generate_button(self.screen, x, 50)  # Y = 50, por exemplo
+        if dirty.colliderect(self.tabs_area):
+            self.ui.draw_tabs(self.current_tab, self.sprites)
+        if dirty.colliderect(self.sidebar_area):
+            self.ui.draw_algorithm_buttons(self.current_algorithm, self.sprites)
+            button_width = 50  # Tamanho do botão circular
+            x = self.start_x + (650 - button_width) // 2
+            self.ui.draw_generate_button(self.screen, x, 50)  # Y = 50, por exemplo
+            if self.current_tab == MazeSize.CUSTOM:
+                self.ui.draw_custom_size_button(self.screen, MazeSize.CUSTOM.get_dimensions())
+
+            # Desenha o check no botão toggle
+            if hasattr(self.ui, 'toggle_button_rect'):
+                self.ui.draw_toggle_check(self.screen, self.ui.toggle_button_rect, self.ui.show_slider)
+
+            # Controles da reprodução, junto com o slider de passos
+            if self.ui.show_slider and self._current_slider() is not None and self.current_tab != MazeSize.REPORT:
+                self.ui.draw_playback_controls(self.screen, self.playback)
+
+            # Desenhar estatísticas (abaixo dos controles) ou o progresso da execução
+            stats = self.statistics.get(self.current_tab, {}).get(self.current_algorithm)
+            stats_y = 100 + Algorithm.size() * 40 + 20  # Logo abaixo dos botões de algoritmo
+            if self.solve_job is not None and self.solve_tab == self.current_tab:
+                self.ui.draw_solve_progress(self.screen, self.solve_job, self.start_x + 20, stats_y)
+            elif stats:
+               self.ui.draw_statistics(self.screen, stats, self.start_x + 20, stats_y)
 
-        # Desenha o check no botão toggle
-        if hasattr(self.ui, 'toggle_button_rect'):
-            self.ui.draw_toggle_check(self.screen, self.ui.toggle_button_rect, self.ui.show_slider)
+        self.screen.set_clip(None)
+        pygame.display.update(self.dirty_rects)
+        self.dirty_rects = []
 
-        # Desenhar estatísticas (abaixo dos controles)
-        stats = self.statistics[self.current_tab].get(self.current_algorithm)
-        if stats:
-           self.ui.draw_statistics(self.screen, stats, self.start_x + 20, 450)
+        # O modo de exibição da solução é decidido ao desenhar o painel lateral, depois do
+        # labirinto; se mudou, o labirinto precisa de mais um quadro
+        if self.ui.show_solution != show_solution:
+            self._mark_dirty(self.maze_area)
 
-        pygame.display.flip()
+        # Tiles ainda em geração (em outra thread) são desenhados quando ficarem prontos
+        if self.ui.needs_redraw:
+            self._mark_dirty(self.maze_area)
 
     def run(self):
         """
         Executa o loop principal do jogo.
         """
         while self.running:
-            self.handle_events()
+            self.handle_events(block=self._is_idle())
             self.update()
             self.clock.tick(60)
 
+        if self.report is not None:
+            self.report.shutdown()
+        self._cancel_solve()
+        self.maze_prefetcher.shutdown()
         pygame.quit()
 
 
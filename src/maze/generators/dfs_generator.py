@@ -1,6 +1,4 @@
-import random
-
-def generate_maze(width, height):
+def generate_maze(width, height, rng=None):
     """
     Gera um labirinto usando o algoritmo DFS (Busca em Profundidade).
     O algoritmo cria um labirinto perfeito (sem áreas inacessíveis e com um único caminho entre quaisquer dois pontos).
@@ -8,37 +6,48 @@ def generate_maze(width, height):
     Args:
         width (int): Largura do labirinto (número de colunas).
         height (int): Altura do labirinto (número de linhas).
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
 
     Returns:
-        list: Uma matriz (lista de listas) representando o labirinto, onde:
+        tuple: (grid, start, end), onde grid é um bytearray plano (índice y * width + x)
+              representando o labirinto, no qual:
               - 0 representa um caminho.
               - 1 representa uma parede.
               - 2 representa o ponto inicial.
               - 3 representa o ponto final.
     """
-    from utils.maze_utils import set_start_end
+    from utils.maze_utils import resolve_rng, set_start_end
+
+    rng = resolve_rng(rng)
 
-    grid = [[1 for _ in range(width)] for _ in range(height)]
+    grid = bytearray(b'\x01') * (width * height)
 
-    start_x = random.randint(0, width - 1)
-    start_y = random.randint(0, height - 1)
-    grid[start_y][start_x] = 0
+    start_x = rng.randint(0, width - 1)
+    start_y = rng.randint(0, height - 1)
+    grid[start_y * width + start_x] = 0
 
     frontier = [(start_x, start_y)]
 
+    rand = rng.random
     while frontier:
-        current_x, current_y = frontier.pop(random.randint(0, len(frontier) - 1))
+        # Sorteia uma célula e a remove em O(1): a última da lista ocupa o seu lugar
+        index = int(rand() * len(frontier))
+        current_x, current_y = frontier[index]
+        last = frontier.pop()
+        if index < len(frontier):
+            frontier[index] = last
 
         directions = [(0, -2), (2, 0), (0, 2), (-2, 0)]
-        random.shuffle(directions)
+        rng.shuffle(directions)
 
         for dx, dy in directions:
             nx, ny = current_x + dx, current_y + dy
 
             if 0 <= nx < width and 0 <= ny < height:
-                if grid[ny][nx] == 1:
-                    grid[current_y + dy // 2][current_x + dx // 2] = 0
-                    grid[ny][nx] = 0
+                if grid[ny * width + nx] == 1:
+                    grid[(current_y + dy // 2) * width + current_x + dx // 2] = 0
+                    grid[ny * width + nx] = 0
                     frontier.append((nx, ny))
 
     start_pos, end_pos = set_start_end(width, height, grid)
@@ -0,0 +1,153 @@
+def generate_rows(width, height, rng=None):
+    """
+    Gera um labirinto linha a linha usando o algoritmo de Eller.
+    O algoritmo cria um labirinto perfeito (sem áreas inacessíveis e com um único caminho entre
+    quaisquer dois pontos) mantendo em memória apenas o estado da linha atual, O(width).
+
+    As células ficam nas coordenadas pares; as posições ímpares são paredes que podem ser
+    abertas para ligar duas células vizinhas. O início é a célula (0, 0) e o fim a última
+    célula do canto inferior direito.
+
+    Args:
+        width (int): Largura do labirinto (número de colunas).
+        height (int): Altura do labirinto (número de linhas).
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
+
+    Yields:
+        bytes: Cada linha do labirinto, de cima para baixo, com width células, onde:
+              - 0 representa um caminho.
+              - 1 representa uma parede.
+              - 2 representa o ponto inicial.
+              - 3 representa o ponto final.
+    """
+    from utils.disjoint_set import DisjointSet
+    from utils.maze_utils import resolve_rng
+
+    rng = resolve_rng(rng)
+    rand = rng.random
+
+    columns = (width + 1) // 2  # Células por linha
+    rows = (height + 1) // 2    # Linhas de células
+    end_x = get_end_position(width, height)[0]
+
+    # Conjunto de cada célula da linha atual (None = célula ainda sem conjunto), numerado
+    # de 0 a columns - 1 a cada linha
+    labels = [None] * columns
+
+    for row in range(rows):
+        last_row = row == rows - 1
+
+        # Renumera os conjuntos herdados da linha de cima e cria um para cada célula nova
+        renumber = {}
+        for i, label in enumerate(labels):
+            if label is not None:
+                labels[i] = renumber.setdefault(label, len(renumber))
+        next_label = len(renumber)
+        for i, label in enumerate(labels):
+            if label is None:
+                labels[i] = next_label
+                next_label += 1
+        sets = DisjointSet(columns)
+
+        line = bytearray(b'\x01') * width
+        line[0:2 * columns - 1:2] = bytes(columns)
+
+        # Une células vizinhas de conjuntos diferentes (sempre, na última linha)
+        for i in range(columns - 1):
+            a, b = labels[i], labels[i + 1]
+            if sets.find(a) != sets.find(b) and (last_row or rand() < 0.5):
+                sets.union(a, b)
+                line[2 * i + 1] = 0
+
+        if row == 0:
+            line[0] = 2
+        if last_row:
+            line[end_x] = 3
+        yield bytes(line)
+
+        if last_row:
+            break
+
+        # Cada conjunto desce por ao menos uma de suas células
+        members = {}
+        for i in range(columns):
+            members.setdefault(sets.find(labels[i]), []).append(i)
+
+        below = bytearray(b'\x01') * width
+        next_labels = [None] * columns
+        for root, cells in members.items():
+            forced = cells[int(rand() * len(cells))]
+            for i in cells:
+                if i == forced or rand() < 0.5:
+                    below[2 * i] = 0
+                    next_labels[i] = root
+        labels = next_labels
+        yield bytes(below)
+
+    # Com altura par, a última linha fica sem células
+    if height % 2 == 0:
+        yield b'\x01' * width
+
+
+def get_end_position(width, height):
+    """
+    Retorna a posição final dos labirintos gerados por generate_rows.
+
+    Args:
+        width (int): Largura do labirinto.
+        height (int): Altura do labirinto.
+
+    Returns:
+        tuple: Posição final no formato (x, y).
+    """
+    return (width - 1) // 2 * 2, (height - 1) // 2 * 2
+
+
+def write_maze(out, width, height, rng=None):
+    """
+    Gera um labirinto com o algoritmo de Eller e grava suas linhas diretamente em out,
+    sem montar o labirinto completo em memória.
+
+    As células são gravadas em ordem de linhas (y * width + x), um byte por célula, no mesmo
+    formato de Maze.cells; o resultado pode ser mapeado com mmap e carregado com
+    Maze.from_buffer.
+
+    Args:
+        out: Destino com método write(bytes), como um arquivo binário ou um mmap com ao
+            menos width * height bytes a partir da posição atual.
+        width (int): Largura do labirinto.
+        height (int): Altura do labirinto.
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente.
+
+    Returns:
+        tuple: Posições de início e fim no formato ((x_inicio, y_inicio), (x_fim, y_fim)).
+    """
+    for line in generate_rows(width, height, rng):
+        out.write(line)
+    return (0, 0), get_end_position(width, height)
+
+
+def generate_maze(width, height, rng=None):
+    """
+    Gera um labirinto usando o algoritmo de Eller.
+    O algoritmo cria um labirinto perfeito (sem áreas inacessíveis e com um único caminho entre quaisquer dois pontos).
+
+    Args:
+        width (int): Largura do labirinto (número de colunas).
+        height (int): Altura do labirinto (número de linhas).
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
+
+    Returns:
+        tuple: (grid, start, end), onde grid é um bytearray plano (índice y * width + x)
+              representando o labirinto, no qual:
+              - 0 representa um caminho.
+              - 1 representa uma parede.
+              - 2 representa o ponto inicial.
+              - 3 representa o ponto final.
+    """
+    grid = bytearray()
+    for line in generate_rows(width, height, rng):
+        grid += line
+    return grid, (0, 0), get_end_position(width, height)
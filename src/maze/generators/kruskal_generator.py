@@ -0,0 +1,58 @@
+import numpy as np
+
+def generate_maze(width, height, rng=None):
+    """
+    Gera um labirinto usando o algoritmo de Kruskal.
+    O algoritmo cria um labirinto perfeito (sem áreas inacessíveis e com um único caminho entre quaisquer dois pontos).
+
+    As células ficam nas coordenadas pares e as paredes entre elas são visitadas em ordem
+    aleatória; cada parede é aberta se as duas células ainda estiverem em conjuntos
+    diferentes (DisjointSet).
+
+    Args:
+        width (int): Largura do labirinto (número de colunas).
+        height (int): Altura do labirinto (número de linhas).
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
+
+    Returns:
+        tuple: (grid, start, end), onde grid é um bytearray plano (índice y * width + x)
+              representando o labirinto, no qual:
+              - 0 representa um caminho.
+              - 1 representa uma parede.
+              - 2 representa o ponto inicial.
+              - 3 representa o ponto final.
+    """
+    from utils.disjoint_set import DisjointSet
+    from utils.maze_utils import resolve_rng, set_start_end
+
+    rng = resolve_rng(rng)
+
+    grid = bytearray(b'\x01') * (width * height)
+    columns = (width + 1) // 2
+    for y in range(0, height, 2):
+        grid[y * width:y * width + 2 * columns - 1:2] = bytes(columns)
+
+    # Paredes entre células vizinhas (horizontais e verticais), como índices planos,
+    # embaralhadas com o NumPy semeado por rng
+    horizontal = np.arange(0, height, 2)[:, None] * width + np.arange(1, width - 1, 2)
+    vertical = np.arange(1, height - 1, 2)[:, None] * width + np.arange(0, width, 2)
+    walls = np.concatenate((horizontal.ravel(), vertical.ravel()))
+    np.random.default_rng(rng.getrandbits(64)).shuffle(walls)
+
+    sets = DisjointSet(width * height)
+    remaining = columns * ((height + 1) // 2) - 1  # Paredes que ainda serão abertas
+    for wall in walls.tolist():
+        if wall % width % 2:
+            a, b = wall - 1, wall + 1
+        else:
+            a, b = wall - width, wall + width
+        if sets.union(a, b):
+            grid[wall] = 0
+            remaining -= 1
+            if not remaining:
+                break
+
+    start_pos, end_pos = set_start_end(width, height, grid)
+
+    return grid, start_pos, end_pos
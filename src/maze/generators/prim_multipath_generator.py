@@ -1,6 +1,7 @@
-import random
+# Direções: direita, baixo, esquerda, cima
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
 
-def generate_maze(width, height, wall_removal_prob=0.8):
+def generate_maze(width, height, wall_removal_prob=0.8, rng=None):
     """
     Gera um labirinto usando o algoritmo de Prim com múltiplos caminhos.
     O algoritmo cria um labirinto com paredes removidas aleatoriamente para adicionar loops.
@@ -9,39 +10,46 @@ def generate_maze(width, height, wall_removal_prob=0.8):
         width (int): Largura do labirinto (número de colunas).
         height (int): Altura do labirinto (número de linhas).
         wall_removal_prob (float): Probabilidade de remover uma parede durante a fase de adição de loops.
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
 
     Returns:
-        list: Uma matriz (lista de listas) representando o labirinto, onde:
+        tuple: (grid, start, end), onde grid é um bytearray plano (índice y * width + x)
+              representando o labirinto, no qual:
               - 0 representa um caminho.
               - 1 representa uma parede.
               - 2 representa o ponto inicial.
               - 3 representa o ponto final.
     """
-    from utils.maze_utils import set_start_end
+    from utils.maze_utils import resolve_rng, set_start_end
 
-    grid = [[1 for _ in range(width)] for _ in range(height)]
+    rng = resolve_rng(rng)
 
-    start_x = random.randint(0, width - 1)
-    start_y = random.randint(0, height - 1)
-    grid[start_y][start_x] = 0
+    grid = bytearray(b'\x01') * (width * height)
+
+    start_x = rng.randint(0, width - 1)
+    start_y = rng.randint(0, height - 1)
+    grid[start_y * width + start_x] = 0
 
     walls = []
     add_walls_to_list(start_x, start_y, walls, width, height, grid)
 
+    rand = rng.random
     while walls:
-        wall_idx = random.randint(0, len(walls) - 1)
-        wall = walls.pop(wall_idx)
-        x, y, direction = wall
-
-        nx, ny = x + direction[0], y + direction[1]
+        # Sorteia uma parede e a remove em O(1): a última da lista ocupa o seu lugar
+        wall_idx = int(rand() * len(walls))
+        wall, beyond = walls[wall_idx]
+        last = walls.pop()
+        if wall_idx < len(walls):
+            walls[wall_idx] = last
 
-        if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 1:
-            grid[y][x] = 0
-            grid[ny][nx] = 0
+        if grid[beyond] == 1:
+            grid[wall] = 0
+            grid[beyond] = 0
 
-            add_walls_to_list(nx, ny, walls, width, height, grid)
+            add_walls_to_list(beyond % width, beyond // width, walls, width, height, grid)
 
-    add_loops(int(width * height * 0.05), width, height, grid)
+    add_loops(int(width * height * 0.05), width, height, grid, rng)
 
     start_pos, end_pos = set_start_end(width, height, grid)
 
@@ -55,44 +63,49 @@ def add_walls_to_list(x, y, walls, width, height, grid):
     Args:
         x (int): Coordenada x da célula.
         y (int): Coordenada y da célula.
-        walls (list): Lista de paredes (fronteira).
+        walls (list): Lista de paredes (fronteira), como pares (parede, além) de índices
+            planos: a parede e a célula seguinte na mesma direção.
         width (int): Largura do labirinto.
         height (int): Altura do labirinto.
-        grid (list): Grade do labirinto.
+        grid (bytearray): Células do labirinto em ordem de linhas.
     """
-    # Direções: direita, baixo, esquerda, cima
-    directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-    for dx, dy in directions:
+    for dx, dy in DIRECTIONS:
         nx, ny = x + dx, y + dy
-        if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 1:
-            walls.append((nx, ny, (dx, dy)))
+        bx, by = nx + dx, ny + dy
+        # Paredes sem célula além delas nunca seriam abertas e ficam de fora
+        if 0 <= bx < width and 0 <= by < height and grid[ny * width + nx] == 1:
+            walls.append((ny * width + nx, by * width + bx))
 
 
-def add_loops(num_loops, width, height, grid):
+def add_loops(num_loops, width, height, grid, rng):
     """
     Adiciona loops ao labirinto, removendo paredes aleatoriamente para criar múltiplos caminhos.
 
+    Sorteia num_loops posições internas e abre as que são paredes entre dois caminhos
+    alinhados (esquerda e direita ou cima e baixo). Todas as posições são avaliadas sobre
+    o labirinto antes desta etapa e só depois abertas.
+
     Args:
         num_loops (int): Número de paredes a serem removidas para criar loops.
         width (int): Largura do labirinto.
         height (int): Altura do labirinto.
-        grid (list): Grade do labirinto.
+        grid (bytearray): Células do labirinto em ordem de linhas.
+        rng (random.Random): Gerador de números aleatórios.
     """
+    if num_loops <= 0 or width < 3 or height < 3:
+        return
+
+    rand = rng.random
+    inner_width = width - 2
+    inner = inner_width * (height - 2)
+
+    opened = []
     for _ in range(num_loops):
-        x = random.randint(1, width - 2)
-        y = random.randint(1, height - 2)
-
-        directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-        random.shuffle(directions)
-
-        for dx, dy in directions:
-            nx1, ny1 = x + dx, y + dy
-            nx2, ny2 = x - dx, y - dy
-
-            if (0 <= nx1 < width and 0 <= ny1 < height and
-                0 <= nx2 < width and 0 <= ny2 < height and
-                grid[ny1][nx1] == 0 and grid[ny2][nx2] == 0 and
-                grid[y][x] == 1):
-                grid[y][x] = 0
-                break
\ No newline at end of file
+        position = int(rand() * inner)
+        cell = (position // inner_width + 1) * width + position % inner_width + 1
+        if grid[cell] == 1 and (grid[cell - 1] == grid[cell + 1] == 0
+                                or grid[cell - width] == grid[cell + width] == 0):
+            opened.append(cell)
+
+    for cell in opened:
+        grid[cell] = 0
@@ -0,0 +1,84 @@
+def generate_maze(width, height, rng=None):
+    """
+    Gera um labirinto usando o algoritmo de Wilson.
+    O algoritmo cria um labirinto perfeito sorteado uniformemente entre todas as árvores
+    geradoras da grade, com corredores menos tendenciosos que os de DFS, BFS e Prim.
+
+    As células ficam nas coordenadas pares. A partir de cada célula fora da árvore é feito
+    um passeio aleatório até alcançá-la; guardando apenas a última direção tomada em cada
+    célula, os laços do passeio são apagados naturalmente, e o caminho resultante é
+    acrescentado à árvore.
+
+    Args:
+        width (int): Largura do labirinto (número de colunas).
+        height (int): Altura do labirinto (número de linhas).
+        rng (random.Random | int, opcional): Gerador de números aleatórios ou semente; a mesma
+            semente gera sempre o mesmo labirinto. Sem ele, usa o módulo random global.
+
+    Returns:
+        tuple: (grid, start, end), onde grid é um bytearray plano (índice y * width + x)
+              representando o labirinto, no qual:
+              - 0 representa um caminho.
+              - 1 representa uma parede.
+              - 2 representa o ponto inicial.
+              - 3 representa o ponto final.
+    """
+    from utils.maze_utils import resolve_rng, set_start_end
+
+    rng = resolve_rng(rng)
+    getrandbits = rng.getrandbits
+
+    grid = bytearray(b'\x01') * (width * height)
+    last_x = (width - 1) // 2 * 2   # Última coluna com células
+    last_y = (height - 1) // 2 * 2  # Última linha com células
+
+    # Deslocamento (índice plano) de cada direção: direita, baixo, esquerda, cima
+    steps = (1, width, -1, -width)
+
+    # Sorteia a raiz da árvore
+    root = 2 * rng.randint(0, last_y // 2) * width + 2 * rng.randint(0, last_x // 2)
+    grid[root] = 0
+
+    # Última direção tomada em cada célula durante o passeio atual
+    exits = bytearray(width * height)
+
+    for y in range(0, height, 2):
+        for x in range(0, width, 2):
+            start = y * width + x
+            if grid[start] == 0:
+                continue
+
+            # Passeio aleatório até alcançar a árvore
+            cell, cx, cy = start, x, y
+            while grid[cell] != 0:
+                direction = getrandbits(2)
+                if direction == 0:
+                    if cx == last_x:
+                        continue
+                    cx += 2
+                elif direction == 1:
+                    if cy == last_y:
+                        continue
+                    cy += 2
+                elif direction == 2:
+                    if cx == 0:
+                        continue
+                    cx -= 2
+                else:
+                    if cy == 0:
+                        continue
+                    cy -= 2
+                exits[cell] = direction
+                cell = cy * width + cx
+
+            # Acrescenta o caminho sem laços à árvore
+            cell = start
+            while grid[cell] != 0:
+                step = steps[exits[cell]]
+                grid[cell] = 0
+                grid[cell + step] = 0
+                cell += 2 * step
+
+    start_pos, end_pos = set_start_end(width, height, grid)
+
+    return grid, start_pos, end_pos
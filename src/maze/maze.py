@@ -2,6 +2,18 @@ import random
 from enums.maze_size import MazeSize
 from maze.generators.prim_multipath_generator import generate_maze
 
+# Direções de vizinhança na ordem explorada pelos solvers: (dx, dy)
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Para cada máscara de 4 bits (bit i = DIRECTIONS[i] aberta), as direções abertas em ordem
+MASK_DIRECTIONS = tuple(
+    tuple(direction for bit, direction in enumerate(DIRECTIONS) if mask >> bit & 1)
+    for mask in range(16)
+)
+
+# Conversão dos valores das células (0 a 3) para os dígitos da representação em texto
+_DIGITS = bytes.maketrans(bytes(range(4)), b"0123")
+
 class Maze:
     """
     Classe que representa um labirinto.
@@ -10,12 +22,17 @@ class Maze:
         width (int): Largura do labirinto (número de colunas).
         height (int): Altura do labirinto (número de linhas).
         generator (function): Função geradora do labirinto (padrão: PRIM Multipath).
-        grid (list): Matriz que representa o labirinto, onde 1 é parede e 0 é caminho.
+        seed (int | None): Semente do labirinto; None usa o módulo random global.
+        cells (bytearray): Células do labirinto em ordem de linhas (índice y * width + x),
+            onde 0 é caminho, 1 é parede, 2 é o início e 3 é o fim.
+        grid (list): Visão 2-D somente leitura de cells (grid[y][x]), sem cópia.
         start (tuple): Posição inicial do labirinto (linha, coluna).
         end (tuple): Posição final do labirinto (linha, coluna).
+        revision (int): Contador incrementado sempre que as células mudam (generate/set_cell),
+            usado para invalidar caches derivados do labirinto.
     """
 
-    def __init__(self, width, height, generator=generate_maze):
+    def __init__(self, width, height, generator=generate_maze, seed=None):
         """
         Inicializa o labirinto com as dimensões especificadas e um gerador opcional.
 
@@ -23,21 +40,77 @@ class Maze:
             width (int): Largura do labirinto.
             height (int): Altura do labirinto.
             generator (function): Função geradora do labirinto (padrão: PRIM Multipath).
+            seed (int, opcional): Semente do labirinto. Labirintos com o mesmo tamanho,
+                gerador e semente têm células idênticas; chamadas seguintes de generate()
+                continuam a mesma sequência aleatória.
         """
         self.width = width
         self.height = height
         self.generator = generator
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]
+        self.seed = seed
+        self._rng = random.Random(seed) if seed is not None else None
+        self.cells = bytearray(b'\x01') * (width * height)
+        self._grid_view = None
+        self._open_directions = None
+        self.revision = 0
         self.start = (0, 0) 
         self.end = (width - 1, height - 1)
         self.generate()  # Gera o labirinto
 
+    @classmethod
+    def from_buffer(cls, width, height, cells, start, end):
+        """
+        Cria um labirinto a partir de células já geradas, sem executar nenhum gerador.
+        Usado para transportar labirintos de forma compacta (um único buffer de bytes).
+
+        Args:
+            width (int): Largura do labirinto.
+            height (int): Altura do labirinto.
+            cells (bytes | bytearray): Células em ordem de linhas (y * width + x).
+            start (tuple): Posição inicial (x, y).
+            end (tuple): Posição final (x, y).
+
+        Returns:
+            Maze: Labirinto com as células informadas.
+        """
+        maze = cls.__new__(cls)
+        maze.width = width
+        maze.height = height
+        maze.generator = None
+        maze.seed = None
+        maze._rng = None
+        maze.cells = bytearray(cells) if isinstance(cells, bytes) else cells
+        maze._grid_view = None
+        maze._open_directions = None
+        maze.revision = 0
+        maze.start = tuple(start)
+        maze.end = tuple(end)
+        return maze
+
     def generate(self):
         """
         Gera o labirinto usando o gerador especificado.
         Atualiza a grade do labirinto e define as posições de início e fim.
         """
-        self.grid, self.start, self.end = self.generator(self.width, self.height)  # Gera o labirinto
+        self.cells, self.start, self.end = self.generator(self.width, self.height, rng=self._rng)  # Gera o labirinto
+        self._grid_view = None
+        self._open_directions = None
+        self.revision += 1
+
+    @property
+    def grid(self):
+        """
+        Retorna uma visão 2-D somente leitura das células, indexada como grid[y][x].
+        Cada linha é um memoryview sobre o buffer plano, portanto nenhuma célula é copiada.
+
+        Returns:
+            list: Lista de linhas (memoryview) do labirinto.
+        """
+        if self._grid_view is None:
+            view = memoryview(self.cells).toreadonly()
+            width = self.width
+            self._grid_view = [view[y * width:(y + 1) * width] for y in range(self.height)]
+        return self._grid_view
 
     def __str__(self):
         """
@@ -46,10 +119,21 @@ class Maze:
         Returns:
             str: String formatada representando o labirinto.
         """
-        maze_str = ""
+        return b"".join(self.text_lines()).decode()
+
+    def text_lines(self):
+        """
+        Gera as linhas da representação em texto do labirinto: os valores das células de
+        cada linha separados por espaço, terminando em quebra de linha.
+
+        Yields:
+            bytes: Uma linha do labirinto em texto (ASCII).
+        """
+        line = bytearray(b" ") * (2 * self.width)
+        line[-1] = ord("\n")
         for row in self.grid:
-            maze_str += " ".join(str(cell) for cell in row) + "\n"
-        return maze_str
+            line[::2] = bytes(row).translate(_DIGITS)
+            yield bytes(line)
 
     def get_cell(self, x, y):
         """
@@ -63,7 +147,7 @@ class Maze:
             int: Valor da célula (0 para caminho, 1 para parede).
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[y][x]
+            return self.cells[y * self.width + x]
         raise IndexError("Coordenadas fora dos limites do labirinto.")
 
     def set_cell(self, x, y, value):
@@ -76,6 +160,42 @@ class Maze:
             value (int): Valor a ser definido (0 para caminho, 1 para parede).
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.grid[y][x] = value
+            self.cells[y * self.width + x] = value
+            self._open_directions = None
+            self.revision += 1
         else:
-            raise IndexError("Coordenadas fora dos limites do labirinto.")
\ No newline at end of file
+            raise IndexError("Coordenadas fora dos limites do labirinto.")
+
+    def open_directions(self):
+        """
+        Retorna o índice de adjacência do labirinto, construído sob demanda e reaproveitado
+        entre os solvers até a próxima chamada de generate() ou set_cell().
+
+        Cada posição do bytearray (índice y * width + x) guarda uma máscara de 4 bits com as
+        direções de DIRECTIONS que levam a uma célula vizinha que não é parede. Os
+        deslocamentos correspondentes são obtidos com MASK_DIRECTIONS[máscara].
+
+        Returns:
+            bytearray: Máscara de direções abertas de cada célula (0 para paredes).
+        """
+        if self._open_directions is None:
+            width, height, cells = self.width, self.height, self.cells
+            masks = bytearray(width * height)
+            for y in range(height):
+                row = y * width
+                for x in range(width):
+                    index = row + x
+                    if cells[index] == 1:
+                        continue
+                    mask = 0
+                    if y + 1 < height and cells[index + width] != 1:
+                        mask |= 1
+                    if x + 1 < width and cells[index + 1] != 1:
+                        mask |= 2
+                    if y > 0 and cells[index - width] != 1:
+                        mask |= 4
+                    if x > 0 and cells[index - 1] != 1:
+                        mask |= 8
+                    masks[index] = mask
+            self._open_directions = masks
+        return self._open_directions
@@ -1,56 +1,75 @@
 import heapq
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import reconstruct_path, Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveAstarManhattan(maze):
+def solveAstarManhattan(maze, metrics):
     # Função heurística de Manhattan (distância de Manhattan até o destino)
     def manhattan_distance(pos):
         return abs(pos[0] - maze.end[0]) + abs(pos[1] - maze.end[1])
     
     # Fila de prioridade para A*
-    # Formato: (f_score, contador, posição atual, caminho)
+    # Formato: (f_score, contador, posição atual)
     # O contador serve para desempatar quando f_score é igual
     start_pos = maze.start
     counter = 0
-    open_set = [(manhattan_distance(start_pos), counter, start_pos, [start_pos])]
+    open_directions = maze.open_directions()
+    width = maze.width
+    open_set = [(manhattan_distance(start_pos), counter, start_pos)]
     heapq.heapify(open_set)
     
     # Conjuntos para controle
     visited = {start_pos}
-    visited_history = [set(visited)]  # Histórico de células visitadas
+    previous = {start_pos: None}  # Predecessor de cada posição
+    visited_history = VisitHistory([start_pos])  # Histórico de células visitadas
+    metrics.track(visited_history)
+
+    # Contadores de instrumentação (heap começa com a posição inicial)
+    pushes, pops, max_frontier = 1, 0, 1
+    next_checkpoint = CHECKPOINT_INTERVAL
     
     # Para cada nó, g_score é o custo do caminho mais barato do início até o nó
     g_score = {start_pos: 0}
     
     while open_set:
         # Obtém o nó atual com menor f_score da fila de prioridade
-        _, _, current, path = heapq.heappop(open_set)
+        _, _, current = heapq.heappop(open_set)
+        pops += 1
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(pops, pushes, pops, max_frontier)
         
         # Verifica se chegou ao destino
         if current == maze.end:
-            return path, visited, visited_history
+            metrics.record(pops - 1, pushes, pops, max_frontier)
+            return reconstruct_path(previous, maze.end), visited, visited_history
         
         x, y = current
         
-        # Explora os vizinhos
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        # Explora os vizinhos abertos
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
             neighbor = (x + dx, y + dy)
             
-            if is_valid_position(maze, neighbor[0], neighbor[1]):
-                # Calcula tentative_g_score
-                tentative_g_score = g_score[current] + 1
+            # Calcula tentative_g_score
+            tentative_g_score = g_score[current] + 1
+            
+            # Se este caminho para o vizinho é melhor que o anterior
+            if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                # Atualiza os valores para este vizinho
+                g_score[neighbor] = tentative_g_score
+                f_score = tentative_g_score + manhattan_distance(neighbor)
                 
-                # Se este caminho para o vizinho é melhor que o anterior
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                    # Atualiza os valores para este vizinho
-                    g_score[neighbor] = tentative_g_score
-                    f_score = tentative_g_score + manhattan_distance(neighbor)
-                    
-                    # Adiciona à fila de prioridade somente se não visitado
-                    if neighbor not in visited:
-                        counter += 1
-                        heapq.heappush(open_set, (f_score, counter, neighbor, path + [neighbor]))
-                        visited.add(neighbor)
-                        visited_history.append(set(visited))
+                # Adiciona à fila de prioridade somente se não visitado
+                if neighbor not in visited:
+                    counter += 1
+                    heapq.heappush(open_set, (f_score, counter, neighbor))
+                    pushes += 1
+                    visited.add(neighbor)
+                    previous[neighbor] = current
+                    visited_history.add(neighbor)
+
+        if len(open_set) > max_frontier:
+            max_frontier = len(open_set)
     
+    metrics.record(pops, pushes, pops, max_frontier)
     return [], visited, visited_history  # Retorna caminho vazio se não encontrar solução
\ No newline at end of file
@@ -1,8 +1,10 @@
 from collections import deque
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import reconstruct_path, Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveBfs(maze):
+def solveBfs(maze, metrics):
     """
     Resolve um labirinto usando o algoritmo Breadth-First Search (BFS).
     
@@ -10,44 +12,65 @@ def solveBfs(maze):
         maze (Maze): Objeto do labirinto contendo:
             - start: Tupla (x,y) com a posição inicial
             - end: Tupla (x,y) com a posição final
-            - grid: Matriz representando o labirinto (0=caminho, 1=parede)
+            - cells: Células do labirinto em ordem de linhas (0=caminho, 1=parede)
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
     
     Returns:
         tuple: Contendo três elementos:
             - list: Caminho da solução como lista de coordenadas [(x1,y1), (x2,y2), ...]
             - set: Todas as células visitadas durante a busca
-            - set: Histórico do momento que visitou as células
+            - VisitHistory: Histórico do momento que visitou as células
     """
     
-    # Inicializa a fila para BFS com:
-    # - Primeiro elemento: posição inicial
-    # - Segundo elemento: caminho percorrido (inicia só com a posição inicial)
-    queue = deque([(maze.start, [maze.start])])
+    # Índice de adjacência (máscara de direções abertas por célula)
+    open_directions = maze.open_directions()
+    width = maze.width
+
+    # Inicializa a fila para BFS com a posição inicial
+    queue = deque([maze.start])
+
+    # Predecessor de cada posição descoberta (usado para reconstruir o caminho)
+    previous = {maze.start: None}
     
     # Conjunto para armazenar posições já visitadas (evita revisitar)
     visited = {maze.start}
-    visited_history = [set(visited)]  # Histórico de células visitadas
+    visited_history = VisitHistory([maze.start])  # Histórico de células visitadas
+    metrics.track(visited_history)
+
+    # Contadores de instrumentação (fila começa com a posição inicial)
+    pushes, pops, max_frontier = 1, 0, 1
+    next_checkpoint = CHECKPOINT_INTERVAL
     
     # Loop principal da BFS
     while queue:
         # Remove o primeiro elemento da fila
-        (x, y), path = queue.popleft()
+        x, y = queue.popleft()
+        pops += 1
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(pops, pushes, pops, max_frontier)
         
         # Verifica se chegou ao destino
         if (x, y) == maze.end:
-            return path, visited, visited_history  # Retorna solução encontrada
+            metrics.record(pops - 1, pushes, pops, max_frontier)
+            return reconstruct_path(previous, maze.end), visited, visited_history  # Retorna solução encontrada
             
-        # Explora os 4 vizinhos (direita, baixo, esquerda, cima)
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        # Explora os vizinhos abertos (baixo, direita, cima, esquerda)
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
             nx, ny = x + dx, y + dy  # Calcula nova posição
             
-            # Verifica se a nova posição é válida (caminho e não visitada)
-            if is_valid_position(maze, nx, ny) and (nx, ny) not in visited:
-                # Adiciona à fila com o novo caminho (path + nova posição)
-                queue.append(((nx, ny), path + [(nx, ny)]))
+            # Verifica se a nova posição ainda não foi visitada
+            if (nx, ny) not in visited:
+                # Adiciona à fila e guarda de onde veio
+                queue.append((nx, ny))
+                pushes += 1
+                previous[(nx, ny)] = (x, y)
                 # Marca como visitada
                 visited.add((nx, ny))
-                visited_history.append(set(visited))
+                visited_history.add((nx, ny))
+
+        if len(queue) > max_frontier:
+            max_frontier = len(queue)
     
     # Se a fila esvaziar sem encontrar solução
+    metrics.record(pops, pushes, pops, max_frontier)
     return [], visited, visited_history   # Retorna caminho vazio
\ No newline at end of file
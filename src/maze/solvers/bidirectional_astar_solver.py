@@ -1,8 +1,10 @@
 import heapq
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveBidirectionalAstar(maze):
+def solveBidirectionalAstar(maze, metrics):
     """
     Resolve um labirinto usando uma implementação bidirecional do algoritmo A* com distância de Manhattan.
     
@@ -10,26 +12,25 @@ def solveBidirectionalAstar(maze):
         maze (Maze): Objeto do labirinto contendo:
             - start: Tupla (x,y) com a posição inicial
             - end: Tupla (x,y) com a posição final
-            - grid: Matriz representando o labirinto (0=caminho, 1=parede)
+            - cells: Células do labirinto em ordem de linhas (0=caminho, 1=parede)
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
     
     Returns:
         tuple: Contendo três elementos:
             - list: Caminho da solução como lista de coordenadas [(x1,y1), (x2,y2), ...]
             - set: Todas as células visitadas durante a busca
-            - list: Histórico do momento que visitou as células
+            - VisitHistory: Histórico do momento que visitou as células
     """
     
     def manhattan_distance(pos1, pos2):
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
     
+    open_directions = maze.open_directions()
+    width = maze.width
+
     def get_neighbors(pos):
         x, y = pos
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_pos = (x + dx, y + dy)
-            if is_valid_position(maze, new_pos[0], new_pos[1]):
-                neighbors.append(new_pos)
-        return neighbors
+        return [(x + dx, y + dy) for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]]
 
     def reconstruct_path(forward_parent, backward_parent, meeting_point):
         # Reconstrói o caminho do início até o ponto de encontro
@@ -69,15 +70,24 @@ def solveBidirectionalAstar(maze):
     backward_visited = {maze.end}
     
     # Histórico de células visitadas
-    visited_history = [set(forward_visited | backward_visited)]
+    visited_history = VisitHistory([maze.start, maze.end], initial=2)
+    metrics.track(visited_history)
     
     # Contadores para desempate
     forward_counter = 1
     backward_counter = 1
 
+    # Contadores de instrumentação (os dois heaps começam com um nó cada)
+    pushes, pops, max_frontier = 2, 0, 2
+    next_checkpoint = CHECKPOINT_INTERVAL
+
     while forward_open and backward_open:
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(pops, pushes, pops, max_frontier)
+
         # Expande a busca para frente
         _, _, current_forward, _ = heapq.heappop(forward_open)
+        pops += 1
         
         for neighbor in get_neighbors(current_forward):
             if neighbor not in forward_visited:
@@ -89,15 +99,21 @@ def solveBidirectionalAstar(maze):
                     f_score = tentative_g_score + manhattan_distance(neighbor, maze.end)
                     forward_counter += 1
                     heapq.heappush(forward_open, (f_score, forward_counter, neighbor, []))
+                    pushes += 1
                     forward_visited.add(neighbor)
-                    visited_history.append(set(forward_visited | backward_visited))
                     
                     if neighbor in backward_visited:
+                        # A célula já está no histórico (registrada pela outra busca): o
+                        # encontro é uma etapa sem célula nova
+                        visited_history.add_layer([])
                         path = reconstruct_path(forward_parent, backward_parent, neighbor)
+                        metrics.record(pops, pushes, pops, max_frontier)
                         return path, forward_visited | backward_visited, visited_history
+                    visited_history.add(neighbor)
 
         # Expande a busca para trás
         _, _, current_backward, _ = heapq.heappop(backward_open)
+        pops += 1
         
         for neighbor in get_neighbors(current_backward):
             if neighbor not in backward_visited:
@@ -109,11 +125,21 @@ def solveBidirectionalAstar(maze):
                     f_score = tentative_g_score + manhattan_distance(neighbor, maze.start)
                     backward_counter += 1
                     heapq.heappush(backward_open, (f_score, backward_counter, neighbor, []))
+                    pushes += 1
                     backward_visited.add(neighbor)
-                    visited_history.append(set(forward_visited | backward_visited))
                     
                     if neighbor in forward_visited:
+                        # A célula já está no histórico (registrada pela outra busca): o
+                        # encontro é uma etapa sem célula nova
+                        visited_history.add_layer([])
                         path = reconstruct_path(forward_parent, backward_parent, neighbor)
+                        metrics.record(pops, pushes, pops, max_frontier)
                         return path, forward_visited | backward_visited, visited_history
+                    visited_history.add(neighbor)
+
+        frontier_size = len(forward_open) + len(backward_open)
+        if frontier_size > max_frontier:
+            max_frontier = frontier_size
 
+    metrics.record(pops, pushes, pops, max_frontier)
     return [], forward_visited | backward_visited, visited_history 
\ No newline at end of file
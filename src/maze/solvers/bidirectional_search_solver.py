@@ -1,16 +1,16 @@
 from collections import deque
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveBidirectionalSearch(maze):
+def solveBidirectionalSearch(maze, metrics):
+    open_directions = maze.open_directions()
+    width = maze.width
+
     def get_neighbors(pos):
         x, y = pos
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_pos = (x + dx, y + dy)
-            if is_valid_position(maze, new_pos[0], new_pos[1]):
-                neighbors.append(new_pos)
-        return neighbors
+        return [(x + dx, y + dy) for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]]
 
     def reconstruct_path(forward_parent, backward_parent, meeting_point):
         # Reconstrói o caminho do início até o ponto de encontro
@@ -45,35 +45,60 @@ def solveBidirectionalSearch(maze):
     backward_visited = {maze.end}
     
     # Histórico de células visitadas
-    visited_history = [set(forward_visited | backward_visited)]
+    visited_history = VisitHistory([maze.start, maze.end], initial=2)
+    metrics.track(visited_history)
+
+    # Contadores de instrumentação (as duas filas começam com um nó cada)
+    pushes, pops, max_frontier = 2, 0, 2
+    next_checkpoint = CHECKPOINT_INTERVAL
 
     while forward_queue and backward_queue:
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(pops, pushes, pops, max_frontier)
+
         # Expande a busca para frente
         current_forward = forward_queue.popleft()
+        pops += 1
         for neighbor in get_neighbors(current_forward):
             if neighbor not in forward_visited:
                 forward_visited.add(neighbor)
                 forward_parent[neighbor] = current_forward
                 forward_queue.append(neighbor)
-                visited_history.append(set(forward_visited | backward_visited))
+                pushes += 1
                 
                 # Verifica se encontrou um nó visitado pela busca para trás
                 if neighbor in backward_visited:
+                    # A célula já está no histórico (registrada pela outra busca): o
+                    # encontro é uma etapa sem célula nova
+                    visited_history.add_layer([])
                     path = reconstruct_path(forward_parent, backward_parent, neighbor)
+                    metrics.record(pops, pushes, pops, max_frontier)
                     return path, forward_visited | backward_visited, visited_history
+                visited_history.add(neighbor)
 
         # Expande a busca para trás
         current_backward = backward_queue.popleft()
+        pops += 1
         for neighbor in get_neighbors(current_backward):
             if neighbor not in backward_visited:
                 backward_visited.add(neighbor)
                 backward_parent[neighbor] = current_backward
                 backward_queue.append(neighbor)
-                visited_history.append(set(forward_visited | backward_visited))
+                pushes += 1
                 
                 # Verifica se encontrou um nó visitado pela busca para frente
                 if neighbor in forward_visited:
+                    # A célula já está no histórico (registrada pela outra busca): o
+                    # encontro é uma etapa sem célula nova
+                    visited_history.add_layer([])
                     path = reconstruct_path(forward_parent, backward_parent, neighbor)
+                    metrics.record(pops, pushes, pops, max_frontier)
                     return path, forward_visited | backward_visited, visited_history
+                visited_history.add(neighbor)
+
+        frontier_size = len(forward_queue) + len(backward_queue)
+        if frontier_size > max_frontier:
+            max_frontier = frontier_size
 
+    metrics.record(pops, pushes, pops, max_frontier)
     return [], forward_visited | backward_visited, visited_history  # Retorna caminho vazio se não encontrar solução 
\ No newline at end of file
@@ -1,8 +1,10 @@
 import heapq
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import reconstruct_path, Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveDijkstra(maze):
+def solveDijkstra(maze, metrics):
     """
     Resolve um labirinto usando uma implementação otimizada do algoritmo de Dijkstra.
     
@@ -10,28 +12,39 @@ def solveDijkstra(maze):
         maze (Maze): Objeto do labirinto contendo:
             - start: Tupla (x,y) com a posição inicial
             - end: Tupla (x,y) com a posição final
-            - grid: Matriz representando o labirinto (0=caminho, 1=parede)
+            - cells: Células do labirinto em ordem de linhas (0=caminho, 1=parede)
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
     
     Returns:
         tuple: Contendo três elementos:
             - list: Caminho da solução como lista de coordenadas [(x1,y1), (x2,y2), ...]
             - set: Todas as células visitadas durante a busca
-            - list: Histórico do momento que visitou as células
+            - VisitHistory: Histórico do momento que visitou as células
     """
     
     # Inicializa estruturas de dados
+    open_directions = maze.open_directions()  # Índice de adjacência do labirinto
+    width = maze.width
     distances = {maze.start: 0}  # Distância do início até cada nó
     previous = {maze.start: None}  # Nó anterior no caminho mais curto
     visited = {maze.start}  # Conjunto de nós visitados
-    visited_history = [set(visited)]  # Histórico de visitas
+    visited_history = VisitHistory([maze.start])  # Histórico de visitas
+    metrics.track(visited_history)
     
     # Fila de prioridade: (distância, posição)
     priority_queue = [(0, maze.start)]
     heapq.heapify(priority_queue)
+
+    # Contadores de instrumentação
+    expanded, pushes, pops, max_frontier = 0, 1, 0, 1
+    next_checkpoint = CHECKPOINT_INTERVAL
     
     while priority_queue:
         # Pega o nó com menor distância
         current_distance, current = heapq.heappop(priority_queue)
+        pops += 1
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(expanded, pushes, pops, max_frontier)
         
         # Se já encontramos um caminho melhor para este nó, ignora
         if current_distance > distances[current]:
@@ -39,19 +52,17 @@ def solveDijkstra(maze):
             
         # Se chegamos ao destino, reconstrói o caminho
         if current == maze.end:
-            path = []
-            while current is not None:
-                path.append(current)
-                current = previous[current]
-            return path[::-1], visited, visited_history
+            metrics.record(expanded, pushes, pops, max_frontier)
+            return reconstruct_path(previous, maze.end), visited, visited_history
         
-        # Explora os vizinhos
+        # Explora os vizinhos abertos
+        expanded += 1
         x, y = current
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
             neighbor = (x + dx, y + dy)
             
-            # Verifica se o vizinho é válido e não foi visitado
-            if is_valid_position(maze, neighbor[0], neighbor[1]) and neighbor not in visited:
+            # Verifica se o vizinho não foi visitado
+            if neighbor not in visited:
                 # Calcula nova distância
                 new_distance = distances[current] + 1
                 
@@ -60,8 +71,13 @@ def solveDijkstra(maze):
                     distances[neighbor] = new_distance
                     previous[neighbor] = current
                     heapq.heappush(priority_queue, (new_distance, neighbor))
+                    pushes += 1
                     visited.add(neighbor)
-                    visited_history.append(set(visited))
+                    visited_history.add(neighbor)
+
+        if len(priority_queue) > max_frontier:
+            max_frontier = len(priority_queue)
     
     # Se não encontrou caminho
+    metrics.record(expanded, pushes, pops, max_frontier)
     return [], visited, visited_history 
\ No newline at end of file
@@ -1,8 +1,10 @@
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import Benchmark
+from utils.visit_history import VisitHistory
 import math
 
 @Benchmark.measure
-def solveFloydWarshall(maze):
+def solveFloydWarshall(maze, metrics):
     """
     Resolve um labirinto usando o algoritmo Floyd-Warshall.
     
@@ -10,18 +12,21 @@ def solveFloydWarshall(maze):
         maze (Maze): Objeto do labirinto contendo:
             - start: Tupla (x,y) com a posição inicial
             - end: Tupla (x,y) com a posição final
-            - grid: Matriz representando o labirinto (0=caminho, 1=parede)
+            - cells: Células do labirinto em ordem de linhas (0=caminho, 1=parede)
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
     
     Returns:
         tuple: Contendo três elementos:
             - list: Caminho da solução como lista de coordenadas [(x1,y1), (x2,y2), ...]
             - set: Todas as células visitadas durante a busca
-            - list: Histórico das células visitadas
+            - VisitHistory: Histórico das células visitadas
     """
     
+    open_directions = maze.open_directions()  # Índice de adjacência do labirinto
+    width = maze.width
+
     # Lista de todas posições válidas do labirinto
-    rows, cols = len(maze.grid), len(maze.grid[0])
-    nodes = [(x, y) for x in range(rows) for y in range(cols) if is_valid_position(maze, x, y)]
+    nodes = [(x, y) for x in range(maze.width) for y in range(maze.height) if maze.cells[y * width + x] != 1]
 
     index_map = {pos: i for i, pos in enumerate(nodes)}
     rev_map = {i: pos for pos, i in index_map.items()}
@@ -37,24 +42,26 @@ def solveFloydWarshall(maze):
 
     # Adiciona arestas entre vizinhos válidos
     for i, (x, y) in enumerate(nodes):
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            if is_valid_position(maze, nx, ny):
-                j = index_map[(nx, ny)]
-                dist[i][j] = 1
-                next_node[i][j] = j
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
+            j = index_map[(x + dx, y + dy)]
+            dist[i][j] = 1
+            next_node[i][j] = j
 
     # Floyd-Warshall: atualiza as distâncias mínimas
     for k in range(n):
+        metrics.checkpoint(k, 0, 0, 0)  # Publica o progresso e atende cancelamentos
         for i in range(n):
             for j in range(n):
                 if dist[i][k] + dist[k][j] < dist[i][j]:
                     dist[i][j] = dist[i][k] + dist[k][j]
                     next_node[i][j] = next_node[i][k]
 
+    # Todos os nós são usados como intermediários; não há fronteira
+    metrics.record(n, 0, 0, 0)
+
     # Reconstrução do caminho
     visited = set()
-    visited_history = []
+    visited_history = VisitHistory()
 
     start_idx = index_map.get(maze.start)
     end_idx = index_map.get(maze.end)
@@ -67,13 +74,13 @@ def solveFloydWarshall(maze):
     while u != end_idx:
         path.append(rev_map[u])
         visited.add(rev_map[u])
-        visited_history.append(set(visited))
+        visited_history.add(rev_map[u])
         u = next_node[u][end_idx]
         if u is None:
             return [], visited, visited_history  # Caminho quebrado
 
     path.append(rev_map[end_idx])
     visited.add(rev_map[end_idx])
-    visited_history.append(set(visited))
+    visited_history.add(rev_map[end_idx])
 
     return path, visited, visited_history
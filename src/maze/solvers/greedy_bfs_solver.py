@@ -1,46 +1,66 @@
 import heapq
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import reconstruct_path, Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
 
 @Benchmark.measure
-def solveGreedyBFS(maze):
+def solveGreedyBFS(maze, metrics):
     # Função heurística de Manhattan (distância de Manhattan até o destino)
     def manhattan_distance(pos):
         return abs(pos[0] - maze.end[0]) + abs(pos[1] - maze.end[1])
     
     # Fila de prioridade para Greedy BFS
-    # Formato: (heurística, contador, posição atual, caminho)
+    # Formato: (heurística, contador, posição atual)
     # O contador serve para desempatar quando a heurística é igual
     start_pos = maze.start
     counter = 0
-    open_set = [(manhattan_distance(start_pos), counter, start_pos, [start_pos])]
+    open_directions = maze.open_directions()
+    width = maze.width
+    open_set = [(manhattan_distance(start_pos), counter, start_pos)]
     heapq.heapify(open_set)
     
     # Conjuntos para controle
     visited = {start_pos}
-    visited_history = [set(visited)]  # Histórico de células visitadas
+    previous = {start_pos: None}  # Predecessor de cada posição
+    visited_history = VisitHistory([start_pos])  # Histórico de células visitadas
+    metrics.track(visited_history)
+
+    # Contadores de instrumentação (heap começa com a posição inicial)
+    pushes, pops, max_frontier = 1, 0, 1
+    next_checkpoint = CHECKPOINT_INTERVAL
     
     while open_set:
         # Obtém o nó atual com menor valor heurístico da fila de prioridade
-        _, _, current, path = heapq.heappop(open_set)
+        _, _, current = heapq.heappop(open_set)
+        pops += 1
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(pops, pushes, pops, max_frontier)
         
         # Verifica se chegou ao destino
         if current == maze.end:
-            return path, visited, visited_history
+            metrics.record(pops - 1, pushes, pops, max_frontier)
+            return reconstruct_path(previous, maze.end), visited, visited_history
         
         x, y = current
         
-        # Explora os vizinhos
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        # Explora os vizinhos abertos
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
             neighbor = (x + dx, y + dy)
             
-            if is_valid_position(maze, neighbor[0], neighbor[1]) and neighbor not in visited:
+            if neighbor not in visited:
                 # Calcula o valor heurístico para o vizinho
                 h_score = manhattan_distance(neighbor)
                 
                 # Adiciona à fila de prioridade
                 counter += 1
-                heapq.heappush(open_set, (h_score, counter, neighbor, path + [neighbor]))
+                heapq.heappush(open_set, (h_score, counter, neighbor))
+                pushes += 1
                 visited.add(neighbor)
-                visited_history.append(set(visited))
+                previous[neighbor] = current
+                visited_history.add(neighbor)
+
+        if len(open_set) > max_frontier:
+            max_frontier = len(open_set)
     
+    metrics.record(pops, pushes, pops, max_frontier)
     return [], visited, visited_history  # Retorna caminho vazio se não encontrar solução 
\ No newline at end of file
@@ -1,26 +1,73 @@
 import heapq
-from utils.maze_utils import is_valid_position, Benchmark
+from maze.maze import MASK_DIRECTIONS
+from utils.maze_utils import reconstruct_path, Benchmark, CHECKPOINT_INTERVAL
+from utils.visit_history import VisitHistory
+
+
+class _PathOrder:
+    """
+    Predecessor de uma entrada do heap, ordenado pelo caminho completo do início até ele.
+
+    Entradas com o mesmo custo e a mesma posição são desempatadas como quando o heap
+    guardava a lista do caminho inteiro: os dois caminhos são percorridos de volta pelos
+    predecessores até o ancestral comum e comparados pela primeira posição em que diferem.
+
+    Atributos:
+        pos (tuple | None): Posição do predecessor (None para a entrada inicial).
+        previous (dict): Predecessor de cada posição já visitada.
+    """
+
+    __slots__ = ("pos", "previous")
+
+    def __init__(self, pos, previous):
+        self.pos = pos
+        self.previous = previous
+
+    def __eq__(self, other):
+        return self.pos == other.pos
+
+    def __lt__(self, other):
+        a, b, previous = self.pos, other.pos, self.previous
+        if a is not None and b is not None:
+            while True:
+                parent_a, parent_b = previous[a], previous[b]
+                if parent_a == parent_b:  # Irmãos: a primeira diferença está aqui
+                    return a < b
+                if parent_a is None or parent_b is None:
+                    break  # Profundidades diferentes
+                a, b = parent_a, parent_b
+        return reconstruct_path(previous, self.pos) < reconstruct_path(previous, other.pos)
+
 
 @Benchmark.measure
-def solveJohnson(maze):
+def solveJohnson(maze, metrics):
     """
     Resolve um labirinto usando o algoritmo de Johnson (adaptado).
     Assume que todas as arestas têm peso 1 e não há pesos negativos.
     
     Args:
-        maze (Maze): Objeto com .start, .end e .grid
+        maze (Maze): Objeto com .start, .end e .cells
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
     
     Returns:
         tuple: (path, visited, visited_history)
     """
-    rows, cols = len(maze.grid), len(maze.grid[0])
+    open_directions = maze.open_directions()  # Índice de adjacência do labirinto
+    width = maze.width
     
-    # Lista de posições válidas (onde grid[x][y] == 0)
+    # Lista de posições válidas (células que não são parede)
     valid_positions = [
         (x, y)
-        for x in range(rows)
-        for y in range(cols)
-        if is_valid_position(maze, x, y)
+        for x in range(maze.width)
+        for y in range(maze.height)
+        if maze.cells[y * width + x] != 1
+    ]
+
+    # Arestas entre posições válidas, montadas uma única vez
+    edges = [
+        ((x, y), (x + dx, y + dy))
+        for (x, y) in valid_positions
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]
     ]
 
     # Mapeia todas as posições válidas com potencial infinito, exceto start
@@ -28,48 +75,65 @@ def solveJohnson(maze):
     h[maze.start] = 0
 
     # === Bellman-Ford para calcular os potenciais ===
-    for _ in range(len(valid_positions) - 1):
-        for (x, y) in valid_positions:
-            for dx, dy in [(0,1),(1,0),(0,-1),(-1,0)]:
-                nx, ny = x + dx, y + dy
-                if is_valid_position(maze, nx, ny):
-                    u, v = (x, y), (nx, ny)
-                    if h[u] + 1 < h[v]:
-                        h[v] = h[u] + 1
+    for round_index in range(len(valid_positions) - 1):
+        metrics.checkpoint(round_index, 0, 0, 0)
+        updated = False
+        for u, v in edges:
+            if h[u] + 1 < h[v]:
+                h[v] = h[u] + 1
+                updated = True
+        # Nenhum potencial mudou nesta rodada: as próximas também não mudariam
+        if not updated:
+            break
 
     # === Verificação de ciclos negativos (não esperados) ===
-    for (x, y) in valid_positions:
-        for dx, dy in [(0,1),(1,0),(0,-1),(-1,0)]:
-            nx, ny = x + dx, y + dy
-            if is_valid_position(maze, nx, ny):
-                u, v = (x, y), (nx, ny)
-                if h[u] + 1 < h[v]:
-                    # Ciclo negativo detectado
-                    return [], set(), []
+    for u, v in edges:
+        if h[u] + 1 < h[v]:
+            # Ciclo negativo detectado
+            return [], set(), VisitHistory()
 
     # === Dijkstra com pesos reponderados ===
-    heap = [(0, maze.start, [maze.start])]
+    # Entradas do heap: (custo, posição, predecessor); o predecessor desempata pelo
+    # caminho completo (ver _PathOrder)
     visited = set()
-    visited_history = [set()]
+    previous = {}
+    heap = [(0, maze.start, _PathOrder(None, previous))]
+    visited_history = VisitHistory(initial=0)
+    metrics.track(visited_history)
+
+    # Contadores de instrumentação
+    expanded, pushes, pops, max_frontier = 0, 1, 0, 1
+    next_checkpoint = CHECKPOINT_INTERVAL
 
     while heap:
-        cost, (x, y), path = heapq.heappop(heap)
+        cost, (x, y), parent = heapq.heappop(heap)
+        pops += 1
+        if pops >= next_checkpoint:  # Publica o progresso e atende cancelamentos
+            next_checkpoint = metrics.checkpoint(expanded, pushes, pops, max_frontier)
 
         if (x, y) in visited:
             continue
 
         visited.add((x, y))
-        visited_history.append(set(visited))
+        previous[(x, y)] = parent.pos
+        visited_history.add((x, y))
 
         if (x, y) == maze.end:
-            return path, visited, visited_history
+            metrics.record(expanded, pushes, pops, max_frontier)
+            return reconstruct_path(previous, maze.end), visited, visited_history
 
-        for dx, dy in [(0,1),(1,0),(0,-1),(-1,0)]:
+        expanded += 1
+        for dx, dy in MASK_DIRECTIONS[open_directions[y * width + x]]:
             nx, ny = x + dx, y + dy
-            if is_valid_position(maze, nx, ny) and (nx, ny) not in visited:
+            if (nx, ny) not in visited:
                 # Peso ajustado (como em Johnson)
                 u, v = (x, y), (nx, ny)
                 adjusted_weight = 1 + h[u] - h[v]
-                heapq.heappush(heap, (cost + adjusted_weight, v, path + [v]))
+                heapq.heappush(heap, (cost + adjusted_weight, v, _PathOrder(u, previous)))
+                pushes += 1
+
+        if len(heap) > max_frontier:
+            max_frontier = len(heap)
 
+    metrics.record(expanded, pushes, pops, max_frontier)
     return [], visited, visited_history
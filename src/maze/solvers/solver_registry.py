@@ -0,0 +1,254 @@
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from weakref import WeakKeyDictionary
+from utils.maze_utils import SearchMetrics, SolveCancelled
+
+# Módulo e função de cada solver, indexados pelo nome do Algorithm. Os módulos só são
+# importados no primeiro uso; habilitar um algoritmo no enum basta para disponibilizá-lo.
+SOLVER_MODULES = {
+    "BFS": ("maze.solvers.bfs_solver", "solveBfs"),
+    "DIJKSTRA": ("maze.solvers.dijkstra_solver", "solveDijkstra"),
+    "GREEDY_BFS": ("maze.solvers.greedy_bfs_solver", "solveGreedyBFS"),
+    "JOHNSON": ("maze.solvers.johnson_solver", "solveJohnson"),
+    "FLOYD_WARSHALL": ("maze.solvers.floydWarshall_solver", "solveFloydWarshall"),
+    "ASTAR_MANHATTAN": ("maze.solvers.AStartManhattan_solver", "solveAstarManhattan"),
+    "BIDIRECTIONAL_SEARCH": ("maze.solvers.bidirectional_search_solver", "solveBidirectionalSearch"),
+    "BIDIRECTIONAL_ASTAR": ("maze.solvers.bidirectional_astar_solver", "solveBidirectionalAstar"),
+    "WAVEFRONT_BFS": ("maze.solvers.wavefront_bfs_solver", "solveWavefrontBfs"),
+}
+
+# Módulos usados por todos os solvers, cujo código também entra na versão de cada solver
+SHARED_SOLVER_MODULES = ("maze.maze", "utils.maze_utils", "utils.visit_history")
+
+_loaded_solvers = {}
+_solver_versions = {}
+
+
+def get_solver(algorithm):
+    """
+    Retorna a função solver de um algoritmo, importando seu módulo no primeiro uso.
+
+    Args:
+        algorithm (Algorithm): Algoritmo desejado.
+
+    Returns:
+        callable: Solver decorado com Benchmark.measure.
+
+    Raises:
+        ValueError: Se não houver solver registrado para o algoritmo.
+    """
+    solver = _loaded_solvers.get(algorithm.name)
+    if solver is None:
+        if algorithm.name not in SOLVER_MODULES:
+            raise ValueError(f"Nenhum solver registrado para o algoritmo {algorithm.name}.")
+        module_name, function_name = SOLVER_MODULES[algorithm.name]
+        solver = getattr(import_module(module_name), function_name)
+        _loaded_solvers[algorithm.name] = solver
+    return solver
+
+
+def get_solver_version(algorithm):
+    """
+    Retorna a versão do solver de um algoritmo: um hash do código-fonte do seu módulo e dos
+    módulos compartilhados (SHARED_SOLVER_MODULES). Qualquer mudança nesse código gera
+    uma nova versão, invalidando os resultados gravados em disco com a anterior.
+
+    Args:
+        algorithm (Algorithm): Algoritmo desejado.
+
+    Returns:
+        str: Versão do solver (hexadecimal).
+
+    Raises:
+        ValueError: Se não houver solver registrado para o algoritmo.
+    """
+    version = _solver_versions.get(algorithm.name)
+    if version is None:
+        get_solver(algorithm)
+        digest = hashlib.blake2b(digest_size=8)
+        for module_name in (SOLVER_MODULES[algorithm.name][0], *SHARED_SOLVER_MODULES):
+            with open(import_module(module_name).__file__, "rb") as file:
+                digest.update(file.read())
+        version = digest.hexdigest()
+        _solver_versions[algorithm.name] = version
+    return version
+
+
+class SolveJob:
+    """
+    Execução de um solver em segundo plano, criada por SolverRegistry.submit.
+
+    Atributos:
+        algorithm (Algorithm): Algoritmo executado.
+        maze (Maze): Labirinto resolvido.
+        metrics (SearchMetrics): Métricas da execução, atualizadas nos checkpoints do solver.
+        cancelled (bool): True se o cancelamento foi pedido.
+    """
+
+    def __init__(self, algorithm, maze, future, metrics):
+        """
+        Inicializa o acompanhamento da execução.
+
+        Args:
+            algorithm (Algorithm): Algoritmo executado.
+            maze (Maze): Labirinto resolvido.
+            future (concurrent.futures.Future): Execução agendada.
+            metrics (SearchMetrics): Métricas compartilhadas com o solver.
+        """
+        self.algorithm = algorithm
+        self.maze = maze
+        self.metrics = metrics
+        self.cancelled = False
+        self._future = future
+        self._started = time.perf_counter()
+        self._finished = None
+
+    @property
+    def done(self):
+        """
+        Indica se a execução terminou (concluída, cancelada ou com erro).
+        """
+        if self._finished is None and self._future.done():
+            self._finished = time.perf_counter()
+        return self._finished is not None
+
+    @property
+    def history(self):
+        """
+        Retorna o histórico de visitas parcial (None antes de o solver criá-lo).
+        """
+        return self.metrics.history
+
+    @property
+    def elapsed_ms(self):
+        """
+        Retorna o tempo decorrido desde o envio, em milissegundos.
+        """
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return (end - self._started) * 1000
+
+    def cancel(self):
+        """
+        Cancela a execução: se ainda não começou, não chega a começar; se já começou,
+        o solver para no próximo checkpoint.
+        """
+        self.cancelled = True
+        self.metrics.cancel()
+        self._future.cancel()
+
+    def result(self):
+        """
+        Retorna o resultado da execução concluída.
+
+        Returns:
+            tuple | None: (path, visited, history, metrics) ou None se foi cancelada.
+
+        Raises:
+            Exception: O erro lançado pelo solver, se houver.
+        """
+        if self.cancelled:
+            return None
+        try:
+            return self._future.result()
+        except SolveCancelled:
+            return None
+
+
+class SolverRegistry:
+    """
+    Resolve labirintos com o solver de cada algoritmo e memoiza os resultados por labirinto.
+
+    Os resultados ficam associados ao objeto Maze (sem impedir que ele seja coletado) e à
+    sua revisão, de modo que regenerar ou editar o labirinto descarta as soluções antigas.
+    Com um SolutionCache, as soluções também são persistidas em disco e reaproveitadas
+    sempre que um labirinto com o mesmo conteúdo aparece de novo.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Inicializa o registro sem nenhum resultado memoizado.
+
+        Args:
+            cache (SolutionCache, opcional): Cache em disco consultado antes de executar um solver.
+        """
+        self._results = WeakKeyDictionary()
+        self.cache = cache
+        # Uma única thread: as execuções em segundo plano são atendidas em ordem
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def cached(self, algorithm, maze):
+        """
+        Retorna o resultado memoizado de um algoritmo para o labirinto, se houver.
+
+        Args:
+            algorithm (Algorithm): Algoritmo consultado.
+            maze (Maze): Labirinto consultado.
+
+        Returns:
+            tuple | None: (path, visited, history, metrics) ou None se ainda não resolvido.
+        """
+        revision, results = self._results.get(maze, (None, None))
+        if revision != maze.revision:
+            return None
+        return results.get(algorithm)
+
+    def solve(self, algorithm, maze, metrics=None):
+        """
+        Resolve o labirinto com o algoritmo, reaproveitando o resultado memoizado em memória
+        ou, se houver, o gravado no cache em disco.
+
+        Args:
+            algorithm (Algorithm): Algoritmo a executar.
+            maze (Maze): Labirinto a resolver.
+            metrics (SearchMetrics, opcional): Métricas repassadas ao solver, para acompanhar
+                ou cancelar a execução de outra thread.
+
+        Returns:
+            tuple: (path, visited, history, metrics) retornado pelo solver.
+
+        Raises:
+            SolveCancelled: Se a execução foi cancelada pelas métricas.
+        """
+        result = self.cached(algorithm, maze)
+        if result is None and self.cache is not None:
+            result = self.cache.load(algorithm, maze)
+            if result is not None:
+                self.store(algorithm, maze, result)
+        if result is None:
+            result = get_solver(algorithm)(maze, metrics=metrics)
+            self.store(algorithm, maze, result)
+            if self.cache is not None:
+                self.cache.store(algorithm, maze, result)
+        return result
+
+    def submit(self, algorithm, maze):
+        """
+        Agenda a resolução do labirinto em segundo plano (ver solve).
+
+        Args:
+            algorithm (Algorithm): Algoritmo a executar.
+            maze (Maze): Labirinto a resolver.
+
+        Returns:
+            SolveJob: Execução agendada, com progresso, histórico parcial e cancelamento.
+        """
+        metrics = SearchMetrics()
+        future = self._executor.submit(self.solve, algorithm, maze, metrics)
+        return SolveJob(algorithm, maze, future, metrics)
+
+    def store(self, algorithm, maze, result):
+        """
+        Memoiza o resultado de um algoritmo para a revisão atual do labirinto.
+
+        Args:
+            algorithm (Algorithm): Algoritmo executado.
+            maze (Maze): Labirinto resolvido.
+            result (tuple): (path, visited, history, metrics).
+        """
+        revision, results = self._results.get(maze, (None, None))
+        if revision != maze.revision:
+            results = {}
+            self._results[maze] = (maze.revision, results)
+        results[algorithm] = result
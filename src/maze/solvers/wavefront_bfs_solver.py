@@ -0,0 +1,121 @@
+import time
+import numpy as np
+from maze.maze import DIRECTIONS
+from utils.maze_utils import Benchmark
+from utils.visit_history import VisitHistory
+
+@Benchmark.measure
+def solveWavefrontBfs(maze, metrics):
+    """
+    Resolve um labirinto com uma BFS vetorizada em NumPy, expandindo toda a fronteira
+    (frente de onda) de uma só vez em vez de uma célula por iteração.
+
+    Cada camada da frente de onda é um vetor de índices planos; os vizinhos de todas as
+    células da camada são obtidos de uma vez a partir do índice de adjacência do labirinto
+    e filtrados pelo campo de distâncias. Ao alcançar o destino, o caminho é recuperado
+    descendo o gradiente do campo de distâncias a partir do fim.
+
+    Args:
+        maze (Maze): Objeto do labirinto contendo:
+            - start: Tupla (x,y) com a posição inicial
+            - end: Tupla (x,y) com a posição final
+            - cells: Células do labirinto em ordem de linhas (0=caminho, 1=parede)
+        metrics (SearchMetrics): Métricas da execução, preenchidas durante a busca.
+
+    Returns:
+        tuple: Contendo três elementos:
+            - list: Caminho da solução como lista de coordenadas [(x1,y1), (x2,y2), ...]
+            - set: Todas as células visitadas durante a busca
+            - VisitHistory: Histórico com uma etapa por camada da frente de onda
+    """
+    width = maze.width
+    start = maze.start[1] * width + maze.start[0]
+    end = maze.end[1] * width + maze.end[0]
+
+    # Máscaras de direções abertas e deslocamento plano de cada direção
+    open_directions = np.frombuffer(maze.open_directions(), dtype=np.uint8)
+    offsets = [dy * width + dx for dx, dy in DIRECTIONS]
+
+    # Campo de distâncias (-1 = ainda não alcançada)
+    distance = np.full(maze.width * maze.height, -1, dtype=np.int32)
+    distance[start] = 0
+    owner = np.empty(maze.width * maze.height, dtype=np.intp)
+
+    visited_history = VisitHistory([maze.start])
+    metrics.track(visited_history)
+    frontier = np.array([start], dtype=np.intp)
+    layer = 0
+
+    # Contadores de instrumentação (cada camada é expandida e inserida por inteiro)
+    expanded, pushes, max_frontier = 0, 1, 1
+    history_ns = 0
+
+    while frontier.size and distance[end] < 0:
+        metrics.checkpoint(expanded, pushes, expanded, max_frontier)  # Progresso e cancelamento
+        layer += 1
+        expanded += frontier.size
+        masks = open_directions[frontier]
+
+        # Vizinhos de todas as células da fronteira, direção por direção
+        candidates = np.concatenate([
+            frontier[(masks & (1 << bit)) != 0] + offset
+            for bit, offset in enumerate(offsets)
+        ])
+        candidates = candidates[distance[candidates] < 0]
+
+        # Remove duplicatas (célula alcançada por mais de um vizinho) sem ordenar:
+        # cada índice guarda a última posição em que aparece e só ela é mantida
+        positions = np.arange(candidates.size, dtype=np.intp)
+        owner[candidates] = positions
+        frontier = candidates[owner[candidates] == positions]
+        distance[frontier] = layer
+        pushes += frontier.size
+        max_frontier = max(max_frontier, frontier.size)
+        if not frontier.size:
+            break  # Nenhuma célula nova: não há caminho e não há camada a registrar
+
+        history_started = time.perf_counter_ns()
+        ys, xs = np.divmod(frontier, width)
+        visited_history.add_layer(zip(xs.tolist(), ys.tolist()))
+        history_ns += time.perf_counter_ns() - history_started
+
+    metrics.record(expanded, pushes, expanded, max_frontier)
+    metrics.history_ms = history_ns / 1_000_000
+
+    visited = set(visited_history.order)
+    if distance[end] < 0:
+        return [], visited, visited_history
+
+    return _descend_gradient(maze, distance, end), visited, visited_history
+
+
+def _descend_gradient(maze, distance, end):
+    """
+    Recupera o caminho caminhando do fim ao início sempre para um vizinho com
+    distância uma unidade menor.
+
+    Args:
+        maze (Maze): Labirinto resolvido.
+        distance (numpy.ndarray): Campo de distâncias plano calculado pela frente de onda.
+        end (int): Índice plano da posição final.
+
+    Returns:
+        list: Caminho do início ao fim como lista de coordenadas (x, y).
+    """
+    width = maze.width
+    open_directions = maze.open_directions()
+    offsets = [(bit, dy * width + dx) for bit, (dx, dy) in enumerate(DIRECTIONS)]
+
+    current = end
+    path = [(current % width, current // width)]
+    while distance[current] > 0:
+        target = distance[current] - 1
+        mask = open_directions[current]
+        for bit, offset in offsets:
+            if mask >> bit & 1 and distance[current + offset] == target:
+                current += offset
+                break
+        path.append((current % width, current // width))
+
+    path.reverse()
+    return path
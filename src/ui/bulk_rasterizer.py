@@ -0,0 +1,256 @@
+import numpy as np
+import pygame
+from enums.colour import *
+from utils.visit_history import VisitHistory
+
+# Tabela de cores indexada pelo código de cada pixel: os códigos de célula do labirinto
+# (0 caminho, 1 parede, 2 início, 3 fim) seguidos de visitada (4) e solução (5)
+VISITED_CODE = 4
+PATH_CODE = 5
+COLOR_LUT = np.array([WHITE, BLACK, GREEN, RED, LIGHT_CYAN, YELLOW], dtype=np.uint8)
+
+
+class BulkRasterizer:
+    """
+    Desenha labirintos com células muito pequenas (poucos pixels) em lote, com NumPy.
+
+    Em vez de um retângulo por célula, monta um quadro com 1 pixel por célula a partir do
+    buffer de células do labirinto e das máscaras de visitadas e da solução, converte os
+    códigos em cores por uma tabela (COLOR_LUT) e amplia apenas a parte visível para o
+    tamanho de célula atual. Cada etapa fica em cache até a entrada correspondente mudar.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o rasterizador sem nada em cache.
+        """
+        self._codes_key = None
+        self._codes = None
+        self._flat_order_key = None
+        self._flat_order = None
+        self._visited_key = None
+        self._visited_mask = None
+        self._path_key = None
+        self._path_mask = None
+        self._frame_key = None
+        self._frame = None
+        self._pooled_key = None
+        self._pooled = None
+        self._pooled_cells = {}
+
+    def draw(self, screen, maze, visited, step, path, cell_size, start_x, start_y, view):
+        """
+        Desenha o labirinto, as células visitadas e a solução na tela.
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            maze (Maze): Objeto do labirinto.
+            visited (VisitHistory | set | None): Histórico de visitas (limitado a step) ou
+                conjunto de células visitadas.
+            step (int | None): Passo do histórico exibido.
+            path (list | None): Células da solução.
+            cell_size (int): Tamanho de cada célula.
+            start_x (int): Posição inicial X do labirinto.
+            start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (first_x, first_y, last_x, last_y).
+        """
+        if view is None:
+            return
+        first_x, first_y, last_x, last_y = view
+
+        codes = self._get_codes(maze)
+        visited_mask = self._get_visited_mask(maze, visited, step)
+        path_mask = self._get_path_mask(maze, path)
+
+        key = (maze, maze.revision, self._visited_key, self._path_key, cell_size, view)
+        if self._frame_key != key:
+            frame = codes[first_y:last_y, first_x:last_x].copy()
+            # Início e fim mantêm a própria cor, como no desenho célula a célula
+            open_cells = frame < 2
+            if visited_mask is not None:
+                frame[visited_mask[first_y:last_y, first_x:last_x] & open_cells] = VISITED_CODE
+            if path_mask is not None:
+                frame[path_mask[first_y:last_y, first_x:last_x] & open_cells] = PATH_CODE
+
+            # surfarray usa eixos (x, y); o quadro está em (linha, coluna)
+            surface = pygame.surfarray.make_surface(COLOR_LUT[frame].transpose(1, 0, 2))
+            self._frame = pygame.transform.scale(
+                surface, ((last_x - first_x) * cell_size, (last_y - first_y) * cell_size))
+            self._frame_key = key
+
+        screen.blit(self._frame, (start_x + first_x * cell_size, start_y + first_y * cell_size))
+
+    def draw_pooled(self, screen, maze, visited, step, path, scale, level, start_x, start_y, view):
+        """
+        Desenha as células visitadas e a solução de um labirinto exibido com menos de 1 pixel
+        por célula (ver TileRenderer), sobre os tiles do labirinto.
+
+        Cada pixel representa um bloco de 2^level x 2^level células e recebe a cor da
+        solução ou de visitada se qualquer célula do bloco estiver marcada, para que
+        caminhos de uma célula de largura continuem visíveis. O bloco de cada célula é
+        calculado a partir dos índices planos (custo proporcional às células marcadas, não
+        ao tamanho do labirinto).
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            maze (Maze): Objeto do labirinto.
+            visited (VisitHistory | set | None): Histórico de visitas ou conjunto de visitadas.
+            step (int | None): Passo do histórico exibido.
+            path (list | None): Células da solução.
+            scale (float): Pixels por célula.
+            level (int): Nível de detalhe (ver TileRenderer.level_for).
+            start_x (int): Posição inicial X do labirinto.
+            start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (first_x, first_y, last_x, last_y).
+        """
+        if view is None or (visited is None and path is None):
+            return
+
+        factor = 1 << level
+        pooled_width = -(-maze.width // factor)
+        pooled_height = -(-maze.height // factor)
+
+        visited_blocks, count = None, 0
+        if isinstance(visited, VisitHistory):
+            count = visited.count_at(min(step, len(visited) - 1))
+            visited_blocks = self._get_pooled(maze, visited.order, level, "order")[:count]
+        elif visited is not None:
+            count = len(visited)
+            visited_blocks = self._get_pooled(maze, visited, level, "visited")
+        path_blocks = self._get_pooled(maze, path, level, "path") if path is not None else None
+
+        # Retângulo visível em blocos do nível de detalhe
+        first_x, first_y, last_x, last_y = view
+        block_x, block_y = first_x // factor, first_y // factor
+        end_x, end_y = -(-last_x // factor), -(-last_y // factor)
+
+        key = (maze, maze.revision, visited, count, path, level, scale, view)
+        if self._pooled_key != key:
+            frame = np.zeros(pooled_width * pooled_height, dtype=np.uint8)
+            if visited_blocks is not None:
+                frame[visited_blocks] = VISITED_CODE
+            if path_blocks is not None:
+                frame[path_blocks] = PATH_CODE
+            frame = frame.reshape(pooled_height, pooled_width)[block_y:end_y, block_x:end_x]
+
+            # Superfície de 8 bits com a paleta dos códigos (sem converter para RGB); o
+            # código 0 (branco) é transparente e mostra o tile por baixo
+            surface = pygame.surfarray.make_surface(frame.T)
+            surface.set_palette([tuple(color) for color in COLOR_LUT])
+            surface.set_colorkey(0)
+            self._pooled = pygame.transform.scale(surface, (
+                max(1, round(min(end_x * factor, maze.width) * scale) - round(block_x * factor * scale)),
+                max(1, round(min(end_y * factor, maze.height) * scale) - round(block_y * factor * scale))))
+            self._pooled_key = key
+
+        screen.blit(self._pooled, (start_x + round(block_x * factor * scale),
+                                   start_y + round(block_y * factor * scale)))
+
+    def _get_pooled(self, maze, cells, level, role):
+        """
+        Retorna, para cada célula, o índice plano do bloco do nível de detalhe que a contém.
+
+        O resultado fica em cache por papel ("order", "visited" ou "path") enquanto o
+        labirinto, o objeto de células, sua quantidade e o nível não mudam; se só a
+        ordem de visita cresceu, apenas as células novas são convertidas.
+        """
+        count = len(cells)
+        key = (maze, cells, count, level)
+        cached = self._pooled_cells.get(role)
+        if cached is None or cached[0] != key:
+            start = 0
+            if (role == "order" and cached is not None and cached[0][2] < count and
+                    (cached[0][0], cached[0][1], cached[0][3]) == (maze, cells, level)):
+                start = cached[0][2]
+            if role == "order":
+                flat = self._get_flat_order(maze, cells)[start:count]
+            else:
+                flat = self._flatten(maze, cells, count)
+            factor = 1 << level
+            pooled_width = -(-maze.width // factor)
+            blocks = (flat // maze.width // factor) * pooled_width + (flat % maze.width) // factor
+            if start:
+                blocks = np.concatenate((cached[1], blocks))
+            cached = (key, blocks)
+            self._pooled_cells[role] = cached
+        return cached[1]
+
+    def _get_codes(self, maze):
+        """
+        Retorna as células do labirinto como matriz (height, width) de códigos.
+        """
+        key = (maze, maze.revision)
+        if self._codes_key != key:
+            self._codes = np.frombuffer(bytes(maze.cells), dtype=np.uint8).reshape(maze.height, maze.width)
+            self._codes_key = key
+        return self._codes
+
+    def _to_mask(self, maze, flat_cells):
+        """
+        Converte índices planos (y * width + x) em uma máscara (height, width).
+        """
+        mask = np.zeros(maze.width * maze.height, dtype=bool)
+        mask[flat_cells] = True
+        return mask.reshape(maze.height, maze.width)
+
+    def _flatten(self, maze, cells, count):
+        """
+        Converte posições (x, y) em um vetor de índices planos.
+        """
+        width = maze.width
+        return np.fromiter((y * width + x for x, y in cells), dtype=np.int64, count=count)
+
+    def _get_flat_order(self, maze, order):
+        """
+        Retorna a ordem de visita de um histórico como vetor de índices planos, convertida
+        uma única vez; se a ordem crescer (execução em andamento), só o final é convertido.
+        """
+        count = len(order)
+        key = (maze, order, count)
+        if self._flat_order_key != key:
+            previous = self._flat_order_key
+            if previous is not None and previous[:2] == (maze, order) and previous[2] < count:
+                tail = self._flatten(maze, order[previous[2]:count], count - previous[2])
+                self._flat_order = np.concatenate((self._flat_order, tail))
+            else:
+                self._flat_order = self._flatten(maze, order, count)
+            self._flat_order_key = key
+        return self._flat_order
+
+    def _get_visited_mask(self, maze, visited, step):
+        """
+        Retorna a máscara das células visitadas (até o passo, no caso de um histórico).
+
+        A ordem de visita do histórico é convertida para índices planos uma única vez; mover
+        o slider refaz apenas a máscara, com uma atribuição vetorizada.
+        """
+        if visited is None:
+            self._visited_key = None
+            return None
+
+        if isinstance(visited, VisitHistory):
+            count = visited.count_at(min(step, len(visited) - 1))
+            key = (maze, visited, count)
+            if self._visited_key != key:
+                self._visited_mask = self._to_mask(maze, self._get_flat_order(maze, visited.order)[:count])
+                self._visited_key = key
+        else:
+            key = (maze, visited, len(visited))
+            if self._visited_key != key:
+                self._visited_mask = self._to_mask(maze, self._flatten(maze, visited, len(visited)))
+                self._visited_key = key
+        return self._visited_mask
+
+    def _get_path_mask(self, maze, path):
+        """
+        Retorna a máscara das células da solução.
+        """
+        if path is None:
+            self._path_key = None
+            return None
+
+        key = (maze, path, len(path))
+        if self._path_key != key:
+            self._path_mask = self._to_mask(maze, self._flatten(maze, path, len(path)))
+            self._path_key = key
+        return self._path_mask
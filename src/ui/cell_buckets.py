@@ -0,0 +1,42 @@
+class CellBuckets:
+    """
+    Índice espacial de células: agrupa as posições em blocos quadrados para que apenas
+    os blocos que cruzam o retângulo visível sejam percorridos ao desenhar.
+
+    Atributos:
+        size (int): Lado de cada bloco, em células.
+        buckets (dict): Mapeia (bloco_x, bloco_y) para a lista de células do bloco.
+    """
+
+    def __init__(self, cells, size=16):
+        """
+        Constrói o índice.
+
+        Args:
+            cells (iterable): Posições (x, y) indexadas.
+            size (int): Lado de cada bloco, em células.
+        """
+        self.size = size
+        self.buckets = {}
+        for cell in cells:
+            self.buckets.setdefault((cell[0] // size, cell[1] // size), []).append(cell)
+
+    def query(self, first_x, first_y, last_x, last_y):
+        """
+        Retorna as células dentro de um retângulo.
+
+        Args:
+            first_x (int): Primeira coluna do retângulo.
+            first_y (int): Primeira linha do retângulo.
+            last_x (int): Coluna final (exclusiva).
+            last_y (int): Linha final (exclusiva).
+
+        Returns:
+            iterator: Células (x, y) contidas no retângulo.
+        """
+        size = self.size
+        for bucket_y in range(first_y // size, (last_y - 1) // size + 1):
+            for bucket_x in range(first_x // size, (last_x - 1) // size + 1):
+                for cell in self.buckets.get((bucket_x, bucket_y), ()):
+                    if first_x <= cell[0] < last_x and first_y <= cell[1] < last_y:
+                        yield cell
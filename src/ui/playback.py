@@ -0,0 +1,108 @@
+import time
+
+
+class Playback:
+    """
+    Reprodução animada da exploração de um algoritmo, controlando o slider de passos.
+
+    O passo exibido é calculado pelo tempo decorrido (relógio de parede) e não pela
+    quantidade de quadros: se um quadro demorar mais que o previsto, os passos desse
+    intervalo são pulados e a reprodução mantém a velocidade, sem deixar o restante da
+    aplicação mais lento.
+
+    Atributos:
+        speeds (tuple): Velocidades disponíveis, em passos por segundo.
+        speed_index (int): Índice da velocidade atual em speeds.
+        slider (Slider | None): Slider controlado pela reprodução em andamento.
+        playing (bool): True enquanto a reprodução está em andamento.
+    """
+
+    def __init__(self, speeds, speed_index=0):
+        """
+        Inicializa a reprodução parada.
+
+        Args:
+            speeds (tuple): Velocidades disponíveis, em passos por segundo.
+            speed_index (int): Índice da velocidade inicial em speeds.
+        """
+        self.speeds = speeds
+        self.speed_index = speed_index
+        self.slider = None
+        self.playing = False
+        self._position = 0.0
+        self._last_time = None
+
+    @property
+    def steps_per_second(self):
+        """
+        Retorna a velocidade atual, em passos por segundo.
+        """
+        return self.speeds[self.speed_index]
+
+    def play(self, slider):
+        """
+        Inicia (ou retoma) a reprodução a partir do passo atual do slider; se o slider já
+        estiver no último passo, recomeça do início.
+
+        Args:
+            slider (Slider): Slider de passos do algoritmo exibido.
+        """
+        if slider.value >= slider.max_val:
+            slider.value = slider.min_val
+            slider.update_knob_position()
+        self.slider = slider
+        self.playing = True
+        self._position = float(slider.value)
+        self._last_time = time.perf_counter()
+
+    def pause(self):
+        """
+        Interrompe a reprodução, mantendo o passo atual.
+        """
+        self.playing = False
+        self.slider = None
+
+    def toggle(self, slider):
+        """
+        Alterna entre reproduzir e pausar.
+
+        Args:
+            slider (Slider): Slider de passos do algoritmo exibido.
+        """
+        if self.playing and self.slider is slider:
+            self.pause()
+        else:
+            self.play(slider)
+
+    def next_speed(self):
+        """
+        Passa para a próxima velocidade (volta à primeira depois da última).
+        """
+        self.speed_index = (self.speed_index + 1) % len(self.speeds)
+
+    def advance(self, now=None):
+        """
+        Avança o slider de acordo com o tempo decorrido desde a última chamada.
+
+        Args:
+            now (float, opcional): Instante atual (padrão: time.perf_counter()).
+
+        Returns:
+            bool: True se o passo exibido mudou.
+        """
+        if not self.playing:
+            return False
+
+        now = time.perf_counter() if now is None else now
+        self._position += (now - self._last_time) * self.steps_per_second
+        self._last_time = now
+
+        slider = self.slider
+        value = min(slider.max_val, int(self._position))
+        if value >= slider.max_val:
+            self.pause()
+        if value == slider.value:
+            return False
+        slider.value = value
+        slider.update_knob_position()
+        return True
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Cache de textos renderizados, indexado por (texto, fonte, cor).
+
+    Os textos fixos da interface (títulos, nomes das abas e dos algoritmos) são
+    pré-renderizados uma única vez com preload e nunca são descartados; os demais
+    (valores de estatísticas, contador de passos) ficam em um cache LRU com quantidade
+    máxima de entradas, para que textos que mudam a cada quadro não o façam crescer.
+
+    Atributos:
+        max_entries (int): Quantidade máxima de textos no cache LRU.
+    """
+
+    def __init__(self, max_entries):
+        """
+        Inicializa o cache vazio.
+
+        Args:
+            max_entries (int): Quantidade máxima de textos no cache LRU.
+        """
+        self.max_entries = max_entries
+        self._static = {}
+        self._recent = OrderedDict()
+
+    def preload(self, font, texts, color):
+        """
+        Pré-renderiza textos fixos, que ficam em cache permanentemente.
+
+        Args:
+            font (pygame.font.Font): Fonte usada.
+            texts (iterable): Textos a renderizar.
+            color (tuple): Cor do texto.
+        """
+        for text in texts:
+            self._static[(text, font, color)] = font.render(text, True, color)
+
+    def render(self, font, text, color):
+        """
+        Retorna a superfície de um texto, renderizando-o apenas na primeira vez.
+
+        Args:
+            font (pygame.font.Font): Fonte usada.
+            text (str): Texto a renderizar.
+            color (tuple): Cor do texto.
+
+        Returns:
+            pygame.Surface: Texto renderizado (com antialiasing).
+        """
+        key = (text, font, color)
+        surface = self._static.get(key)
+        if surface is not None:
+            return surface
+
+        surface = self._recent.get(key)
+        if surface is not None:
+            self._recent.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self._recent[key] = surface
+        if len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
+        return surface
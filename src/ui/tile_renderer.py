@@ -0,0 +1,211 @@
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pygame
+from ui.bulk_rasterizer import COLOR_LUT
+
+# Quantos níveis acima o renderizador procura um tile já pronto para usar (ampliado) como
+# substituto enquanto o tile do nível atual é gerado
+FALLBACK_LEVELS = 4
+
+
+def render_tile_colors(codes, tile_pixels, tile_x, tile_y, level):
+    """
+    Calcula as cores de um tile em um nível de detalhe.
+
+    Args:
+        codes (numpy.ndarray): Células do labirinto como matriz (height, width) de códigos.
+        tile_pixels (int): Lado do tile em pixels.
+        tile_x (int): Coluna do tile.
+        tile_y (int): Linha do tile.
+        level (int): Nível de detalhe (cada pixel representa 2^level x 2^level células).
+
+    Returns:
+        numpy.ndarray: Cores (linhas, colunas, 3) do tile.
+    """
+    size = tile_pixels << level
+    codes = codes[tile_y * size:(tile_y + 1) * size, tile_x * size:(tile_x + 1) * size]
+
+    factor = 1 << level
+    if factor == 1:
+        return COLOR_LUT[codes]
+
+    # Completa as bordas até um múltiplo do bloco e conta quantas células de cada código há
+    # em cada bloco; a cor do pixel é a média ponderada das cores
+    pad_y, pad_x = -codes.shape[0] % factor, -codes.shape[1] % factor
+    if pad_y or pad_x:
+        codes = np.pad(codes, ((0, pad_y), (0, pad_x)), mode="edge")
+    height, width = codes.shape[0] // factor, codes.shape[1] // factor
+    blocks = codes.reshape(height, factor, width, factor)
+    totals = np.zeros((height, width, 3), dtype=np.uint32)
+    for code in range(4):
+        counts = (blocks == code).sum(axis=(1, 3), dtype=np.uint32)
+        totals += counts[:, :, None] * COLOR_LUT[code].astype(np.uint32)
+    return (totals // (factor * factor)).astype(np.uint8)
+
+
+class TileRenderer:
+    """
+    Desenha labirintos que não cabem na tela (menos de 1 pixel por célula) a partir de tiles.
+
+    Em cada nível de detalhe k, um pixel representa a média das cores de um bloco de
+    2^k x 2^k células e o labirinto é dividido em tiles de tile_pixels x tile_pixels pixels
+    (ou seja, tile_pixels * 2^k células de lado). Como o tamanho do tile na tela fica entre
+    metade e o tamanho total de tile_pixels, a quantidade de tiles visíveis não depende do
+    tamanho do labirinto.
+
+    Os tiles são gerados sob demanda, quando entram na área visível, em uma thread auxiliar
+    (o NumPy libera o GIL durante as reduções), para que o quadro nunca espere por eles;
+    enquanto isso, um tile de nível mais grosseiro já pronto é ampliado no lugar. Os tiles
+    (e suas versões ampliadas para o zoom atual) ficam em caches LRU com quantidade máxima.
+
+    Atributos:
+        tile_pixels (int): Lado de cada tile, em pixels do nível de detalhe.
+        max_tiles (int): Quantidade máxima de tiles em cada cache.
+        incomplete (bool): True se o último desenho deixou tiles visíveis por gerar.
+    """
+
+    def __init__(self, tile_pixels, max_tiles):
+        """
+        Inicializa o renderizador com os caches vazios.
+
+        Args:
+            tile_pixels (int): Lado de cada tile, em pixels do nível de detalhe.
+            max_tiles (int): Quantidade máxima de tiles em cada cache.
+        """
+        self.tile_pixels = tile_pixels
+        self.max_tiles = max_tiles
+        self.incomplete = False
+        self._maze_key = None
+        self._codes = None
+        self._tiles = OrderedDict()
+        self._scaled = OrderedDict()
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def level_for(scale):
+        """
+        Retorna o nível de detalhe adequado a uma escala (pixels por célula, menor que 1).
+
+        Args:
+            scale (float): Pixels por célula.
+
+        Returns:
+            int: Nível k em que cada pixel representa 2^k x 2^k células.
+        """
+        return max(0, int(math.floor(math.log2(1 / scale))))
+
+    def draw(self, screen, maze, scale, start_x, start_y, view):
+        """
+        Desenha os tiles visíveis do labirinto.
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            maze (Maze): Objeto do labirinto.
+            scale (float): Pixels por célula.
+            start_x (int): Posição inicial X do labirinto.
+            start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (first_x, first_y, last_x, last_y).
+        """
+        self.incomplete = False
+        if view is None:
+            return
+        first_x, first_y, last_x, last_y = view
+
+        key = (maze, maze.revision)
+        if self._maze_key != key:
+            # Tiles de outro labirinto (ou de uma revisão anterior) não servem mais
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._tiles.clear()
+            self._scaled.clear()
+            self._codes = np.frombuffer(bytes(maze.cells), dtype=np.uint8).reshape(maze.height, maze.width)
+            self._maze_key = key
+
+        level = self.level_for(scale)
+        size = self.tile_pixels << level  # Lado do tile em células
+        visible = set()
+
+        for tile_y in range(first_y // size, (last_y - 1) // size + 1):
+            top = start_y + round(tile_y * size * scale)
+            bottom = start_y + round(min((tile_y + 1) * size, maze.height) * scale)
+            for tile_x in range(first_x // size, (last_x - 1) // size + 1):
+                left = start_x + round(tile_x * size * scale)
+                right = start_x + round(min((tile_x + 1) * size, maze.width) * scale)
+                if right <= left or bottom <= top:
+                    continue
+
+                tile_key = (tile_x, tile_y, level)
+                visible.add(tile_key)
+                scaled_key = tile_key + (right - left, bottom - top)
+                surface = self._scaled.get(scaled_key)
+                if surface is not None:
+                    self._scaled.move_to_end(scaled_key)
+                else:
+                    tile = self._get_tile(tile_key)
+                    if tile is None:
+                        self.incomplete = True
+                        self._draw_fallback(screen, tile_key, pygame.Rect(left, top, right - left, bottom - top))
+                        continue
+                    surface = pygame.transform.scale(tile, (right - left, bottom - top))
+                    self._store(self._scaled, scaled_key, surface)
+
+                screen.blit(surface, (left, top))
+
+        # Tiles que saíram da tela antes de começarem a ser gerados não são mais necessários
+        for tile_key in list(self._pending):
+            if tile_key not in visible and self._pending[tile_key].cancel():
+                del self._pending[tile_key]
+
+    def _get_tile(self, tile_key):
+        """
+        Retorna a superfície de um tile, ou None se ainda estiver sendo gerada (a geração
+        é agendada na primeira vez que o tile é pedido).
+        """
+        tile = self._tiles.get(tile_key)
+        if tile is not None:
+            self._tiles.move_to_end(tile_key)
+            return tile
+
+        future = self._pending.get(tile_key)
+        if future is None:
+            self._pending[tile_key] = self._executor.submit(
+                render_tile_colors, self._codes, self.tile_pixels, *tile_key)
+            return None
+        if not future.done():
+            return None
+
+        del self._pending[tile_key]
+        # surfarray usa eixos (x, y); o tile está em (linha, coluna)
+        tile = pygame.surfarray.make_surface(future.result().transpose(1, 0, 2))
+        self._store(self._tiles, tile_key, tile)
+        return tile
+
+    def _draw_fallback(self, screen, tile_key, rect):
+        """
+        Desenha, no lugar de um tile ainda não gerado, a parte correspondente de um tile
+        mais grosseiro já disponível (se houver).
+        """
+        tile_x, tile_y, level = tile_key
+        for up in range(1, FALLBACK_LEVELS + 1):
+            parent = self._tiles.get((tile_x >> up, tile_y >> up, level + up))
+            if parent is None:
+                continue
+            # Cada tile do nível atual ocupa 1/2^up do lado do tile mais grosseiro
+            part = self.tile_pixels >> up
+            source = pygame.Rect((tile_x % (1 << up)) * part, (tile_y % (1 << up)) * part, part, part)
+            source = source.clip(parent.get_rect())
+            if source.width and source.height:
+                screen.blit(pygame.transform.scale(parent.subsurface(source), rect.size), rect)
+            return
+
+    def _store(self, cache, key, surface):
+        """
+        Insere uma superfície em um cache LRU, descartando as usadas há mais tempo.
+        """
+        cache[key] = surface
+        while len(cache) > self.max_tiles:
+            cache.popitem(last=False)
@@ -1,8 +1,22 @@
+import math
 import pygame
 from utils.config import *
 from enums.colour import *
 from enums.maze_size import MazeSize
 from enums.algorithms import Algorithm
+from utils.visit_history import VisitHistory
+from ui.bulk_rasterizer import BulkRasterizer
+from ui.cell_buckets import CellBuckets
+from ui.text_cache import TextCache
+from ui.tile_renderer import TileRenderer
+from ui.visited_overlay import VisitedOverlay
+
+# Cor de cada código de célula (0 caminho, 1 parede, 2 início, 3 fim), usada como paleta
+# da superfície pré-renderizada do labirinto
+CELL_PALETTE = [WHITE, BLACK, GREEN, RED]
+
+# Tamanho de célula (em pixels) a partir do qual o labirinto é desenhado em lote, com NumPy
+BULK_CELL_SIZE = 3
 
 class UI:
     """
@@ -12,6 +26,8 @@ class UI:
         screen (pygame.Surface): Superfície onde a interface será desenhada.
         font (pygame.font.Font): Fonte usada para textos principais.
         small_font (pygame.font.Font): Fonte usada para textos secundários.
+        stats_font (pygame.font.Font): Fonte usada no painel de estatísticas.
+        text_cache (TextCache): Textos já renderizados (ver TextCache).
         tabs (dict): Dicionário que armazena os retângulos das abas para detecção de clique.
     """
 
@@ -26,6 +42,7 @@ class UI:
         self.screen = screen
         self.font = pygame.font.Font(font_path, 20)
         self.small_font = pygame.font.Font(font_path, 16)
+        self.stats_font = pygame.font.Font(font_path, 18)
         self.tabs = {}
         self.algorithm_buttons = {}
         self.font_path = font_path
@@ -41,8 +58,43 @@ class UI:
         self.border_color = (200, 200, 200)  # Cinza claro para bordas
         self.show_solution = False
 
+        # Superfícies em cache do labirinto: uma com 1 pixel por célula (refeita apenas quando
+        # o labirinto muda), a parte visível dela ampliada para o tamanho de célula atual e a
+        # grade correspondente
+        self._maze_surface_key = None
+        self._maze_surface = None
+        self._maze_view_key = None
+        self._maze_view = None
+        self._grid_view_key = None
+        self._grid_view = None
+
+        # Camadas de células visitadas por (aba, algoritmo), atualizadas incrementalmente
+        # conforme o slider se move, e a parte visível da camada atual ampliada
+        self._visited_overlays = {}
+        self._visited_view_key = None
+        self._visited_view = None
+
+        # Índices espaciais das células visitadas e da solução exibidas (ver CellBuckets)
+        self._cell_buckets = {}
+
+        # Desenho em lote para células de poucos pixels e por tiles para labirintos que
+        # não cabem na tela
+        self._bulk_rasterizer = BulkRasterizer()
+        self._tile_renderer = TileRenderer(TAMANHO_TILE, LIMITE_TILES)
+        self.needs_redraw = False  # True se o último quadro deixou tiles por gerar
+
+        # Textos renderizados em cache; os fixos são pré-renderizados aqui, junto com os
+        # sprites das abas já no tamanho desenhado
+        self.text_cache = TextCache(LIMITE_TEXTOS)
+        self.text_cache.preload(self.font, ["Controles", "Relatório", "Gerando labirinto..."], self.text_color)
+        self.text_cache.preload(self.font, [size.display_name for size in MazeSize], BLACK)
+        self.text_cache.preload(self.small_font, ["Mostrar Passo a Passo", "Cancelar"], self.text_color)
+        self.text_cache.preload(
+            self.small_font, [algorithm.display_name for algorithm in Algorithm], self.text_color)
+        self._scaled_sprites = {}
+
     def draw_maze(self, maze, current_tab, current_algorithm, zoom_level, offset_x, offset_y, show_visited,
-        solutions, visited_cells, statistics, visited_history, sliders):
+        solutions, visited_cells, statistics, visited_history, sliders, report=None):
         """
         Desenha o labirinto na tela.
 
@@ -59,21 +111,31 @@ class UI:
             statistics (dict): Dicionário com estatísticas de execução dos algoritmos.
             visited_history (dict): Dicionário com todas as etapas executada pelo algoritmo.
             sliders (dict): Dicionário com os steppers gerados para cada algoritmo.
+            report (ReportRunner, opcional): Execução do relatório exibida na aba REPORT.
         """
         if current_tab == MazeSize.REPORT:
             # Modo de relatório: limpa a tela e exibe o relatório
             self.screen.fill(WHITE)
-            print("TELA REPORT")  # TODO: Implementar tela de relatório
+            self._draw_report(report)
             return
 
         if maze is None:
+            # Labirinto ainda sendo gerado em segundo plano: aviso no lugar do labirinto
+            self._draw_generating()
+            self.draw_sidebar(min(800, LARGURA_TELA - 400), current_algorithm, current_tab, statistics,
+                              show_visited, zoom_level, visited_history, sliders)
             return
 
-        base_cell_size = min(600 // maze.width, 600 // maze.height)
-        cell_size = max(1, int(base_cell_size * zoom_level))
+        self.needs_redraw = False
+        base_cell_size = self.base_cell_size(maze)
+        scale = base_cell_size * zoom_level
+        # Labirintos maiores que a área podem ficar com menos de 1 pixel por célula
+        # (desenhados por tiles); os demais mantêm células inteiras de pelo menos 1 pixel
+        tiled = base_cell_size < 1 and scale < 1
+        cell_size = scale if tiled else max(1, int(scale))
 
-        total_width = maze.width * cell_size
-        total_height = maze.height * cell_size
+        total_width = int(maze.width * cell_size)
+        total_height = int(maze.height * cell_size)
 
         maze_area_width = min(800, LARGURA_TELA - 400)
         maze_area_height = ALTURA_TELA - 45
@@ -88,37 +150,125 @@ class UI:
 
         self._draw_dashed_borders(maze_area_width, maze_area_height)
 
-        self._draw_maze_cells(maze, cell_size, start_x, start_y, maze_area_width, maze_area_height)
-
-        if show_visited and current_algorithm in visited_cells[current_tab] and not self.show_solution:
-            if (current_algorithm in visited_history[current_tab] and 
-                current_algorithm in sliders[current_tab]):
-                
-                history = visited_history[current_tab][current_algorithm]
-                step = sliders[current_tab][current_algorithm].value
-                self._draw_visited_cells(history, maze, cell_size, start_x, start_y, step)
+        # Retângulo de células visíveis, calculado uma única vez por quadro
+        view = self._visible_cells(maze, cell_size, start_x, start_y, maze_area_width, maze_area_height)
+        # Restringe o desenho à área do labirinto (dentro do recorte já definido por quem chama)
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(previous_clip.clip(pygame.Rect(0, 45, maze_area_width, maze_area_height)))
+
+        # Camadas exibidas: células visitadas (histórico até o passo do slider ou conjunto
+        # completo) e solução
+        # Durante uma execução em segundo plano só há o histórico parcial e o slider (sem
+        # solução nem conjunto de visitadas)
+        visited, step, path = None, None, None
+        history = visited_history[current_tab].get(current_algorithm)
+        slider = sliders[current_tab].get(current_algorithm)
+        if show_visited and not self.show_solution:
+            if history is not None and slider is not None:
+                visited, step = history, slider.value
             else:
-                self._draw_visited_cells(
-                    visited_cells[current_tab][current_algorithm], 
-                    maze, cell_size, start_x, start_y
-                )
+                visited = visited_cells[current_tab].get(current_algorithm)
 
         if (self.show_solution or (current_algorithm in solutions[current_tab] and 
-        (not show_visited or sliders[current_tab][current_algorithm].value == len(history) - 1))):
+        (not show_visited or (slider is not None and slider.value == len(history) - 1)))):
             if(current_algorithm != None):
                 if(self.show_solution):
-                    self._draw_visited_cells(
-                    visited_cells[current_tab][current_algorithm], 
-                    maze, cell_size, start_x, start_y
-                )
-                self._draw_solution(solutions[current_tab][current_algorithm], maze, cell_size, start_x, start_y)
-                
+                    if history is not None:
+                        visited, step = history, len(history) - 1
+                    else:
+                        visited = visited_cells[current_tab].get(current_algorithm)
+                path = solutions[current_tab].get(current_algorithm)
+
+        if tiled:
+            # Menos de 1 pixel por célula: tiles em nível de detalhe reduzido + camadas
+            self._tile_renderer.draw(self.screen, maze, cell_size, start_x, start_y, view)
+            self._bulk_rasterizer.draw_pooled(
+                self.screen, maze, visited, step, path, cell_size,
+                TileRenderer.level_for(cell_size), start_x, start_y, view)
+            self._draw_endpoints(maze, cell_size, start_x, start_y)
+            self.needs_redraw = self._tile_renderer.incomplete
+        elif cell_size <= BULK_CELL_SIZE:
+            # Células de poucos pixels: quadro inteiro montado em lote (ver BulkRasterizer)
+            self._bulk_rasterizer.draw(
+                self.screen, maze, visited, step, path, cell_size, start_x, start_y, view)
+        else:
+            self._draw_maze_cells(maze, cell_size, start_x, start_y, view)
+
+            if isinstance(visited, VisitHistory):
+                overlay = self._get_visited_overlay(current_tab, current_algorithm, maze, visited)
+                overlay.move_to(step)
+                self._draw_visited_overlay(overlay, cell_size, start_x, start_y, view)
+            elif visited is not None:
+                self._draw_visited_cells(visited, maze, cell_size, start_x, start_y, view)
+
+            if path is not None:
+                self._draw_solution(path, maze, cell_size, start_x, start_y, view)
 
         if cell_size >= 5:
-            self._draw_grid(maze, cell_size, start_x, start_y)
+            self._draw_grid(cell_size, start_x, start_y, view)
+
+        self.screen.set_clip(previous_clip)
 
         self.draw_sidebar(maze_area_width, current_algorithm, current_tab, statistics, show_visited, zoom_level, visited_history, sliders)
 
+    def _draw_report(self, report):
+        """
+        Desenha a tabela do relatório com os resultados já recebidos dos processos.
+
+        Args:
+            report (ReportRunner): Execução do relatório (None se ainda não iniciada).
+        """
+        if report is None:
+            return
+
+        x, y = 30, 70
+        title = self.text_cache.render(self.font, "Relatório", self.text_color)
+        self.screen.blit(title, (x, y))
+
+        status = "concluído" if report.done else "executando"
+        progress = self.text_cache.render(
+            self.small_font, f"Execuções: {len(report.results)}/{report.total} ({status}) - "
+            f"{len(report.seeds)} labirintos por tamanho", self.text_color)
+        self.screen.blit(progress, (x, y + 30))
+
+        summary = report.summary()
+        name_width, column_width, row_height = 220, 170, 50
+        header_y = y + 70
+
+        for i, size in enumerate(report.sizes):
+            header = self.text_cache.render(self.small_font, size.display_name, self.text_color)
+            self.screen.blit(header, (x + name_width + i * column_width, header_y))
+        pygame.draw.line(self.screen, self.border_color, (x, header_y + 25),
+                         (x + name_width + len(report.sizes) * column_width, header_y + 25), 1)
+
+        for row, algorithm in enumerate(report.algorithms):
+            row_y = header_y + 35 + row * row_height
+            name = self.text_cache.render(self.small_font, algorithm.display_name, self.text_color)
+            self.screen.blit(name, (x, row_y))
+
+            for i, size in enumerate(report.sizes):
+                entry = summary.get((size, algorithm))
+                if entry is None:
+                    continue
+                cell_x = x + name_width + i * column_width
+                time_text = self.text_cache.render(self.small_font, f"{entry['time_ms']:.2f} ms", self.text_color)
+                visited_text = self.text_cache.render(
+                    self.small_font, f"{entry['visited_count']:.0f} visitadas", self.text_color)
+                self.screen.blit(time_text, (cell_x, row_y))
+                self.screen.blit(visited_text, (cell_x, row_y + 20))
+
+    def _draw_generating(self):
+        """
+        Desenha a área do labirinto com o aviso de que ele ainda está sendo gerado.
+        """
+        maze_area_width = min(800, LARGURA_TELA - 400)
+        maze_area_height = ALTURA_TELA - 45
+        self._draw_maze_background(maze_area_width, maze_area_height)
+        self._draw_dashed_borders(maze_area_width, maze_area_height)
+
+        text = self.text_cache.render(self.font, "Gerando labirinto...", self.text_color)
+        self.screen.blit(text, text.get_rect(center=(maze_area_width // 2, 45 + maze_area_height // 2)))
+
     def _draw_maze_background(self, maze_area_width, maze_area_height):
         """
         Desenha o fundo da área do labirinto.
@@ -148,81 +298,242 @@ class UI:
             pygame.draw.line(self.screen, BLACK, (0, y), (0, y + dash_length), 2)  # Esquerda
             pygame.draw.line(self.screen, BLACK, (maze_area_width, y), (maze_area_width, y + dash_length), 2)  # Direita
 
-    def _draw_maze_cells(self, maze, cell_size, start_x, start_y, maze_area_width, maze_area_height):
+    @staticmethod
+    def base_cell_size(maze):
         """
-        Desenha as células do labirinto.
+        Retorna o tamanho de célula (em pixels) com zoom 1: o maior inteiro que faz o
+        labirinto caber em 600 px ou, se nem 1 pixel por célula couber, a escala fracionária.
 
         Args:
             maze (Maze): Objeto do labirinto.
-            cell_size (int): Tamanho de cada célula.
+
+        Returns:
+            int | float: Pixels por célula com zoom 1.
+        """
+        base_cell_size = min(600 // maze.width, 600 // maze.height)
+        if base_cell_size == 0:
+            return 600 / max(maze.width, maze.height)
+        return base_cell_size
+
+    @classmethod
+    def max_zoom(cls, maze):
+        """
+        Retorna o zoom máximo: 5x ou o necessário para chegar a células de 30 pixels.
+
+        Args:
+            maze (Maze): Objeto do labirinto.
+
+        Returns:
+            float: Zoom máximo permitido.
+        """
+        return max(5.0, 30 / cls.base_cell_size(maze))
+
+    def _draw_endpoints(self, maze, scale, start_x, start_y):
+        """
+        Destaca o início e o fim com pelo menos 3 pixels quando as células são menores
+        que 1 pixel (nos tiles eles se perdem na média dos blocos).
+        """
+        size = max(3, round(scale))
+        for position, color in ((maze.start, GREEN), (maze.end, RED)):
+            rect = pygame.Rect(0, 0, size, size)
+            rect.center = (start_x + int(position[0] * scale), start_y + int(position[1] * scale))
+            pygame.draw.rect(self.screen, color, rect)
+
+    def _visible_cells(self, maze, cell_size, start_x, start_y, maze_area_width, maze_area_height):
+        """
+        Calcula o retângulo de células que aparecem na área do labirinto.
+
+        Args:
+            maze (Maze): Objeto do labirinto.
+            cell_size (int | float): Tamanho de cada célula (fracionário abaixo de 1 pixel).
             start_x (int): Posição inicial X do labirinto.
             start_y (int): Posição inicial Y do labirinto.
             maze_area_width (int): Largura da área do labirinto.
             maze_area_height (int): Altura da área do labirinto.
+
+        Returns:
+            tuple | None: (first_x, first_y, last_x, last_y), com os limites finais exclusivos,
+            ou None se nenhuma célula estiver visível.
         """
-        for y in range(maze.height):
-            for x in range(maze.width):
-                rect_x = start_x + x * cell_size
-                rect_y = start_y + y * cell_size
+        first_x = max(0, math.floor(-start_x / cell_size))
+        first_y = max(0, math.floor((45 - start_y) / cell_size))
+        last_x = min(maze.width, math.floor((maze_area_width - start_x) / cell_size) + 1)
+        last_y = min(maze.height, math.floor((maze_area_height + 45 - start_y) / cell_size) + 1)
+        if first_x >= last_x or first_y >= last_y:
+            return None
+        return first_x, first_y, last_x, last_y
+
+    def _get_maze_surface(self, maze):
+        """
+        Retorna o labirinto rasterizado com 1 pixel por célula.
 
-                if (rect_x + cell_size < 0 or rect_x > maze_area_width or
-                    rect_y + cell_size < 45 or rect_y > maze_area_height + 45):
-                    continue
+        A superfície usa as próprias células do labirinto como pixels de 8 bits, com
+        CELL_PALETTE como paleta, e só é refeita quando o labirinto (ou sua revisão) muda.
+
+        Args:
+            maze (Maze): Objeto do labirinto.
+
+        Returns:
+            pygame.Surface: Superfície de maze.width x maze.height pixels.
+        """
+        key = (maze, maze.revision)
+        if self._maze_surface_key != key:
+            surface = pygame.image.frombytes(bytes(maze.cells), (maze.width, maze.height), "P")
+            surface.set_palette(CELL_PALETTE)
+            self._maze_surface_key = key
+            self._maze_surface = surface
+        return self._maze_surface
+
+    def _draw_maze_cells(self, maze, cell_size, start_x, start_y, view):
+        """
+        Desenha as células do labirinto.
+
+        Ampliar a superfície de 1 pixel por célula já produz blocos de cell_size pixels por
+        célula; apenas a parte visível é ampliada e o resultado fica em cache enquanto o
+        labirinto, o zoom e o retângulo visível não mudam.
+
+        Args:
+            maze (Maze): Objeto do labirinto.
+            cell_size (int): Tamanho de cada célula.
+            start_x (int): Posição inicial X do labirinto.
+            start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (ver _visible_cells).
+        """
+        if view is None:
+            return
+        first_x, first_y, last_x, last_y = view
 
-                if maze.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLACK, (rect_x, rect_y, cell_size, cell_size))
-                elif maze.grid[y][x] == 0:
-                    pygame.draw.rect(self.screen, WHITE, (rect_x, rect_y, cell_size, cell_size))
-                elif maze.grid[y][x] == 2:
-                    pygame.draw.rect(self.screen, GREEN, (rect_x, rect_y, cell_size, cell_size))
-                elif maze.grid[y][x] == 3:
-                    pygame.draw.rect(self.screen, RED, (rect_x, rect_y, cell_size, cell_size))
+        key = (maze, maze.revision, cell_size, view)
+        if self._maze_view_key != key:
+            visible = self._get_maze_surface(maze).subsurface(
+                (first_x, first_y, last_x - first_x, last_y - first_y))
+            self._maze_view = pygame.transform.scale(
+                visible, ((last_x - first_x) * cell_size, (last_y - first_y) * cell_size))
+            self._maze_view_key = key
 
-    def _draw_grid(self, maze, cell_size, start_x, start_y):
+        self.screen.blit(self._maze_view, (start_x + first_x * cell_size, start_y + first_y * cell_size))
+
+    def _draw_grid(self, cell_size, start_x, start_y, view):
         """
-        Desenha a grade do labirinto.
+        Desenha a grade do labirinto sobre as células visíveis.
+
+        As linhas são desenhadas uma única vez em uma superfície transparente (colorkey),
+        reaproveitada enquanto o tamanho de célula e a quantidade de células visíveis não mudam.
 
         Args:
+            cell_size (int): Tamanho de cada célula.
+            start_x (int): Posição inicial X do labirinto.
+            start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (ver _visible_cells).
+        """
+        if view is None:
+            return
+        first_x, first_y, last_x, last_y = view
+        columns, rows = last_x - first_x, last_y - first_y
+
+        key = (cell_size, columns, rows)
+        if self._grid_view_key != key:
+            width, height = columns * cell_size, rows * cell_size
+            grid = pygame.Surface((width + 1, height + 1))
+            grid.fill(BLACK)
+            grid.set_colorkey(BLACK)
+            for y in range(rows + 1):
+                pygame.draw.line(grid, GRAY, (0, y * cell_size), (width, y * cell_size), 1)
+            for x in range(columns + 1):
+                pygame.draw.line(grid, GRAY, (x * cell_size, 0), (x * cell_size, height), 1)
+            self._grid_view_key = key
+            self._grid_view = grid
+
+        self.screen.blit(self._grid_view, (start_x + first_x * cell_size, start_y + first_y * cell_size))
+
+    def _get_visited_overlay(self, tab, algorithm, maze, history):
+        """
+        Retorna a camada de células visitadas de uma aba e algoritmo, criando uma nova
+        quando o labirinto ou o histórico mudaram (nova geração ou nova execução).
+
+        Args:
+            tab (MazeSize): Aba do labirinto.
+            algorithm (Algorithm): Algoritmo exibido.
             maze (Maze): Objeto do labirinto.
+            history (VisitHistory): Histórico de visitas do algoritmo.
+
+        Returns:
+            VisitedOverlay: Camada persistente da aba e algoritmo.
+        """
+        overlay = self._visited_overlays.get((tab, algorithm))
+        if overlay is None or overlay.maze is not maze or overlay.history is not history:
+            overlay = VisitedOverlay(maze, history, LIGHT_CYAN)
+            self._visited_overlays[(tab, algorithm)] = overlay
+        return overlay
+
+    def _draw_visited_overlay(self, overlay, cell_size, start_x, start_y, view):
+        """
+        Desenha a parte visível de uma camada de células visitadas.
+
+        A ampliação fica em cache enquanto a camada, o zoom e o retângulo visível não mudam,
+        de modo que um quadro sem movimento do slider é apenas um blit.
+
+        Args:
+            overlay (VisitedOverlay): Camada a desenhar.
             cell_size (int): Tamanho de cada célula.
             start_x (int): Posição inicial X do labirinto.
             start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (ver _visible_cells).
         """
-        for y in range(maze.height + 1):
-            pygame.draw.line(self.screen, GRAY, 
-                            (start_x, start_y + y * cell_size),
-                            (start_x + maze.width * cell_size, start_y + y * cell_size), 1)
-        for x in range(maze.width + 1):
-            pygame.draw.line(self.screen, GRAY,
-                            (start_x + x * cell_size, start_y),
-                            (start_x + x * cell_size, start_y + maze.height * cell_size), 1)
+        if view is None:
+            return
+        first_x, first_y, last_x, last_y = view
+
+        key = (overlay, overlay.version, cell_size, view)
+        if self._visited_view_key != key:
+            visible = overlay.surface.subsurface((first_x, first_y, last_x - first_x, last_y - first_y))
+            self._visited_view = pygame.transform.scale(
+                visible, ((last_x - first_x) * cell_size, (last_y - first_y) * cell_size))
+            self._visited_view_key = key
+
+        self.screen.blit(self._visited_view, (start_x + first_x * cell_size, start_y + first_y * cell_size))
 
-    def _draw_visited_cells(self, visited, maze, cell_size, start_x, start_y, step=None):
+    def _get_cell_buckets(self, role, cells):
         """
-        Desenha as células visitadas, opcionalmente limitando ao passo especificado pelo slider.
+        Retorna o índice espacial de um conjunto de células, reconstruído apenas quando o
+        objeto muda (nova solução ou novo conjunto de visitados).
 
         Args:
-            visited (list ou list[set]): Lista de células visitadas ou histórico de visitas.
+            role (str): Papel do conjunto ("visited" ou "path"), um índice em cache por papel.
+            cells (iterable): Células indexadas.
+
+        Returns:
+            CellBuckets: Índice das células.
+        """
+        cached = self._cell_buckets.get(role)
+        if cached is None or cached[0] is not cells:
+            cached = (cells, CellBuckets(cells))
+            self._cell_buckets[role] = cached
+        return cached[1]
+
+    def _draw_visited_cells(self, visited, maze, cell_size, start_x, start_y, view):
+        """
+        Desenha as células visitadas que estão no retângulo visível.
+
+        Args:
+            visited (set): Conjunto de células visitadas.
             maze (Maze): Objeto do labirinto.
             cell_size (int): Tamanho de cada célula.
             start_x (int): Posição inicial X do labirinto.
             start_y (int): Posição inicial Y do labirinto.
-            step (int, opcional): Passo específico a ser mostrado, para uso com o slider.
+            view (tuple | None): Retângulo de células visíveis (ver _visible_cells).
         """
-        # Determina quais células desenhar com base no passo do slider
-        cells_to_draw = visited
-        if isinstance(visited, list) and step is not None and step < len(visited):
-            cells_to_draw = visited[step]
-        
-        for pos in cells_to_draw:
+        if view is None:
+            return
+        for pos in self._get_cell_buckets("visited", visited).query(*view):
             if pos != maze.start and pos != maze.end:
                 rect_x = start_x + pos[0] * cell_size
                 rect_y = start_y + pos[1] * cell_size
                 pygame.draw.rect(self.screen, LIGHT_CYAN, (rect_x, rect_y, cell_size, cell_size))
 
-    def _draw_solution(self, path, maze, cell_size, start_x, start_y):
+    def _draw_solution(self, path, maze, cell_size, start_x, start_y, view):
         """
-        Desenha a solução do labirinto.
+        Desenha as células da solução que estão no retângulo visível.
 
         Args:
             path (list): Lista de células que compõem a solução.
@@ -230,8 +541,11 @@ class UI:
             cell_size (int): Tamanho de cada célula.
             start_x (int): Posição inicial X do labirinto.
             start_y (int): Posição inicial Y do labirinto.
+            view (tuple | None): Retângulo de células visíveis (ver _visible_cells).
         """
-        for pos in path:
+        if view is None:
+            return
+        for pos in self._get_cell_buckets("path", path).query(*view):
             if pos != maze.start and pos != maze.end:
                 rect_x = start_x + pos[0] * cell_size
                 rect_y = start_y + pos[1] * cell_size
@@ -249,11 +563,11 @@ class UI:
         pygame.draw.line(self.screen, self.border_color, (start_x, 45), (start_x, ALTURA_TELA), 2)
         
         # Título
-        title = self.font.render("Controles", True, self.text_color)
+        title = self.text_cache.render(self.font, "Controles", self.text_color)
         self.screen.blit(title, (start_x + 20, 65))
 
         # Toggle button para o slider
-        toggle_text = self.small_font.render("Mostrar Passo a Passo", True, self.text_color)
+        toggle_text = self.text_cache.render(self.small_font, "Mostrar Passo a Passo", self.text_color)
         self.screen.blit(toggle_text, (start_x + 20, ALTURA_TELA - 100))
         
         # Desenha o botão toggle
@@ -269,13 +583,62 @@ class UI:
             slider = sliders[current_tab][current_algorithm]
             history = visited_history[current_tab][current_algorithm]
             
-            steps_text = self.font.render(f"Passo: {slider.value + 1}/{slider.max_val + 1}", True, self.text_color)
+            steps_text = self.text_cache.render(
+                self.font, f"Passo: {slider.value + 1}/{slider.max_val + 1}", self.text_color)
             self.screen.blit(steps_text, (start_x + 20, ALTURA_TELA - 68))
             
             slider.draw(self.screen)
         else:
             self.show_solution = True;
 
+    def draw_playback_controls(self, surface, playback):
+        """
+        Desenha os botões da reprodução animada ao lado do contador de passos: a
+        velocidade atual (clique para trocar) e reproduzir/pausar.
+
+        Args:
+            surface (pygame.Surface): Superfície de destino.
+            playback (Playback): Estado da reprodução.
+        """
+        start_x = LARGURA_TELA - 400
+        self.speed_button_rect = pygame.Rect(start_x + 250, ALTURA_TELA - 70, 80, 28)
+        self.play_button_rect = pygame.Rect(start_x + 340, ALTURA_TELA - 70, 28, 28)
+
+        for rect in (self.speed_button_rect, self.play_button_rect):
+            pygame.draw.rect(surface, self.button_color, rect, border_radius=6)
+            pygame.draw.rect(surface, self.border_color, rect, 1, border_radius=6)
+
+        speed_text = self.text_cache.render(self.small_font, f"{playback.steps_per_second}/s", self.text_color)
+        surface.blit(speed_text, speed_text.get_rect(center=self.speed_button_rect.center))
+
+        center_x, center_y = self.play_button_rect.center
+        if playback.playing:
+            # Pausar: duas barras
+            pygame.draw.rect(surface, self.text_color, (center_x - 6, center_y - 7, 4, 14))
+            pygame.draw.rect(surface, self.text_color, (center_x + 2, center_y - 7, 4, 14))
+        else:
+            # Reproduzir: triângulo
+            pygame.draw.polygon(surface, self.text_color, [
+                (center_x - 5, center_y - 8), (center_x - 5, center_y + 8), (center_x + 7, center_y)
+            ])
+
+    def draw_custom_size_button(self, surface, dimensions):
+        """
+        Desenha o botão que troca as dimensões do labirinto personalizado (aba CUSTOM),
+        com as dimensões atuais (clique para passar às próximas).
+
+        Args:
+            surface (pygame.Surface): Superfície de destino.
+            dimensions (tuple): Dimensões atuais do labirinto personalizado.
+        """
+        start_x = LARGURA_TELA - 400
+        self.custom_size_button_rect = pygame.Rect(start_x + 140, 62, 110, 28)
+        pygame.draw.rect(surface, self.button_color, self.custom_size_button_rect, border_radius=6)
+        pygame.draw.rect(surface, self.border_color, self.custom_size_button_rect, 1, border_radius=6)
+
+        size_text = self.text_cache.render(self.small_font, "{}x{}".format(*dimensions), self.text_color)
+        surface.blit(size_text, size_text.get_rect(center=self.custom_size_button_rect.center))
+
     def draw_toggle_check(self, surface, rect, checked):
         """Desenha o check mark no botão toggle"""
         if checked:
@@ -309,15 +672,27 @@ class UI:
             else:
                 sprite = sprites['sprite_normal_tab']
 
-            scaled_sprite = pygame.transform.scale(sprite, (tab_btn.width, tab_btn.height))
+            scaled_sprite = self._get_scaled_sprite(sprite, tab_btn.size)
             self.screen.blit(scaled_sprite, tab_btn)
 
-            text = self.font.render(f"{size.display_name}", True, BLACK)
+            text = self.text_cache.render(self.font, size.display_name, BLACK)
             text_rect = text.get_rect(center=(tab_btn.centerx, tab_btn.centery))
             self.screen.blit(text, text_rect)
 
             self.tabs[size] = tab_btn
 
+    def _get_scaled_sprite(self, sprite, size):
+        """
+        Retorna um sprite ampliado para o tamanho informado, redimensionando-o apenas na
+        primeira vez.
+        """
+        key = (sprite, size)
+        scaled = self._scaled_sprites.get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(sprite, size)
+            self._scaled_sprites[key] = scaled
+        return scaled
+
     def draw_algorithm_buttons(self, current_algorithm, sprites):
         """Desenha os botões de algoritmo com estilo moderno"""
         button_width = 250
@@ -344,7 +719,7 @@ class UI:
             pygame.draw.rect(self.screen, self.border_color, button, 1, border_radius=10)  # Borda suave
             
             # Texto do botão
-            text = self.small_font.render(f"{algorithm.display_name}", True, self.text_color)
+            text = self.text_cache.render(self.small_font, algorithm.display_name, self.text_color)
             text_rect = text.get_rect(center=(button.centerx, button.centery))
             self.screen.blit(text, text_rect)
             
@@ -388,24 +763,71 @@ class UI:
                         (start_x + width//2, start_y + height//2 + plus_size//2),
                         plus_thickness)
 
+    def draw_solve_progress(self, screen, job, x, y):
+        """
+        Desenha o progresso de um solver executando em segundo plano, com o botão de cancelar.
+
+        Args:
+            screen (pygame.Surface): Superfície de destino.
+            job (SolveJob): Execução em andamento.
+            x (int): Posição X do painel.
+            y (int): Posição Y do painel.
+        """
+        history = job.history
+        lines = [
+            f"• Executando: {job.algorithm.display_name}",
+            f"• Tempo: {job.elapsed_ms / 1000:.1f} s",
+            f"• Nós expandidos: {job.metrics.expanded}",
+            f"• Células visitadas: {len(history.order) if history is not None else 0}",
+        ]
+
+        # Container no mesmo estilo das estatísticas
+        progress_rect = pygame.Rect(x - 10, y - 10, 360, 25 * len(lines) + 50)
+        pygame.draw.rect(screen, self.primary_color, progress_rect, border_radius=10)
+        pygame.draw.rect(screen, self.border_color, progress_rect, 1, border_radius=10)
+
+        for i, line in enumerate(lines):
+            screen.blit(self.text_cache.render(self.stats_font, line, self.text_color), (x, y + 25 * i))
+
+        self.cancel_button_rect = pygame.Rect(x, y + 25 * len(lines) + 5, 100, 28)
+        pygame.draw.rect(screen, self.button_color, self.cancel_button_rect, border_radius=6)
+        pygame.draw.rect(screen, self.border_color, self.cancel_button_rect, 1, border_radius=6)
+        cancel_text = self.text_cache.render(self.small_font, "Cancelar", self.text_color)
+        screen.blit(cancel_text, cancel_text.get_rect(center=self.cancel_button_rect.center))
+
     def draw_statistics(self, screen, stats, x, y):
         """Desenha as estatísticas com estilo moderno"""
         if not stats:
             return
 
+        # Métricas detalhadas (presentes quando a execução veio do Benchmark.measure)
+        details = []
+        if 'expanded' in stats:
+            if stats.get('history_ms') is not None:  # Só nos solvers que medem o histórico
+                details.append(f"• Busca: {stats['search_ms']:.2f} ms | Histórico: {stats['history_ms']:.2f} ms")
+            details.append(f"• Nós expandidos: {stats['expanded']}")
+            details.append(f"• Push/Pop: {stats['pushes']} / {stats['pops']}")
+            details.append(f"• Maior fronteira: {stats['max_frontier']}")
+            if stats.get('peak_memory_kb') is not None:
+                details.append(f"• Pico de memória: {stats['peak_memory_kb']:.1f} KB")
+
         # Container para estatísticas
-        stats_rect = pygame.Rect(x - 10, y - 10, 300, 100)
+        stats_rect = pygame.Rect(x - 10, y - 10, 360, 85 + 22 * len(details))
         pygame.draw.rect(screen, self.primary_color, stats_rect, border_radius=10)
         pygame.draw.rect(screen, self.border_color, stats_rect, 1, border_radius=10)  # Borda suave
 
-        font = pygame.font.Font(self.font_path, 18)
+        font = self.stats_font
         
         # Estatísticas com marcadores
-        visited_text = font.render(f"• Células visitadas: {stats['visited_count']}", True, self.text_color)
-        time_text = font.render(f"• Tempo: {stats['time_taken']:.2f} ms", True, self.text_color)
-        path_text = font.render(f"• Tamanho do caminho: {stats['path_length']}", True, self.text_color)
+        visited_text = self.text_cache.render(font, f"• Células visitadas: {stats['visited_count']}", self.text_color)
+        time_text = self.text_cache.render(font, f"• Tempo: {stats['time_taken']:.2f} ms", self.text_color)
+        path_text = self.text_cache.render(font, f"• Tamanho do caminho: {stats['path_length']}", self.text_color)
 
         screen.blit(visited_text, (x, y))
         screen.blit(time_text, (x, y + 25))
         screen.blit(path_text, (x, y + 50))
 
+        for i, detail in enumerate(details):
+            detail_text = self.text_cache.render(self.small_font, detail, self.text_color)
+            screen.blit(detail_text, (x, y + 75 + 22 * i))
+
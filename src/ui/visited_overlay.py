@@ -0,0 +1,70 @@
+import pygame
+from enums.colour import BLACK
+
+
+class VisitedOverlay:
+    """
+    Camada com as células visitadas de um histórico, desenhada com 1 pixel por célula.
+
+    A camada guarda o passo que está pintado; ao mudar de passo, apenas as células
+    visitadas entre o passo anterior e o novo são pintadas (avançando) ou apagadas
+    (voltando). Sem mudança de passo, nada é redesenhado.
+
+    Atributos:
+        maze (Maze): Labirinto ao qual o histórico pertence.
+        history (VisitHistory): Histórico de visitas exibido.
+        surface (pygame.Surface): Camada com maze.width x maze.height pixels, transparente
+            (colorkey) onde a célula ainda não foi visitada.
+        step (int | None): Passo atualmente pintado (None antes da primeira pintura).
+        version (int): Incrementado a cada alteração da camada, para invalidar caches.
+    """
+
+    def __init__(self, maze, history, color):
+        """
+        Inicializa a camada vazia.
+
+        Args:
+            maze (Maze): Labirinto ao qual o histórico pertence.
+            history (VisitHistory): Histórico de visitas exibido.
+            color (tuple): Cor das células visitadas.
+        """
+        self.maze = maze
+        self.history = history
+        self.color = color
+        self.surface = pygame.Surface((maze.width, maze.height))
+        self.surface.fill(BLACK)
+        self.surface.set_colorkey(BLACK)
+        self.step = None
+        self.version = 0
+
+    def move_to(self, step):
+        """
+        Atualiza a camada para mostrar as células visitadas até o passo informado.
+
+        Args:
+            step (int): Passo desejado (limitado ao último passo do histórico).
+        """
+        step = min(step, len(self.history) - 1)
+        if step == self.step or step < 0:
+            return
+
+        if self.step is None:
+            self._paint(self.history.visited_at(step), self.color)
+        elif step > self.step:
+            self._paint(self.history.delta(self.step, step), self.color)
+        else:
+            self._paint(self.history.delta(step, self.step), BLACK)
+        self.step = step
+        self.version += 1
+
+    def _paint(self, cells, color):
+        """
+        Pinta as células informadas, ignorando o início e o fim do labirinto.
+        """
+        start, end = self.maze.start, self.maze.end
+        set_at = self.surface.set_at
+        self.surface.lock()
+        for cell in cells:
+            if cell != start and cell != end:
+                set_at(cell, color)
+        self.surface.unlock()
@@ -5,9 +5,44 @@ Arquivo de configuração global para o projeto.
 Contém constantes e parâmetros usados em várias partes do sistema.
 """
 
+import os
+
 # Título do projeto exibido na janela principal
 TITULO_PROJETO = "Exploração de Caminhos: Comparação entre Algoritmos de Busca em Labirintos"
 
 # Dimensões da tela (em pixels)
 LARGURA_TELA = 1200
-ALTURA_TELA = 700
\ No newline at end of file
+ALTURA_TELA = 700
+
+# Modo relatório: quantidade de labirintos (sementes) por tamanho e de processos
+# usados para executá-los (None = um processo por núcleo)
+SEMENTES_RELATORIO = 5
+PROCESSOS_RELATORIO = None
+
+# Cache em disco das soluções (caminho, histórico e métricas por labirinto e algoritmo)
+DIRETORIO_CACHE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+TAMANHO_MAXIMO_CACHE = 256 * 1024 * 1024  # bytes
+
+# Tamanhos do labirinto personalizado (aba CUSTOM), em células, escolhidos pelo botão de
+# tamanho da aba (o primeiro é o inicial); labirintos que não cabem na tela são desenhados
+# por tiles de TAMANHO_TILE x TAMANHO_TILE pixels (em cada nível de detalhe), com no
+# máximo LIMITE_TILES tiles em memória
+TAMANHOS_PERSONALIZADOS = ((1000, 1000), (2000, 2000), (5000, 5000))
+TAMANHO_TILE = 256
+LIMITE_TILES = 256
+
+# Tempo (em segundos) que a interface espera por um labirinto que começou a ser gerado
+# antes de exibir o aviso de geração; ele continua sendo gerado em segundo plano
+ESPERA_LABIRINTO = 0.05
+
+# Reprodução animada da exploração: velocidades disponíveis (passos por segundo) e o
+# índice da velocidade inicial
+VELOCIDADES_REPRODUCAO = (250, 1500, 5000, 20000)
+VELOCIDADE_INICIAL = 1
+
+# Quantidade máxima de textos renderizados mantidos em cache pela interface
+LIMITE_TEXTOS = 512
+
+# Intervalo mínimo (em segundos) entre atualizações do progresso e do histórico parcial
+# de um solver executando em segundo plano
+INTERVALO_PROGRESSO = 0.1
@@ -0,0 +1,64 @@
+class DisjointSet:
+    """
+    Conjuntos disjuntos (union-find) sobre os inteiros 0..size-1.
+
+    Os representantes ficam em um array plano (parent[i]), com compressão de caminho em
+    find e união por rank, o que deixa cada operação em tempo praticamente constante.
+
+    Atributos:
+        parent (list): Pai de cada elemento; as raízes apontam para si mesmas.
+        rank (bytearray): Limite superior da altura da árvore de cada raiz.
+        count (int): Quantidade de conjuntos distintos.
+    """
+
+    def __init__(self, size):
+        """
+        Inicializa size conjuntos unitários.
+
+        Args:
+            size (int): Quantidade de elementos.
+        """
+        self.parent = list(range(size))
+        self.rank = bytearray(size)
+        self.count = size
+
+    def find(self, item):
+        """
+        Retorna o representante do conjunto de um elemento, comprimindo o caminho até ele.
+
+        Args:
+            item (int): Elemento.
+
+        Returns:
+            int: Raiz do conjunto.
+        """
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, a, b):
+        """
+        Une os conjuntos de dois elementos.
+
+        Args:
+            a (int): Primeiro elemento.
+            b (int): Segundo elemento.
+
+        Returns:
+            bool: True se os conjuntos eram distintos (e foram unidos), False caso contrário.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        rank = self.rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        self.count -= 1
+        return True
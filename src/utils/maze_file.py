@@ -0,0 +1,154 @@
+import mmap
+import struct
+import numpy as np
+from enums.generators import Generator
+from maze.maze import Maze
+
+# Cabeçalho dos arquivos de labirinto: identificador, versão, bits por célula (1 = só
+# paredes, compactado; 8 = um byte por célula, como Maze.cells), gerador (valor de
+# Generator, -1 se desconhecido), se há semente (0/1), semente, largura, altura, início
+# (x, y) e fim (x, y). Em seguida vêm as células em ordem de linhas (y * width + x).
+_MAGIC = b"MAZE"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBhB3xq6I")
+
+# Conversão dos dígitos da representação em texto para os valores das células (demais
+# bytes viram 255, rejeitado na leitura)
+_VALUES = bytes(b"0123".index(byte) if byte in b"0123" else 255 for byte in range(256))
+
+
+def write_header(out, width, height, start, end, generator=None, seed=None, packed=True):
+    """
+    Grava o cabeçalho de um arquivo de labirinto.
+
+    Usado por save_maze e, com packed=False, para gravar labirintos gerados linha a linha
+    (ver eller_generator.write_maze) logo após o cabeçalho, sem montá-los em memória.
+
+    Args:
+        out: Destino com método write(bytes), como um arquivo binário.
+        width (int): Largura do labirinto.
+        height (int): Altura do labirinto.
+        start (tuple): Posição inicial (x, y).
+        end (tuple): Posição final (x, y).
+        generator (Generator, opcional): Gerador usado.
+        seed (int, opcional): Semente usada.
+        packed (bool): Se True, as células seguem compactadas (1 bit por célula, 1 =
+            parede); se False, com um byte por célula.
+    """
+    out.write(_HEADER.pack(
+        _MAGIC, _VERSION, 1 if packed else 8,
+        generator.value if generator is not None else -1,
+        seed is not None, seed if seed is not None else 0,
+        width, height, *start, *end,
+    ))
+
+
+def save_maze(maze, path, packed=True):
+    """
+    Grava um labirinto em um arquivo binário.
+
+    Args:
+        maze (Maze): Labirinto a gravar.
+        path (str): Caminho do arquivo.
+        packed (bool): Se True (padrão), grava 1 bit por célula (só as paredes; início e
+            fim ficam no cabeçalho); se False, um byte por célula, que é carregado sem
+            cópia por load_maze.
+    """
+    generator = Generator.from_function(maze.generator) if maze.generator is not None else None
+    with open(path, "wb") as file:
+        write_header(file, maze.width, maze.height, maze.start, maze.end,
+                     generator, maze.seed, packed)
+        if packed:
+            walls = np.frombuffer(maze.cells, dtype=np.uint8) == 1
+            file.write(np.packbits(walls).tobytes())
+        else:
+            file.write(maze.cells)
+
+
+def load_maze(path):
+    """
+    Carrega um labirinto gravado por save_maze, mapeando o arquivo em memória (mmap).
+
+    Arquivos com um byte por célula viram as células do labirinto sem nenhuma cópia (o
+    mapeamento é copy-on-write: set_cell altera só a memória, nunca o arquivo); arquivos
+    compactados são expandidos de uma vez com o NumPy.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        Maze: Labirinto carregado, com generator e seed do cabeçalho (quando conhecidos).
+    """
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Arquivo de labirinto inválido: {path}")
+    (magic, version, bits, generator, has_seed, seed,
+     width, height, start_x, start_y, end_x, end_y) = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION or bits not in (1, 8):
+        raise ValueError(f"Arquivo de labirinto inválido: {path}")
+
+    if not (start_x < width and end_x < width and start_y < height and end_y < height):
+        raise ValueError(f"Arquivo de labirinto inválido (início ou fim fora do labirinto): {path}")
+
+    count = width * height
+    expected = (count + 7) // 8 if bits == 1 else count
+    if len(data) - _HEADER.size != expected:
+        raise ValueError(f"Arquivo de labirinto truncado: {path}")
+
+    if bits == 8:
+        cells = memoryview(data)[_HEADER.size:]
+    else:
+        packed = np.frombuffer(data, dtype=np.uint8, count=expected, offset=_HEADER.size)
+        cells = bytearray(np.unpackbits(packed, count=count))
+        del packed
+        data.close()
+        cells[start_y * width + start_x] = 2
+        cells[end_y * width + end_x] = 3
+
+    maze = Maze.from_buffer(width, height, cells, (start_x, start_y), (end_x, end_y))
+    if generator >= 0:
+        maze.generator = Generator(generator).get_function()
+    maze.seed = seed if has_seed else None
+    return maze
+
+
+def export_text(maze, path):
+    """
+    Grava o labirinto em texto, no formato de str(maze): uma linha por linha do labirinto,
+    com os valores das células (0 a 3) separados por espaço.
+
+    Args:
+        maze (Maze): Labirinto a gravar.
+        path (str): Caminho do arquivo.
+    """
+    with open(path, "wb") as file:
+        file.writelines(maze.text_lines())
+
+
+def import_text(path):
+    """
+    Carrega um labirinto em texto gravado por export_text (ou por str(maze)). Os espaços
+    entre os valores são opcionais.
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        Maze: Labirinto carregado.
+    """
+    with open(path, "rb") as file:
+        rows = file.read().replace(b" ", b"").split()
+
+    width, height = (len(rows[0]), len(rows)) if rows else (0, 0)
+    if width == 0 or any(len(row) != width for row in rows):
+        raise ValueError(f"Labirinto em texto inválido (linhas de tamanhos diferentes): {path}")
+
+    cells = bytearray(b"".join(rows).translate(_VALUES))
+    start, end = cells.find(2), cells.find(3)
+    if 255 in cells or start < 0 or end < 0:
+        raise ValueError(f"Labirinto em texto inválido (valores, início ou fim): {path}")
+
+    return Maze.from_buffer(width, height, cells,
+                            (start % width, start // width), (end % width, end // width))
@@ -0,0 +1,172 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from maze.maze import Maze
+
+
+class MazePrefetcher:
+    """
+    Gera labirintos em segundo plano, mantendo o próximo labirinto de cada tamanho pronto.
+
+    Só são preparados labirintos de tamanhos já usados: ao entregar um labirinto, o
+    próximo daquele tamanho é agendado, de modo que "gerar" (que descarta os labirintos
+    atuais) responda na hora para as abas já vistas, sem gastar tempo com as demais.
+    Cada labirinto preparado guarda as dimensões com que foi gerado, já que as da aba
+    CUSTOM podem mudar.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o gerador sem nenhum labirinto agendado.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Labirintos pedidos pela interface antes de estarem prontos, gerados fora da fila
+        # dos preparados (que pode estar ocupada com um labirinto grande de outro tamanho)
+        self._on_demand = ThreadPoolExecutor()
+        self._ready = {}
+
+    @staticmethod
+    def _build(dimensions):
+        """
+        Gera um labirinto com as dimensões informadas.
+        """
+        return Maze(*dimensions)
+
+    def take(self, size, timeout=None):
+        """
+        Entrega o labirinto preparado do tamanho informado e agenda o próximo.
+
+        Se a geração ainda não começou (outros tamanhos na frente), o labirinto é gerado à
+        parte: sem timeout, aqui mesmo; com timeout, em outra thread, esperando por ele no
+        máximo timeout segundos. Se já começou, espera que termine (ou, com timeout, apenas
+        verifica se terminou). Com timeout, um labirinto ainda não pronto continua sendo
+        gerado em segundo plano e é entregue em um pedido seguinte.
+
+        Args:
+            size (MazeSize): Tamanho desejado.
+            timeout (float, opcional): Espera máxima, em segundos, para não bloquear quem
+                chama.
+
+        Returns:
+            Maze | None: Labirinto gerado (None se, com timeout, ainda não estiver pronto).
+        """
+        dimensions = size.get_dimensions()
+        ready_dimensions, future = self._ready.pop(size, (None, None))
+        if future is not None and ready_dimensions != dimensions:
+            future.cancel()  # Preparado para dimensões que já não valem (aba CUSTOM)
+            future = None
+
+        if future is not None and future.cancel():
+            future = None  # Ainda na fila, atrás de outros tamanhos
+        if future is None and timeout is not None:
+            future = self._on_demand.submit(self._build, dimensions)
+            wait([future], timeout)
+
+        if future is None:
+            maze = self._build(dimensions)
+        elif timeout is not None and not future.done():
+            self._ready[size] = (dimensions, future)
+            return None
+        else:
+            maze = future.result()
+        self._ready[size] = (dimensions, self._executor.submit(self._build, dimensions))
+        return maze
+
+    def discard(self, size):
+        """
+        Descarta o labirinto preparado do tamanho informado, cancelando sua geração se
+        ainda não tiver começado.
+
+        Args:
+            size (MazeSize): Tamanho cujo labirinto preparado não será mais usado.
+        """
+        _, future = self._ready.pop(size, (None, None))
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self):
+        """
+        Cancela as gerações que ainda não começaram e libera as threads auxiliares.
+        """
+        for _, future in self._ready.values():
+            future.cancel()
+        self._ready.clear()
+        self._executor.shutdown(wait=False)
+        self._on_demand.shutdown(wait=False)
+
+
+class LazyMazes:
+    """
+    Labirintos de cada tamanho (MazeSize), gerados apenas no primeiro acesso.
+
+    Usado como o dicionário de labirintos retornado por generate_mazes: mazes[size]
+    devolve o labirinto do tamanho, gerando-o (ou pegando o já preparado pelo
+    MazePrefetcher) na primeira vez. A interface usa get(size, timeout), que não
+    bloqueia: um labirinto ainda não pronto é gerado em segundo plano.
+    """
+
+    def __init__(self, prefetcher=None):
+        """
+        Inicializa a coleção sem nenhum labirinto gerado.
+
+        Args:
+            prefetcher (MazePrefetcher, opcional): Fonte de labirintos já preparados; sem
+                ele, cada labirinto é gerado no próprio acesso.
+        """
+        self.prefetcher = prefetcher
+        self._mazes = {}
+
+    def __getitem__(self, size):
+        """
+        Retorna o labirinto do tamanho, gerando-o no primeiro acesso.
+
+        Args:
+            size (MazeSize): Tamanho desejado.
+
+        Returns:
+            Maze | dict: Labirinto do tamanho ({} para o modo de relatório, que não possui
+            labirinto).
+        """
+        if size.get_dimensions() is None:
+            return {}  # Modo de relatório não precisa de labirinto
+
+        maze = self._mazes.get(size)
+        if maze is None:
+            if self.prefetcher is not None:
+                maze = self.prefetcher.take(size)
+            else:
+                maze = Maze(*size.get_dimensions())
+            self._mazes[size] = maze
+        return maze
+
+    def get(self, size, timeout=0):
+        """
+        Retorna o labirinto do tamanho sem bloquear: enquanto ele é gerado em segundo plano
+        (pelo MazePrefetcher), retorna None.
+
+        Args:
+            size (MazeSize): Tamanho desejado.
+            timeout (float): Espera máxima, em segundos, quando a geração precisa começar
+                (evita exibir o aviso de geração para labirintos rápidos de gerar).
+
+        Returns:
+            Maze | dict | None: Labirinto do tamanho ({} para o modo de relatório), ou None
+            se ainda não estiver pronto.
+        """
+        if self.prefetcher is None or size.get_dimensions() is None or size in self._mazes:
+            return self[size]
+
+        maze = self.prefetcher.take(size, timeout)
+        if maze is not None:
+            self._mazes[size] = maze
+        return maze
+
+    def discard(self, size):
+        """
+        Descarta o labirinto do tamanho (e o preparado em segundo plano, se houver), para
+        que o próximo acesso gere outro; usado quando as dimensões da aba CUSTOM mudam.
+
+        Args:
+            size (MazeSize): Tamanho a descartar.
+        """
+        self._mazes.pop(size, None)
+        if self.prefetcher is not None:
+            self.prefetcher.discard(size)
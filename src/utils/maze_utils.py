@@ -1,58 +1,69 @@
 from enums.maze_size import MazeSize
-from maze.maze import Maze
+from utils.maze_prefetcher import LazyMazes
 from functools import wraps
+import random
 import time
+import tracemalloc
 
-def generate_mazes():
+# Quantidade de remoções da fronteira entre dois checkpoints de um solver (ver
+# SearchMetrics.checkpoint)
+CHECKPOINT_INTERVAL = 1024
+
+def generate_mazes(prefetcher=None):
     """
-    Gera labirintos para cada tamanho definido no enum MazeSize.
+    Prepara labirintos para cada tamanho definido no enum MazeSize. Cada labirinto só é
+    gerado no primeiro acesso (ver LazyMazes).
+
+    Args:
+        prefetcher (MazePrefetcher, opcional): Fonte de labirintos gerados em segundo plano.
 
     Retorna:
         tuple: Uma tupla contendo quatro dicionários:
-            - mazes: Labirintos gerados para cada tamanho.
+            - mazes: Labirintos de cada tamanho, gerados sob demanda.
             - solutions: Estrutura para armazenar soluções de cada labirinto.
             - visited_cells: Estrutura para armazenar células visitadas durante a solução.
             - statistics: Estatísticas coletadas durante a solução dos labirintos.
             - visited_history: Histórico de todas etapas da execução de um algoritmo.
             - sliders: Estrutura para armazenar a geração dos sliders para visualizar etapas.
     """
-    # Inicializa os labirintos para cada tamanho
-    mazes = {
-        MazeSize.SMALL: Maze(10, 10),
-        MazeSize.MEDIUM: Maze(50, 50),
-        MazeSize.LARGE: Maze(100, 100),
-        MazeSize.REPORT: {}  # Modo de relatório não precisa de labirinto
-    }
+    # Labirintos de cada tamanho, gerados no primeiro acesso (o modo de relatório não
+    # precisa de labirinto)
+    mazes = LazyMazes(prefetcher)
 
     # Inicializa as estruturas para soluções, células visitadas e estatísticas
     solutions = {
         MazeSize.SMALL: {},
         MazeSize.MEDIUM: {},
         MazeSize.LARGE: {},
+        MazeSize.CUSTOM: {},
     }
 
     visited_cells = {
         MazeSize.SMALL: {},
         MazeSize.MEDIUM: {},
-        MazeSize.LARGE: {}
+        MazeSize.LARGE: {},
+        MazeSize.CUSTOM: {}
     }
 
     statistics = {
         MazeSize.SMALL: {},
         MazeSize.MEDIUM: {},
-        MazeSize.LARGE: {}
+        MazeSize.LARGE: {},
+        MazeSize.CUSTOM: {}
     }
 
     visited_history = {
         MazeSize.SMALL: {},
         MazeSize.MEDIUM: {},
-        MazeSize.LARGE: {}
+        MazeSize.LARGE: {},
+        MazeSize.CUSTOM: {}
     }
 
     sliders = {
         MazeSize.SMALL: {},
         MazeSize.MEDIUM: {},
-        MazeSize.LARGE: {}
+        MazeSize.LARGE: {},
+        MazeSize.CUSTOM: {}
     }
 
     return mazes, solutions, visited_cells, statistics, visited_history, sliders
@@ -70,7 +81,46 @@ def is_valid_position(maze, x, y):
     Returns:
         bool: True se a posição é válida, False caso contrário.
     """
-    return 0 <= x < maze.width and 0 <= y < maze.height and maze.grid[y][x] != 1
+    return 0 <= x < maze.width and 0 <= y < maze.height and maze.cells[y * maze.width + x] != 1
+
+
+def reconstruct_path(previous, end):
+    """
+    Reconstrói o caminho a partir do mapa de predecessores.
+
+    Args:
+        previous (dict): Mapa de cada posição para a posição anterior no caminho
+            (a posição inicial aponta para None).
+        end (tuple): Posição final do caminho.
+
+    Returns:
+        list: Caminho do início até end como lista de coordenadas [(x1,y1), (x2,y2), ...].
+    """
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = previous[current]
+    path.reverse()
+    return path
+
+
+def resolve_rng(rng):
+    """
+    Retorna o gerador de números aleatórios usado por um gerador de labirintos.
+
+    Args:
+        rng (random.Random | int | None): Gerador a usar, semente para criar um novo
+            random.Random, ou None para usar o módulo random global.
+
+    Returns:
+        random.Random | module: Objeto com a interface de random.Random.
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return rng
 
 
 def set_start_end(width, height, grid):
@@ -80,7 +130,7 @@ def set_start_end(width, height, grid):
     Args:
         width (int): Largura do labirinto.
         height (int): Altura do labirinto.
-        grid (list): Grade do labirinto.
+        grid (bytearray): Células do labirinto em ordem de linhas (y * width + x).
 
     Returns:
         tuple: Posições de início e fim no formato ((x_inicio, y_inicio), (x_fim, y_fim)).
@@ -98,20 +148,20 @@ def _find_start_position(width, height, grid):
     Args:
         width (int): Largura do labirinto.
         height (int): Altura do labirinto.
-        grid (list): Grade do labirinto.
+        grid (bytearray): Células do labirinto em ordem de linhas (y * width + x).
 
     Returns:
         tuple: Posição de início no formato (x, y).
     """
     for y in range(min(3, height)):
         for x in range(min(3, width)):
-            if grid[y][x] == 0:
-                grid[y][x] = 2
+            if grid[y * width + x] == 0:
+                grid[y * width + x] = 2
                 return (x, y)
 
-    grid[0][0] = 2
+    grid[0] = 2
     if width > 1:
-        grid[0][1] = 0
+        grid[1] = 0
     return (0, 0)
 
 
@@ -122,23 +172,134 @@ def _find_end_position(width, height, grid):
     Args:
         width (int): Largura do labirinto.
         height (int): Altura do labirinto.
-        grid (list): Grade do labirinto.
+        grid (bytearray): Células do labirinto em ordem de linhas (y * width + x).
 
     Returns:
         tuple: Posição de fim no formato (x, y).
     """
     for y in range(height - 1, max(height - 4, 0), -1):
         for x in range(width - 1, max(width - 4, 0), -1):
-            if grid[y][x] == 0:
-                grid[y][x] = 3
+            if grid[y * width + x] == 0:
+                grid[y * width + x] = 3
                 return (x, y)
 
-    grid[height - 1][width - 1] = 3
+    grid[height * width - 1] = 3
     if width > 1 and height > 1:
-        grid[height - 1][width - 2] = 0
+        grid[height * width - 2] = 0
     return (width - 1, height - 1)
 
 
+class SolveCancelled(Exception):
+    """
+    Lançada dentro de um solver quando sua execução é cancelada (ver SearchMetrics.cancel).
+    """
+
+
+class SearchMetrics:
+    """
+    Métricas coletadas em uma execução de um solver.
+
+    Durante a execução, o solver publica seus contadores periodicamente (checkpoint) e
+    expõe o histórico que está montando (track), para que outra thread acompanhe o
+    progresso e possa cancelar a busca.
+
+    Atributos:
+        elapsed_ms (float): Tempo total da execução em milissegundos.
+        search_ms (float): Tempo gasto na busca (total menos history_ms, quando medido).
+        history_ms (float | None): Tempo gasto montando o histórico de visitas, medido apenas
+            pelos solvers que registram camadas inteiras (conversão das camadas). Nos que
+            visitam uma célula por passo, o histórico é só um append O(1) contado na busca,
+            e o valor fica None (não medido).
+        expanded (int): Quantidade de nós retirados da fronteira e expandidos.
+        pushes (int): Inserções na fila/heap de fronteira.
+        pops (int): Remoções da fila/heap de fronteira.
+        max_frontier (int): Maior tamanho alcançado pela fronteira.
+        peak_memory_kb (float | None): Pico de memória alocada (tracemalloc), se solicitado.
+    """
+
+    def __init__(self):
+        """
+        Inicializa as métricas zeradas.
+        """
+        self.elapsed_ms = 0.0
+        self.search_ms = 0.0
+        self.history_ms = None
+        self.expanded = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_frontier = 0
+        self.peak_memory_kb = None
+        self._history = None
+        self._cancelled = False
+
+    @property
+    def history(self):
+        """
+        Retorna o histórico de visitas em construção (None antes de o solver criá-lo).
+        """
+        return self._history
+
+    def track(self, history):
+        """
+        Expõe o histórico de visitas que o solver está montando.
+
+        Args:
+            history (VisitHistory): Histórico em construção.
+        """
+        self._history = history
+
+    def cancel(self):
+        """
+        Pede o cancelamento da execução; o solver o atende no próximo checkpoint.
+        """
+        self._cancelled = True
+
+    def checkpoint(self, expanded, pushes, pops, max_frontier):
+        """
+        Publica os contadores parciais da busca e atende um pedido de cancelamento.
+
+        Args:
+            expanded (int): Nós expandidos até agora.
+            pushes (int): Inserções na fronteira até agora.
+            pops (int): Remoções da fronteira até agora.
+            max_frontier (int): Maior tamanho da fronteira até agora.
+
+        Returns:
+            int: Quantidade de remoções em que o próximo checkpoint deve ocorrer.
+
+        Raises:
+            SolveCancelled: Se o cancelamento foi pedido.
+        """
+        self.record(expanded, pushes, pops, max_frontier)
+        if self._cancelled:
+            raise SolveCancelled()
+        return pops + CHECKPOINT_INTERVAL
+
+    def record(self, expanded, pushes, pops, max_frontier):
+        """
+        Registra os contadores da busca, acumulados pelo solver em variáveis locais.
+
+        Args:
+            expanded (int): Nós expandidos.
+            pushes (int): Inserções na fronteira.
+            pops (int): Remoções da fronteira.
+            max_frontier (int): Maior tamanho da fronteira.
+        """
+        self.expanded = expanded
+        self.pushes = pushes
+        self.pops = pops
+        self.max_frontier = max_frontier
+
+    def as_dict(self):
+        """
+        Retorna as métricas como dicionário (usado nas estatísticas e no benchmark).
+
+        Returns:
+            dict: Métricas indexadas pelo nome do atributo.
+        """
+        return {name: value for name, value in vars(self).items() if not name.startswith("_")}
+
+
 class Benchmark:
     """
     Classe utilitária para medição de tempo de execução.
@@ -146,24 +307,48 @@ class Benchmark:
     @staticmethod
     def measure(func):
         """
-        Decorador que mede o tempo de execução em milissegundos.
+        Decorador que mede a execução de um solver.
+
+        O solver decorado recebe um SearchMetrics no argumento nomeado metrics, onde registra
+        seus contadores e o tempo gasto com histórico. Passe trace_memory=True na chamada para
+        medir também o pico de memória com tracemalloc (deixa a execução mais lenta) e
+        metrics=SearchMetrics() para acompanhar ou cancelar a execução de outra thread.
+        Se o tracemalloc já estiver ativo, ele é reaproveitado (o pico é medido a partir do
+        início da execução) e continua ativo ao final; só é parado se foi iniciado aqui.
         
         Args:
             func (callable): Função a ser decorada
             
         Returns:
-            tuple: Resultado original da função + tempo em ms (como último elemento)
+            tuple: Resultado original da função + SearchMetrics (como último elemento)
         """
         @wraps(func)
-        def timed(*args, **kwargs):
-            start = time.perf_counter_ns()
-            result = func(*args, **kwargs)
-            end = time.perf_counter_ns()
+        def timed(*args, trace_memory=False, metrics=None, **kwargs):
+            metrics = metrics if metrics is not None else SearchMetrics()
+            started_tracing = trace_memory and not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            if trace_memory:
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+
+            try:
+                start = time.perf_counter_ns()
+                result = func(*args, metrics=metrics, **kwargs)
+                end = time.perf_counter_ns()
+
+                if trace_memory:
+                    _, peak = tracemalloc.get_traced_memory()
+                    metrics.peak_memory_kb = (peak - baseline) / 1024
+            finally:
+                if started_tracing:
+                    tracemalloc.stop()
             
-            elapsed_ms = (end - start) / 1_000_000  # Converte para milissegundos
+            metrics.elapsed_ms = (end - start) / 1_000_000  # Converte para milissegundos
+            metrics.search_ms = metrics.elapsed_ms - (metrics.history_ms or 0.0)
             
             if isinstance(result, tuple):
-                return (*result, elapsed_ms)
-            return (result, elapsed_ms)
+                return (*result, metrics)
+            return (result, metrics)
             
-        return timed
\ No newline at end of file
+        return timed
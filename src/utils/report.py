@@ -0,0 +1,157 @@
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from maze.maze import Maze
+
+
+def solve_report_job(algorithm, width, height, cells, start, end):
+    """
+    Executa um algoritmo sobre um labirinto em um processo do pool.
+
+    O labirinto chega como um único buffer de bytes (células em ordem de linhas) e é
+    reconstruído com Maze.from_buffer; apenas o resumo da execução volta ao processo
+    principal (sem caminho nem histórico).
+
+    Args:
+        algorithm (Algorithm): Algoritmo executado.
+        width (int): Largura do labirinto.
+        height (int): Altura do labirinto.
+        cells (bytes): Células do labirinto.
+        start (tuple): Posição inicial (x, y).
+        end (tuple): Posição final (x, y).
+
+    Returns:
+        dict: Tempo, contadores da busca, células visitadas e tamanho do caminho.
+    """
+    from benchmark import benchmark_maze
+
+    maze = Maze.from_buffer(width, height, cells, start, end)
+    return benchmark_maze(maze, algorithm, warmup=0, repeat=1)
+
+
+class ReportRunner:
+    """
+    Executa todos os algoritmos em todos os tamanhos (e várias sementes) em paralelo,
+    em um ProcessPoolExecutor, entregando os resultados à medida que terminam.
+
+    A geração dos labirintos acontece no processo principal, um labirinto por chamada de
+    poll(), para que o loop de renderização não fique parado esperando todos serem gerados.
+
+    Atributos:
+        sizes (list): Tamanhos (MazeSize) incluídos no relatório.
+        algorithms (list): Algoritmos (Algorithm) executados.
+        seeds (list): Sementes usadas para gerar os labirintos de cada tamanho.
+        results (list): Resultados recebidos, um dict por execução.
+        total (int): Quantidade total de execuções agendadas.
+    """
+
+    def __init__(self, sizes, algorithms, seeds, max_workers=None):
+        """
+        Inicializa o executor e a fila de labirintos a gerar.
+
+        Args:
+            sizes (list): Tamanhos (MazeSize) incluídos no relatório.
+            algorithms (list): Algoritmos (Algorithm) executados.
+            seeds (list): Sementes usadas para cada tamanho.
+            max_workers (int, opcional): Quantidade de processos (padrão: núcleos da máquina).
+        """
+        self.sizes = sizes
+        self.algorithms = algorithms
+        self.seeds = seeds
+        self.results = []
+        self.total = len(sizes) * len(seeds) * len(algorithms)
+        self._pending = [(size, seed) for size in sizes for seed in seeds]
+        self._finished = queue.Queue()
+        # spawn evita duplicar o estado do SDL/pygame do processo principal nos filhos
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    @property
+    def done(self):
+        """
+        Indica se todas as execuções agendadas já terminaram.
+        """
+        return len(self.results) == self.total
+
+    def poll(self):
+        """
+        Avança o relatório sem bloquear: gera e submete o próximo labirinto pendente e
+        recolhe os resultados que já terminaram. Deve ser chamado a cada quadro.
+
+        Returns:
+            bool: True se algum resultado novo foi recebido.
+        """
+        if self._pending:
+            size, seed = self._pending.pop(0)
+            self._submit(size, seed)
+
+        received = False
+        while True:
+            try:
+                self.results.append(self._finished.get_nowait())
+            except queue.Empty:
+                return received
+            received = True
+
+    def _submit(self, size, seed):
+        """
+        Gera o labirinto de um tamanho e semente e submete um job por algoritmo.
+        """
+        width, height = size.get_dimensions()
+        maze = Maze(width, height, seed=seed)
+        cells = bytes(maze.cells)
+
+        for algorithm in self.algorithms:
+            future = self._executor.submit(
+                solve_report_job, algorithm, width, height, cells, maze.start, maze.end
+            )
+            future.add_done_callback(
+                lambda f, size=size, seed=seed, algorithm=algorithm:
+                    self._on_finished(f, size, seed, algorithm)
+            )
+
+    def _on_finished(self, future, size, seed, algorithm):
+        """
+        Callback executado (em uma thread do executor) quando um job termina.
+        """
+        if future.cancelled():
+            return
+        result = {"size": size, "seed": seed, "algorithm": algorithm}
+        if future.exception() is not None:
+            result["error"] = str(future.exception())
+        else:
+            result.update(future.result())
+        self._finished.put(result)
+
+    def summary(self):
+        """
+        Agrega os resultados recebidos por tamanho e algoritmo (média entre as sementes).
+
+        Returns:
+            dict: Mapeia (MazeSize, Algorithm) para um dict com runs, time_ms,
+            visited_count e path_length.
+        """
+        summary = {}
+        for result in self.results:
+            if "error" in result:
+                continue
+            entry = summary.setdefault((result["size"], result["algorithm"]), {
+                "runs": 0, "time_ms": 0.0, "visited_count": 0.0, "path_length": 0.0
+            })
+            entry["runs"] += 1
+            entry["time_ms"] += result["median_ms"]
+            entry["visited_count"] += result["visited_count"]
+            entry["path_length"] += result["path_length"]
+
+        for entry in summary.values():
+            for key in ("time_ms", "visited_count", "path_length"):
+                entry[key] /= entry["runs"]
+        return summary
+
+    def shutdown(self):
+        """
+        Encerra o pool, cancelando o que ainda não começou a executar.
+        """
+        self._pending.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
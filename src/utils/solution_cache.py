@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import struct
+from array import array
+from maze.solvers.solver_registry import get_solver_version
+from utils.maze_utils import SearchMetrics
+from utils.visit_history import VisitHistory
+
+# Cabeçalho dos arquivos de solução: identificador, versão, histórico por camadas (0/1),
+# células visitadas no passo 0 e tamanhos do caminho, da ordem de visita, dos marcadores
+# e do bloco de métricas (JSON). Em seguida vêm os vetores de índices planos (y * width + x)
+# em array('I') no formato nativo da máquina e, por fim, as métricas.
+_MAGIC = b"MZSC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBIIIII")
+
+
+def maze_fingerprint(maze):
+    """
+    Calcula a impressão digital do conteúdo de um labirinto.
+
+    Dois labirintos com as mesmas dimensões, células, início e fim têm a mesma impressão
+    digital, independentemente de como (ou quando) foram gerados.
+
+    Args:
+        maze (Maze): Labirinto a identificar.
+
+    Returns:
+        str: Hash hexadecimal (blake2b de 128 bits) do labirinto.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack("<6I", maze.width, maze.height, *maze.start, *maze.end))
+    digest.update(maze.cells)
+    return digest.hexdigest()
+
+
+class SolutionCache:
+    """
+    Cache em disco das soluções, indexado pela impressão digital do labirinto e pelo algoritmo.
+
+    Cada entrada é um arquivo binário compacto com o caminho, o histórico de visitas e as
+    métricas da execução original; o conjunto de visitados é reconstruído a partir do
+    histórico. O tamanho total do diretório é limitado: ao ultrapassar o limite, os arquivos
+    usados há mais tempo (pela data de modificação, atualizada a cada leitura) são removidos.
+
+    Atributos:
+        directory (str): Diretório onde os arquivos do cache são gravados.
+        max_bytes (int): Tamanho máximo do cache em bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        """
+        Inicializa o cache, criando o diretório se necessário.
+
+        Args:
+            directory (str): Diretório do cache.
+            max_bytes (int): Tamanho máximo do cache em bytes.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, maze, name, extension):
+        """
+        Retorna o caminho do arquivo de uma entrada do labirinto.
+        """
+        return os.path.join(self.directory, f"{maze_fingerprint(maze)}_{name}.{extension}")
+
+    def _solution_path(self, maze, algorithm):
+        """
+        Retorna o caminho do arquivo da solução de um algoritmo; a versão do solver faz
+        parte do nome, de modo que soluções de versões anteriores nunca são lidas.
+        """
+        return self._path(maze, f"{algorithm.name}-{get_solver_version(algorithm)}", "bin")
+
+    @staticmethod
+    def _discard(path):
+        """
+        Remove uma entrada inválida (truncada, corrompida ou de outro formato).
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def load(self, algorithm, maze):
+        """
+        Lê a solução de um algoritmo para o labirinto, se estiver no cache.
+
+        Args:
+            algorithm (Algorithm): Algoritmo consultado.
+            maze (Maze): Labirinto consultado.
+
+        Returns:
+            tuple | None: (path, visited, history, metrics) ou None se não houver entrada válida.
+            Entradas inválidas são removidas do cache.
+        """
+        path = self._solution_path(maze, algorithm)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            magic, version, layered, initial, path_len, order_len, marks_len, metrics_len = \
+                _HEADER.unpack_from(data)
+            itemsize = array("I").itemsize
+            size = _HEADER.size + (path_len + order_len + marks_len) * itemsize + metrics_len
+            if magic != _MAGIC or version != _VERSION or size != len(data):
+                raise ValueError("Entrada do cache inválida.")
+
+            offset = _HEADER.size
+            vectors = []
+            for length in (path_len, order_len, marks_len):
+                vector = array("I")
+                vector.frombytes(data[offset:offset + length * itemsize])
+                vectors.append(vector)
+                offset += length * itemsize
+            path_cells, order_cells, marks = vectors
+
+            fields = json.loads(data[offset:offset + metrics_len])
+            if not isinstance(fields, dict):
+                raise ValueError("Métricas do cache inválidas.")
+        except (struct.error, ValueError):
+            self._discard(path)
+            return None
+
+        metrics = SearchMetrics()
+        for key, value in fields.items():
+            setattr(metrics, key, value)
+
+        width = maze.width
+        solution = [(index % width, index // width) for index in path_cells]
+        order = [(index % width, index // width) for index in order_cells]
+        history = VisitHistory(order, initial, marks if layered else None)
+
+        os.utime(path)  # Marca a entrada como usada recentemente
+        return solution, set(order), history, metrics
+
+    def store(self, algorithm, maze, result):
+        """
+        Grava a solução de um algoritmo para o labirinto e aplica o limite de tamanho.
+
+        Args:
+            algorithm (Algorithm): Algoritmo executado.
+            maze (Maze): Labirinto resolvido.
+            result (tuple): (path, visited, history, metrics) retornado pelo solver.
+        """
+        solution, _, history, metrics = result
+        width = maze.width
+        path_cells = array("I", (y * width + x for x, y in solution))
+        order_cells = array("I", (y * width + x for x, y in history.order))
+        marks = history.marks if history.marks is not None else array("I")
+        metrics_data = json.dumps(metrics.as_dict()).encode("utf-8")
+
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, history.marks is not None, history.initial,
+            len(path_cells), len(order_cells), len(marks), len(metrics_data)
+        )
+        self._write(self._solution_path(maze, algorithm),
+                    header + path_cells.tobytes() + order_cells.tobytes() + marks.tobytes() + metrics_data)
+
+    def load_summary(self, maze, key):
+        """
+        Lê um resumo (dict) associado ao labirinto, como os resultados agregados do benchmark.
+
+        Args:
+            maze (Maze): Labirinto consultado.
+            key (str): Identificador do resumo (algoritmo e parâmetros da execução).
+
+        Returns:
+            dict | None: Resumo gravado ou None se não estiver no cache. Entradas inválidas
+            são removidas do cache.
+        """
+        path = self._path(maze, key, "json")
+        try:
+            with open(path, encoding="utf-8") as file:
+                summary = json.load(file)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            self._discard(path)
+            return None
+        if not isinstance(summary, dict):
+            self._discard(path)
+            return None
+        os.utime(path)
+        return summary
+
+    def store_summary(self, maze, key, summary):
+        """
+        Grava um resumo (dict) associado ao labirinto.
+
+        Args:
+            maze (Maze): Labirinto ao qual o resumo se refere.
+            key (str): Identificador do resumo.
+            summary (dict): Dados serializáveis em JSON.
+        """
+        self._write(self._path(maze, key, "json"), json.dumps(summary).encode("utf-8"))
+
+    def _write(self, path, data):
+        """
+        Grava um arquivo de forma atômica (arquivo temporário + rename) e aplica o limite.
+        """
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+        self._evict()
+
+    def _evict(self):
+        """
+        Remove as entradas usadas há mais tempo até o cache caber em max_bytes.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
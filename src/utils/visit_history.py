@@ -0,0 +1,115 @@
+from array import array
+
+
+class VisitHistory:
+    """
+    Histórico compacto da exploração de um algoritmo.
+
+    Em vez de guardar uma cópia do conjunto de visitados a cada passo, guarda a
+    ordem de visita uma única vez e marcadores leves indicando quantas células
+    já tinham sido visitadas em cada passo.
+
+    Atributos:
+        order (list): Células na ordem em que foram visitadas.
+        initial (int): Quantidade de células já visitadas no passo 0.
+        marks (array | None): Quantidade acumulada de células em cada passo. Quando
+            None, cada passo acrescenta exatamente uma célula ao passo anterior.
+    """
+
+    def __init__(self, order=None, initial=1, marks=None):
+        """
+        Inicializa o histórico.
+
+        Args:
+            order (list): Lista com a ordem de visita (pode continuar crescendo).
+            initial (int): Quantidade de células visitadas no passo 0.
+            marks (iterable, opcional): Quantidade acumulada de células por passo.
+        """
+        self.order = order if order is not None else []
+        self.initial = initial
+        self.marks = array('I', marks) if marks is not None else None
+
+    def add(self, cell):
+        """
+        Registra a visita de uma célula como um novo passo.
+
+        Args:
+            cell (tuple): Posição (x, y) visitada.
+        """
+        self.order.append(cell)
+        if self.marks is not None:
+            self.marks.append(len(self.order))
+
+    def add_layer(self, cells):
+        """
+        Registra várias células visitadas em um único passo.
+
+        Args:
+            cells (iterable): Posições (x, y) visitadas no passo.
+        """
+        if self.marks is None:
+            self.marks = array('I', range(self.initial, len(self.order) + 1))
+        self.order.extend(cells)
+        self.marks.append(len(self.order))
+
+    def __len__(self):
+        """
+        Retorna o número de passos registrados.
+        """
+        if self.marks is not None:
+            return len(self.marks)
+        return len(self.order) - self.initial + 1
+
+    def __getitem__(self, step):
+        """
+        Retorna as células visitadas até o passo informado.
+        """
+        return self.visited_at(step)
+
+    def count_at(self, step):
+        """
+        Retorna quantas entradas da ordem de visita pertencem ao passo informado.
+
+        Args:
+            step (int): Passo consultado (aceita índices negativos).
+
+        Returns:
+            int: Quantidade de células visitadas até o passo.
+        """
+        total = len(self)
+        if step < 0:
+            step += total
+        if not 0 <= step < total:
+            raise IndexError("Passo fora dos limites do histórico.")
+        if self.marks is not None:
+            return self.marks[step]
+        return self.initial + step
+
+    def visited_at(self, step):
+        """
+        Retorna as células visitadas até o passo informado.
+
+        Args:
+            step (int): Passo consultado.
+
+        Returns:
+            list: Células visitadas até o passo, na ordem de visita.
+        """
+        return self.order[:self.count_at(step)]
+
+    def delta(self, from_step, to_step):
+        """
+        Retorna as células visitadas entre dois passos.
+
+        Args:
+            from_step (int): Passo de origem.
+            to_step (int): Passo de destino.
+
+        Returns:
+            list: Células visitadas depois de from_step e até to_step
+            (ou entre to_step e from_step, caso o destino seja anterior).
+        """
+        start, end = self.count_at(from_step), self.count_at(to_step)
+        if start > end:
+            start, end = end, start
+        return self.order[start:end]